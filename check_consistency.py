@@ -1,17 +1,39 @@
 #!/usr/bin/env python3
-"""Consistency checker for the ARC-AGI-2 task bundle layout."""
+"""Consistency checker for the ARC-AGI-2 task bundle layout.
+
+With ``--manifest`` the checker keeps a JSON manifest of per-file size,
+mtime, and SHA-256 plus the derived per-bundle facts.  Files whose size and
+mtime are unchanged are not re-read, and only bundles whose file hashes
+changed are re-inspected.  Other tools can use :class:`Manifest` as a cheap
+change-detection index.  ``--json`` writes a machine-readable report.
+
+Solvers are classified by a structural fingerprint of their exported
+``solve_<id>``: the AST with docstrings and annotations dropped, local names
+replaced by positional placeholders, pass-through wrappers followed,
+module-level constants it reads replaced by their values, and the
+module-level helpers it reaches appended in call order.  Identity baselines
+are the solvers whose fingerprint matches one of ``IDENTITY_FORMS``, however
+they are spelled; solvers sharing a fingerprint are reported as duplicates.
+Fingerprints are cached in the manifest with the other bundle facts.
+"""
 from __future__ import annotations
 
 import argparse
+import ast
+import hashlib
+import json
 import re
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 TASKS_DIR = Path("tasks")
 README_PATH = Path("README.md")
 CHANGELOG_PATH = Path("CHANGELOG.md")
+MANIFEST_PATH = Path(".cache/consistency_manifest.json")
+MANIFEST_VERSION = 3
+BUNDLE_FILES = ("solution.py", "abstractions.py", "abstractions.md")
 
 @dataclass
 class TaskInfo:
@@ -21,41 +43,281 @@ class TaskInfo:
     has_abs_py: bool
     has_abs_md: bool
     is_identity: bool
+    fingerprint: Optional[str] = None
 
-IDENTITY_SNIPPET = "return [row[:] for row in grid]"
+# Bodies an identity baseline may reduce to (after following wrappers).
+IDENTITY_FORMS = (
+    "def solve_(grid):\n    return grid\n",
+    "def solve_(grid):\n    return [row[:] for row in grid]\n",
+    "def solve_(grid):\n    return [list(row) for row in grid]\n",
+)
 
 
-def detect_identity_solver(path: Path) -> bool:
+class Manifest:
+    """Per-file ``(size, mtime_ns, sha256)`` index with cached bundle facts."""
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = path
+        data: Dict[str, Any] = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                data = {}
+        if data.get("version") != MANIFEST_VERSION:
+            data = {}
+        self._files: Dict[str, Dict[str, Any]] = data.get("files", {})
+        self.bundles: Dict[str, Dict[str, Any]] = data.get("bundles", {})
+        self.documentation: Dict[str, Any] = data.get("documentation", {})
+        self._seen: Dict[str, Dict[str, Any]] = {}
+        self.rechecked: List[str] = []
+
+    def digest(self, path: Path) -> Optional[str]:
+        """SHA-256 of ``path`` (None if missing); re-read only when size or mtime moved."""
+        key = path.as_posix()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        entry = self._files.get(key)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            sha = hashlib.sha256(path.read_bytes()).hexdigest()
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+        self._seen[key] = entry
+        return entry["sha256"]
+
+    def save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": dict(sorted(self._seen.items())),
+            "bundles": dict(sorted(self.bundles.items())),
+            "documentation": self.documentation,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=1) + "\n", encoding="utf-8")
+
+
+FunctionNode = ast.FunctionDef
+
+
+def _body(node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[ast.stmt]:
+    """Function body without its docstring."""
+    body = node.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        return body[1:]
+    return body
+
+
+def _forwarded(node: FunctionNode, functions: Dict[str, FunctionNode]) -> FunctionNode:
+    """Follow ``return helper(<own params>)`` wrappers to the function doing the work."""
+    seen: Set[str] = set()
+    while node.name not in seen:
+        seen.add(node.name)
+        body = _body(node)
+        if len(body) != 1 or not isinstance(body[0], ast.Return) or not isinstance(body[0].value, ast.Call):
+            break
+        call = body[0].value
+        params = [arg.arg for arg in node.args.args]
+        if not isinstance(call.func, ast.Name) or call.func.id not in functions or call.keywords:
+            break
+        if [arg.id if isinstance(arg, ast.Name) else None for arg in call.args] != params:
+            break
+        node = functions[call.func.id]
+    return node
+
+
+def _bound_names(node: ast.AST) -> Dict[str, str]:
+    """Locally bound names mapped to placeholders, numbered in ``ast.walk`` order."""
+    names: Dict[str, str] = {}
+    for child in ast.walk(node):
+        if isinstance(child, ast.arg):
+            name = child.arg
+        elif isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+            name = child.id
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and child is not node:
+            name = child.name
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            name = child.name
+        else:
+            continue
+        names.setdefault(name, f"_v{len(names)}")
+    return names
+
+
+def _dump(node: Any, root: ast.AST, names: Dict[str, str], helper: Callable[[str], Optional[str]]) -> str:
+    """``ast.dump``-like rendering without docstrings or annotations and with renamed names."""
+    if isinstance(node, list):
+        return "[" + ",".join(filter(None, (_dump(item, root, names, helper) for item in node))) + "]"
+    if not isinstance(node, ast.AST):
+        return repr(node)
+    if isinstance(node, ast.AnnAssign):
+        if node.value is None:
+            return ""
+        node = ast.Assign(targets=[node.target], value=node.value)
+    fields: List[str] = []
+    for field, value in ast.iter_fields(node):
+        if field in ("annotation", "returns", "type_comment"):
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if field == "name":
+                value = "_" if node is root else names[value]
+            elif field == "body":
+                value = _body(node)
+        elif isinstance(node, ast.arg) and field == "arg":
+            value = names[value]
+        elif isinstance(node, ast.ExceptHandler) and field == "name" and value:
+            value = names[value]
+        elif isinstance(node, ast.Name) and field == "id":
+            value = names.get(value) or helper(value) or value
+        fields.append(_dump(value, root, names, helper))
+    return f"{type(node).__name__}({','.join(fields)})"
+
+
+def function_fingerprint(
+    name: str,
+    functions: Dict[str, FunctionNode],
+    constants: Optional[Dict[str, ast.expr]] = None,
+) -> str:
+    """Structural SHA-256 of module function ``name`` and the module helpers it reaches.
+
+    Docstrings and annotations are ignored, locally bound names become
+    positional placeholders, and ``return helper(<own params>)`` wrappers are
+    followed, so copies of a helper under different names or spellings of
+    their locals hash alike.  Module-level constants from ``constants`` that
+    the functions read are replaced by their (rendered) values, so helpers
+    differing only in a table or threshold hash apart.  The parsed nodes are
+    not modified.
+    """
+    constants = constants or {}
+    targets: Dict[str, str] = {}
+
+    def target(fn: str) -> str:
+        if fn not in targets:
+            targets[fn] = _forwarded(functions[fn], functions).name
+        return targets[fn]
+
+    queue = [functions[target(name)]]
+    placeholders = {queue[0].name: "_f0"}
+    values: Dict[str, str] = {}
+
+    def helper(fn: str) -> Optional[str]:
+        if fn in functions:
+            resolved = target(fn)
+            if resolved not in placeholders:
+                placeholders[resolved] = f"_f{len(placeholders)}"
+                queue.append(functions[resolved])
+            return placeholders[resolved]
+        if fn in constants:
+            if fn not in values:
+                values[fn] = fn  # a self-referencing value renders the bare name
+                value = constants[fn]
+                values[fn] = "=" + _dump(value, value, _bound_names(value), helper)
+            return values[fn]
+        return None
+
+    dumps: List[str] = []
+    for node in queue:  # grows while helpers are discovered
+        dumps.append(_dump(node, node, _bound_names(node), helper))
+    return hashlib.sha256("\n".join(dumps).encode()).hexdigest()
+
+
+def module_definitions(source: str) -> Tuple[Dict[str, FunctionNode], Dict[str, ast.expr]]:
+    """Top-level function definitions and constant values (last assignment wins), by name."""
+    functions: Dict[str, FunctionNode] = {}
+    constants: Dict[str, ast.expr] = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef):
+            functions[node.name] = node
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None and isinstance(node.target, ast.Name):
+            constants[node.target.id] = node.value
+    return functions, constants
+
+
+def solver_fingerprint(source: str, task_id: str) -> Optional[str]:
+    """:func:`function_fingerprint` of ``solve_<task_id>`` (None if the module lacks it)."""
+    functions, constants = module_definitions(source)
+    if f"solve_{task_id}" not in functions:
+        return None
+    return function_fingerprint(f"solve_{task_id}", functions, constants)
+
+
+IDENTITY_FINGERPRINTS = frozenset(solver_fingerprint(form, "") for form in IDENTITY_FORMS)
+
+
+def _solver_facts(path: Path) -> Tuple[Optional[str], bool]:
+    """``(fingerprint, is_identity)`` from a single parse of ``path``."""
     if not path.exists():
-        return False
-    content = path.read_text(encoding="utf-8")
-    return IDENTITY_SNIPPET in content and content.count("\n") < 40
+        return None, False
+    try:
+        fingerprint = solver_fingerprint(path.read_text(encoding="utf-8"), path.parent.name)
+    except SyntaxError:
+        return None, False
+    return fingerprint, fingerprint in IDENTITY_FINGERPRINTS
+
 
+def detect_identity_solver(path: Path) -> bool:
+    return _solver_facts(path)[1]
 
-def gather_task_info(root: Path) -> Dict[str, TaskInfo]:
+
+def duplicate_solvers(infos: Dict[str, TaskInfo]) -> List[List[str]]:
+    """Groups of non-identity solvers with the same fingerprint."""
+    groups: Dict[str, List[str]] = {}
+    for tid, info in sorted(infos.items()):
+        if info.fingerprint is not None and not info.is_identity:
+            groups.setdefault(info.fingerprint, []).append(tid)
+    return sorted(group for group in groups.values() if len(group) > 1)
+
+
+def gather_task_info(root: Path, manifest: Optional[Manifest] = None) -> Dict[str, TaskInfo]:
     infos: Dict[str, TaskInfo] = {}
+    bundles: Dict[str, Dict[str, Any]] = {}
     for bundle_dir in sorted(p for p in root.iterdir() if p.is_dir()):
         task_id = bundle_dir.name
+        if manifest is not None:
+            hashes = {name: manifest.digest(bundle_dir / name) for name in BUNDLE_FILES}
+            cached = manifest.bundles.get(task_id)
+            if cached is not None and cached["files"] == hashes:
+                infos[task_id] = TaskInfo(task_id=task_id, bundle_dir=bundle_dir, **cached["info"])
+                bundles[task_id] = cached
+                continue
+            manifest.rechecked.append(task_id)
         solver = bundle_dir / "solution.py"
         abs_py = bundle_dir / "abstractions.py"
         abs_md = bundle_dir / "abstractions.md"
+        fingerprint, is_identity = _solver_facts(solver)
         infos[task_id] = TaskInfo(
             task_id=task_id,
             bundle_dir=bundle_dir,
             has_solver=solver.exists(),
             has_abs_py=abs_py.exists(),
             has_abs_md=abs_md.exists(),
-            is_identity=detect_identity_solver(solver),
+            is_identity=is_identity,
+            fingerprint=fingerprint,
         )
+        if manifest is not None:
+            info = asdict(infos[task_id])
+            del info["task_id"], info["bundle_dir"]
+            bundles[task_id] = {"files": hashes, "info": info}
+    if manifest is not None:
+        manifest.bundles = bundles
     return infos
 
 
-def check_bundles(verbose: bool = False) -> bool:
+def check_bundles(
+    verbose: bool = False,
+    manifest: Optional[Manifest] = None,
+    report: Optional[Dict[str, Any]] = None,
+) -> bool:
     if not TASKS_DIR.exists():
         print("❌ tasks/ directory not found")
         return False
 
-    infos = gather_task_info(TASKS_DIR)
+    infos = gather_task_info(TASKS_DIR, manifest)
     if not infos:
         print("❌ No task bundles found under tasks/")
         return False
@@ -64,11 +326,14 @@ def check_bundles(verbose: bool = False) -> bool:
     missing_solver = [tid for tid, info in infos.items() if not info.has_solver]
     missing_abs_py = [tid for tid, info in infos.items() if not info.is_identity and not info.has_abs_py]
     missing_abs_md = [tid for tid, info in infos.items() if not info.is_identity and not info.has_abs_md]
+    duplicates = duplicate_solvers(infos)
 
     print("🔍 Bundle summary")
     print(f"   Total bundles        : {len(infos)}")
     print(f"   Identity baselines   : {len(identity)}")
     print(f"   Full abstractions    : {len(infos) - len(identity)}")
+    if manifest is not None:
+        print(f"   Re-checked (changed) : {len(manifest.rechecked)}")
     print()
 
     ok = True
@@ -92,6 +357,12 @@ def check_bundles(verbose: bool = False) -> bool:
                 print(f"   - {tid}")
             print()
 
+    if duplicates:
+        print(f"⚠️ Structurally identical solvers ({len(duplicates)} groups):")
+        for group in duplicates:
+            print(f"   - {', '.join(group)}")
+        print()
+
     if verbose:
         for tid in sorted(infos):
             info = infos[tid]
@@ -104,6 +375,22 @@ def check_bundles(verbose: bool = False) -> bool:
             print(f"   • {tid}: {', '.join(status)}")
         print()
 
+    if report is not None:
+        report["bundles"] = {
+            tid: {k: v for k, v in asdict(info).items() if k not in ("task_id", "bundle_dir")}
+            for tid, info in infos.items()
+        }
+        report["missing"] = {
+            "solution.py": sorted(missing_solver),
+            "abstractions.py": sorted(missing_abs_py),
+            "abstractions.md": sorted(missing_abs_md),
+        }
+        report["identity"] = sorted(identity)
+        report["duplicates"] = duplicates
+        if manifest is not None:
+            report["rechecked"] = manifest.rechecked
+        report["bundles_ok"] = ok
+
     if ok:
         print("✅ Bundle layout looks good\n")
     else:
@@ -111,34 +398,59 @@ def check_bundles(verbose: bool = False) -> bool:
     return ok
 
 
-def check_documentation(task_count: int) -> bool:
+def _documentation_findings(task_count: int) -> Tuple[bool, List[str]]:
     ok = True
+    lines: List[str] = []
     if not README_PATH.exists():
-        print("❌ README.md missing")
-        return False
+        return False, ["❌ README.md missing"]
 
     readme = README_PATH.read_text(encoding="utf-8")
     count_matches = re.findall(r"\b(\d+)\s+tasks?\b", readme)
     if str(task_count) in count_matches or f"{task_count} tasks" in readme:
-        print(f"✅ README mentions {task_count} tasks")
+        lines.append(f"✅ README mentions {task_count} tasks")
     else:
         ok = False
-        print(f"❌ README does not reference the current task count ({task_count})")
+        lines.append(f"❌ README does not reference the current task count ({task_count})")
 
     if "tasks/" not in readme:
         ok = False
-        print("❌ README has not been updated to describe the tasks/ layout")
+        lines.append("❌ README has not been updated to describe the tasks/ layout")
 
     if CHANGELOG_PATH.exists():
         changelog = CHANGELOG_PATH.read_text(encoding="utf-8")
         placeholders = re.findall(r"\d{4}-\d{2}-XX", changelog)
         if placeholders:
             ok = False
-            print(f"❌ CHANGELOG contains placeholder dates: {placeholders}")
+            lines.append(f"❌ CHANGELOG contains placeholder dates: {placeholders}")
         else:
-            print("✅ CHANGELOG dates look concrete")
+            lines.append("✅ CHANGELOG dates look concrete")
     else:
-        print("⚠️ CHANGELOG.md missing")
+        lines.append("⚠️ CHANGELOG.md missing")
+    return ok, lines
+
+
+def check_documentation(
+    task_count: int,
+    manifest: Optional[Manifest] = None,
+    report: Optional[Dict[str, Any]] = None,
+) -> bool:
+    if manifest is None:
+        ok, lines = _documentation_findings(task_count)
+    else:
+        key = [manifest.digest(README_PATH), manifest.digest(CHANGELOG_PATH), task_count]
+        cached = manifest.documentation
+        if cached.get("key") == key:
+            ok, lines = cached["ok"], cached["lines"]
+        else:
+            ok, lines = _documentation_findings(task_count)
+            manifest.documentation = {"key": key, "ok": ok, "lines": lines}
+    if report is not None:
+        report["documentation"] = {"ok": ok, "messages": lines}
+    if lines == ["❌ README.md missing"]:
+        print(lines[0])
+        return ok
+    for line in lines:
+        print(line)
     print()
     return ok
 
@@ -146,10 +458,21 @@ def check_documentation(task_count: int) -> bool:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Check dataset bundle consistency")
     parser.add_argument("--verbose", "-v", action="store_true")
+    parser.add_argument("--manifest", nargs="?", const=MANIFEST_PATH, type=Path,
+                        help=f"Re-check only bundles whose files changed, tracked in a manifest (default: {MANIFEST_PATH}).")
+    parser.add_argument("--json", type=Path, help="Write a machine-readable report to this file.")
     args = parser.parse_args()
 
-    tasks_ok = check_bundles(verbose=args.verbose)
-    doc_ok = check_documentation(len([p for p in TASKS_DIR.iterdir() if p.is_dir()]))
+    manifest = Manifest(args.manifest) if args.manifest is not None else None
+    report: Optional[Dict[str, Any]] = {} if args.json is not None else None
+    tasks_ok = check_bundles(verbose=args.verbose, manifest=manifest, report=report)
+    doc_ok = check_documentation(len([p for p in TASKS_DIR.iterdir() if p.is_dir()]), manifest, report)
+    if manifest is not None:
+        manifest.save()
+    if report is not None and args.json is not None:
+        report["ok"] = tasks_ok and doc_ok
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
     print("=" * 50)
     if tasks_ok and doc_ok:
@@ -0,0 +1,10 @@
+"""Shared runtime primitives for CompDSL solvers.
+
+Task bundles keep their core logic in ``solution.py``; this package collects
+pure, performance-oriented building blocks and helpers that several solvers
+used to re-implement (memoisation, line/ray tables, masks, ...).  Solvers
+import them explicitly, e.g. ``from compdsl.helpers import copy_grid``, so a
+bundle is no longer standalone: the repository root must be on ``sys.path``
+(``cd tasks/<id> && PYTHONPATH=../.. python -c "import solution"``; the harness
+adds it itself).
+"""
@@ -0,0 +1,115 @@
+"""Grid masks as Python integers, one bit per cell, with bitwise flood fill.
+
+A :class:`BitGrid` fixes the layout for an ``h x w`` grid: cell ``(r, c)`` is
+bit ``r * (w + 1) + c``.  The extra always-clear guard column stops
+horizontal shifts from wrapping into the neighbouring row, so growing a
+region by one step is a handful of shifts, ORs and one AND with the grid
+mask.  Flood fill iterates that step until the region stops changing (at most
+one round per cell of path length), and border or adjacency tests are single
+ANDs -- no per-cell tuples or visited sets.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+
+class BitGrid:
+    __slots__ = ("height", "width", "stride", "full", "left", "right", "top", "bottom", "border")
+
+    def __init__(self, height: int, width: int) -> None:
+        self.height = height
+        self.width = width
+        self.stride = width + 1
+        row_bits = (1 << width) - 1
+        full = 0
+        for r in range(height):
+            full |= row_bits << (r * self.stride)
+        self.full = full
+        left = right = 0
+        for r in range(height):
+            left |= 1 << (r * self.stride)
+            right |= 1 << (r * self.stride + width - 1)
+        self.left = left if width else 0
+        self.right = right if width else 0
+        self.top = row_bits if height else 0
+        self.bottom = row_bits << ((height - 1) * self.stride) if height else 0
+        self.border = self.left | self.right | self.top | self.bottom
+
+    # --- conversions -----------------------------------------------------
+    def bit(self, r: int, c: int) -> int:
+        return 1 << (r * self.stride + c)
+
+    def mask_of(self, grid: Sequence[Sequence[int]], colour: int) -> int:
+        """Cells of ``grid`` equal to ``colour``."""
+        mask = 0
+        for r, row in enumerate(grid):
+            # Build each row's bits from a binary string, which is much faster than per-cell shifts.
+            bits = "".join("1" if value == colour else "0" for value in reversed(row))
+            if "1" in bits:
+                mask |= int(bits, 2) << (r * self.stride)
+        return mask
+
+    def mask_from_cells(self, cells: Iterable[Cell]) -> int:
+        mask = 0
+        stride = self.stride
+        for r, c in cells:
+            if 0 <= r < self.height and 0 <= c < self.width:
+                mask |= 1 << (r * stride + c)
+        return mask
+
+    def indices(self, mask: int) -> Iterator[int]:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def cells(self, mask: int) -> Iterator[Cell]:
+        stride = self.stride
+        for idx in self.indices(mask):
+            yield divmod(idx, stride)  # type: ignore[misc]
+
+    def to_bool_grid(self, mask: int) -> List[List[bool]]:
+        out = [[False] * self.width for _ in range(self.height)]
+        for r, c in self.cells(mask):
+            out[r][c] = True
+        return out
+
+    # --- morphology ------------------------------------------------------
+    def dilate4(self, mask: int) -> int:
+        s = self.stride
+        return (mask | (mask << 1) | (mask >> 1) | (mask << s) | (mask >> s)) & self.full
+
+    def dilate8(self, mask: int) -> int:
+        s = self.stride
+        row = mask | (mask << 1) | (mask >> 1)
+        return (row | (row << s) | (row >> s)) & self.full
+
+    def flood(self, seeds: int, passable: int, diagonal: bool = False) -> int:
+        """``seeds`` plus the cells of ``passable`` reachable from them, like a BFS."""
+        grow = self.dilate8 if diagonal else self.dilate4
+        region = seeds
+        # Each productive round adds at least one passable cell.
+        limit = popcount(passable) + 1
+        for _ in range(limit):
+            nxt = (grow(region) & passable) | seeds
+            if nxt == region:
+                break
+            region = nxt
+        return region
+
+    def components(self, mask: int, diagonal: bool = False) -> Iterator[int]:
+        """Split ``mask`` into connected components, lowest cell index first."""
+        while mask:
+            seed = mask & -mask
+            component = self.flood(seed, mask, diagonal)
+            yield component
+            mask &= ~component
+
+    def touches_border(self, mask: int) -> bool:
+        return bool(mask & self.border)
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
@@ -0,0 +1,184 @@
+"""Compact connected-component records.
+
+Component extractors traditionally return one ``dict`` per component with
+string keys for colour, cells, bounding box, area, centre, ...  A
+:class:`Component` carries the same information with ``__slots__``: the
+cells are a packed ``array`` of flat indices (``r * stride + c``), and the
+derived geometry is computed on first access and then cached.  Records
+compare by colour and cell set, and :meth:`Component.replace` makes a cheap
+copy that shares the packed cells.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+BBox = Tuple[int, int, int, int]  # (rmin, rmax, cmin, cmax)
+
+NEIGHBOURS_4: Tuple[Cell, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+NEIGHBOURS_8: Tuple[Cell, ...] = NEIGHBOURS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class Component:
+    __slots__ = ("color", "stride", "flat", "slot", "_bbox", "_centroid", "_key")
+
+    def __init__(self, color: int, stride: int, flat: "array[int]", slot: Optional[Tuple[int, int]] = None) -> None:
+        self.color = color
+        self.stride = stride
+        self.flat = flat
+        # Optional layout position assigned by a solver (e.g. tile row/column).
+        self.slot = slot
+        self._bbox: Optional[BBox] = None
+        self._centroid: Optional[Tuple[float, float]] = None
+        self._key: Optional[Tuple[int, bytes]] = None
+
+    @classmethod
+    def from_cells(cls, color: int, cells: Iterable[Cell], stride: int) -> "Component":
+        return cls(color, stride, array("I", (r * stride + c for r, c in cells)))
+
+    def replace(self, **changes: object) -> "Component":
+        """Copy with ``color`` and/or ``slot`` changed (like ``dataclasses.replace``)."""
+        unknown = sorted(set(changes) - {"color", "slot"})
+        if unknown:
+            raise TypeError(f"Component.replace() got unexpected field(s): {', '.join(unknown)}")
+        clone = Component(
+            changes.get("color", self.color),  # type: ignore[arg-type]
+            self.stride,
+            self.flat,
+            changes.get("slot", self.slot),  # type: ignore[arg-type]
+        )
+        clone._bbox = self._bbox
+        clone._centroid = self._centroid
+        return clone
+
+    # --- cells -----------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.flat)
+
+    def __iter__(self) -> Iterator[Cell]:
+        stride = self.stride
+        for idx in self.flat:
+            yield divmod(idx, stride)  # type: ignore[misc]
+
+    @property
+    def cells(self) -> List[Cell]:
+        return list(self)
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, tuple) or len(cell) != 2:
+            return False
+        r, c = cell
+        if not 0 <= c < self.stride:
+            return False
+        return r * self.stride + c in self.flat
+
+    # --- derived geometry ------------------------------------------------
+    @property
+    def area(self) -> int:
+        return len(self.flat)
+
+    @property
+    def bbox(self) -> BBox:
+        if self._bbox is None:
+            stride = self.stride
+            rows = [idx // stride for idx in self.flat]
+            cols = [idx % stride for idx in self.flat]
+            self._bbox = (min(rows), max(rows), min(cols), max(cols))
+        return self._bbox
+
+    @property
+    def height(self) -> int:
+        rmin, rmax, _, _ = self.bbox
+        return rmax - rmin + 1
+
+    @property
+    def width(self) -> int:
+        _, _, cmin, cmax = self.bbox
+        return cmax - cmin + 1
+
+    @property
+    def bbox_area(self) -> int:
+        return self.height * self.width
+
+    @property
+    def fill_ratio(self) -> float:
+        return len(self.flat) / self.bbox_area
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Centre of the bounding box."""
+        rmin, rmax, cmin, cmax = self.bbox
+        return ((rmin + rmax) / 2.0, (cmin + cmax) / 2.0)
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """Mean cell position."""
+        if self._centroid is None:
+            stride = self.stride
+            n = len(self.flat)
+            self._centroid = (
+                sum(idx // stride for idx in self.flat) / n,
+                sum(idx % stride for idx in self.flat) / n,
+            )
+        return self._centroid
+
+    # --- comparison ------------------------------------------------------
+    def _identity(self) -> Tuple[int, bytes]:
+        if self._key is None:
+            self._key = (self.color, array("I", sorted(self.flat)).tobytes())
+        return self._key
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Component):
+            return NotImplemented
+        if self is other:
+            return True
+        return self.stride == other.stride and self.slot == other.slot and self._identity() == other._identity()
+
+    def __hash__(self) -> int:
+        return hash((self.stride, self._identity()))
+
+    def __repr__(self) -> str:
+        return f"Component(color={self.color}, area={self.area}, bbox={self.bbox})"
+
+
+def extract_components(
+    grid: Sequence[Sequence[int]],
+    ignore: Iterable[int] = (),
+    diagonal: bool = False,
+) -> List[Component]:
+    """Single-colour connected components in row-major discovery order.
+
+    Cells within a component are stored in breadth-first order from the
+    component's first (top-left-most) cell.
+    """
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    ignore_set = set(ignore)
+    steps = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+    seen = bytearray(h * w)
+    components: List[Component] = []
+    for r in range(h):
+        row = grid[r]
+        for c in range(w):
+            start = r * w + c
+            if seen[start] or row[c] in ignore_set:
+                continue
+            color = row[c]
+            seen[start] = 1
+            flat = array("I")
+            queue = deque([(r, c)])
+            while queue:
+                cr, cc = queue.popleft()
+                flat.append(cr * w + cc)
+                for dr, dc in steps:
+                    nr, nc = cr + dr, cc + dc
+                    if 0 <= nr < h and 0 <= nc < w:
+                        idx = nr * w + nc
+                        if not seen[idx] and grid[nr][nc] == color:
+                            seen[idx] = 1
+                            queue.append((nr, nc))
+            components.append(Component(color, w, flat))
+    return components
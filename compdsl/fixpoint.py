@@ -0,0 +1,109 @@
+"""Worklist fixpoint iteration for completion and propagation passes.
+
+Several solvers repeat whole-grid passes "until nothing changes".  When a
+pass is a sequence of independent units (rows, columns, cells) whose result
+depends only on cells that may have changed, a unit that has seen no change
+since it was last processed cannot change again.  :func:`fixpoint` therefore
+tracks which units are dirty and re-evaluates only those, while visiting them
+in the same order as the full rescan would, so the result is identical.
+
+Every iteration carries an explicit ``max_rounds`` bound.  Monotone passes --
+each productive round fills at least one cell -- finish in at most
+``height * width + 1`` rounds, which is the default for :func:`line_fixpoint`.
+Exceeding the bound raises :class:`FixpointBoundExceeded` rather than looping.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, cast
+
+U = TypeVar("U", bound=Hashable)
+Cell = Tuple[int, int]
+
+
+class FixpointBoundExceeded(RuntimeError):
+    """Raised when an iteration does not converge within its declared bound."""
+
+
+@dataclass
+class Phase(Generic[U]):
+    """One pass of a round: ``step`` is applied to each dirty unit in ``units`` order.
+
+    ``step`` performs its updates in place and returns the keys it changed
+    (typically cells); the engine maps them to dirty units via ``dependents``.
+    """
+
+    units: Sequence[U]
+    step: Callable[[U], Iterable[Hashable]]
+
+
+def fixpoint(
+    phases: Sequence[Phase],
+    dependents: Callable[[Hashable], Iterable[Tuple[int, Hashable]]],
+    max_rounds: int,
+    initial: Optional[Sequence[Iterable[Hashable]]] = None,
+) -> int:
+    """Run ``phases`` round after round until no unit is dirty; return the round count.
+
+    ``dependents(key)`` yields ``(phase_index, unit)`` pairs that must be
+    re-evaluated after ``key`` changed.  A unit dirtied later in the phase that
+    is currently sweeping is handled in the same round, exactly as a full
+    rescan would; otherwise it waits for the next round.  All units start
+    dirty unless ``initial`` lists the starting units per phase.
+    """
+    if initial is None:
+        dirty: List[Set[Hashable]] = [set(phase.units) for phase in phases]
+    else:
+        dirty = [set(units) for units in initial]
+    rounds = 0
+    while any(dirty):
+        rounds += 1
+        if rounds > max_rounds:
+            raise FixpointBoundExceeded(f"no fixpoint after {max_rounds} rounds")
+        for idx, phase in enumerate(phases):
+            pending = dirty[idx]
+            if not pending:
+                continue
+            for unit in phase.units:
+                if unit not in pending:
+                    continue
+                pending.discard(unit)
+                for key in phase.step(unit):
+                    for target, dep in dependents(key):
+                        dirty[target].add(dep)
+    return rounds
+
+
+def line_fixpoint(
+    height: int,
+    width: int,
+    row_step: Optional[Callable[[int], Iterable[Cell]]] = None,
+    col_step: Optional[Callable[[int], Iterable[Cell]]] = None,
+    max_rounds: Optional[int] = None,
+) -> int:
+    """Alternate row and column passes to a fixpoint, revisiting only touched lines.
+
+    Each step returns the ``(r, c)`` cells it changed; a change dirties its
+    row and its column.  Either step may be omitted.
+    """
+    phases: List[Phase] = []
+    slots: Dict[str, int] = {}
+    if row_step is not None:
+        slots["row"] = len(phases)
+        phases.append(Phase(range(height), row_step))
+    if col_step is not None:
+        slots["col"] = len(phases)
+        phases.append(Phase(range(width), col_step))
+    row_slot = slots.get("row")
+    col_slot = slots.get("col")
+
+    def dependents(cell: Hashable) -> Iterable[Tuple[int, Hashable]]:
+        r, c = cast(Tuple[int, int], cell)
+        if row_slot is not None:
+            yield row_slot, r
+        if col_slot is not None:
+            yield col_slot, c
+
+    bound = max_rounds if max_rounds is not None else height * width + 1
+    return fixpoint(phases, dependents, bound)
+
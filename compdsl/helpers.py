@@ -0,0 +1,60 @@
+"""Shared implementations of helpers that solvers used to carry private copies of.
+
+``python -m harness.duplicates`` groups the functions of every
+``tasks/*/solution.py`` by structural fingerprint and folded name, times the
+variants of each family below on common inputs next to the implementation
+here, and checks them for equivalence.  Each function keeps the exact
+semantics of the variants it replaces -- including tie-breaking and the
+order of returned bounds -- so solvers can import it under their old name.
+
+Note that :func:`majority_color` breaks ties by first occurrence in row-major
+order (``Counter.most_common``), unlike ``compdsl.primitives.most_common_color``,
+which prefers the smallest colour.  :func:`fold_repaint` hands the caller's
+canvas to the first update, while :func:`fold_repaint_copy` starts from a
+row-wise copy, so updates that paint in place leave the input untouched.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from itertools import chain
+from typing import Callable, Iterable, List, Sequence, Tuple, TypeVar
+
+Grid = List[List[int]]
+Cell = Tuple[int, int]
+T = TypeVar("T")
+
+
+def copy_grid(grid: Sequence[Sequence[int]]) -> Grid:
+    """Row-wise copy (rows are sliced, so tuple rows stay tuples)."""
+    return [row[:] for row in grid]  # type: ignore[misc]
+
+
+def transpose(grid: Sequence[Sequence[int]]) -> Grid:
+    return list(map(list, zip(*grid)))
+
+
+def majority_color(grid: Iterable[Iterable[int]]) -> int:
+    """Most frequent value; ties go to the value seen first in row-major order."""
+    return Counter(chain.from_iterable(grid)).most_common(1)[0][0]
+
+
+def cells_bbox(cells: Iterable[Cell]) -> Tuple[int, int, int, int]:
+    """Inclusive ``(top, bottom, left, right)`` of a non-empty collection of cells."""
+    rows, cols = zip(*cells)
+    return min(rows), max(rows), min(cols), max(cols)
+
+
+def fold_repaint(canvas: Grid, items: Iterable[T], update: Callable[[Grid, T], Grid]) -> Grid:
+    """Apply ``update(canvas, item)`` for each item in order, threading the result."""
+    acc = canvas
+    for item in items:
+        acc = update(acc, item)
+    return acc
+
+
+def fold_repaint_copy(canvas: Grid, items: Iterable[T], update: Callable[[Grid, T], Grid]) -> Grid:
+    """:func:`fold_repaint` starting from a row-wise copy of ``canvas``."""
+    acc = [row[:] for row in canvas]
+    for item in items:
+        acc = update(acc, item)
+    return acc
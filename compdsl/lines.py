@@ -0,0 +1,116 @@
+"""Line-key histograms for line-detection solvers.
+
+Every cell ``(r, c)`` lies on one line per orientation, identified by an
+integer key: ``row -> r``, ``col -> c``, ``diag1 -> r - c`` (slope +1) and
+``diag2 -> r + c`` (slope -1).  Counting cells per key is a bincount over
+those integers, so all four orientations can be histogrammed in one pass over
+the coordinates without grouping cells into per-line lists.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+ORIENTATIONS: Tuple[str, ...] = ("row", "col", "diag1", "diag2")
+
+T = TypeVar("T")
+
+
+class LineHistogram:
+    """Cell counts per line key for one orientation.
+
+    ``counts[i]`` is the number of cells on the line with key ``i + offset``
+    (the offset keeps ``diag1`` keys, which may be negative, indexable).
+    """
+
+    __slots__ = ("orientation", "counts", "offset")
+
+    def __init__(self, orientation: str, counts: List[int], offset: int = 0) -> None:
+        self.orientation = orientation
+        self.counts = counts
+        self.offset = offset
+
+    def count(self, key: int) -> int:
+        idx = key - self.offset
+        return self.counts[idx] if 0 <= idx < len(self.counts) else 0
+
+    def keys(self) -> List[int]:
+        """Keys of the non-empty lines, ascending."""
+        return [idx + self.offset for idx, n in enumerate(self.counts) if n]
+
+    def score(self) -> Tuple[int, int]:
+        """``(cells sharing a line with another cell, longest line)``."""
+        total = sum(self.counts)
+        occupied = sum(1 for n in self.counts if n)
+        return total - occupied, max(self.counts, default=0)
+
+
+def line_key(orientation: str, r: int, c: int) -> int:
+    if orientation == "row":
+        return r
+    if orientation == "col":
+        return c
+    if orientation == "diag1":
+        return r - c
+    if orientation == "diag2":
+        return r + c
+    raise ValueError(orientation)
+
+
+def line_histograms(rows: Sequence[int], cols: Sequence[int]) -> Dict[str, LineHistogram]:
+    """Histogram ``rows[i], cols[i]`` cells along all four orientations in one pass."""
+    if not rows:
+        return {name: LineHistogram(name, []) for name in ORIENTATIONS}
+    height = max(rows) + 1
+    width = max(cols) + 1
+    by_row = [0] * height
+    by_col = [0] * width
+    diag1 = [0] * (height + width - 1)
+    diag2 = [0] * (height + width - 1)
+    shift = width - 1
+    for r, c in zip(rows, cols):
+        by_row[r] += 1
+        by_col[c] += 1
+        diag1[r - c + shift] += 1
+        diag2[r + c] += 1
+    return {
+        "row": LineHistogram("row", by_row),
+        "col": LineHistogram("col", by_col),
+        "diag1": LineHistogram("diag1", diag1, -shift),
+        "diag2": LineHistogram("diag2", diag2),
+    }
+
+
+def group_by_line(orientation: str, rows: Sequence[int], cols: Sequence[int], items: Sequence[T]) -> Dict[int, List[T]]:
+    """Bucket ``items[i]`` by the line key of ``(rows[i], cols[i])``, preserving order."""
+    groups: Dict[int, List[T]] = {}
+    if orientation == "row":
+        keys: Iterable[int] = rows
+    elif orientation == "col":
+        keys = cols
+    elif orientation == "diag1":
+        keys = (r - c for r, c in zip(rows, cols))
+    elif orientation == "diag2":
+        keys = (r + c for r, c in zip(rows, cols))
+    else:
+        raise ValueError(orientation)
+    for key, item in zip(keys, items):
+        groups.setdefault(key, []).append(item)
+    return groups
+
+
+def axis_counts(grid: Sequence[Sequence[int]], colour: int) -> Tuple[List[int], List[int]]:
+    """Per-row and per-column counts of ``colour``."""
+    row_counts = [row.count(colour) for row in grid]
+    col_counts = [col.count(colour) for col in zip(*grid)]
+    return row_counts, col_counts
+
+
+def full_lines(grid: Sequence[Sequence[int]], colour: int) -> Tuple[List[int], List[int]]:
+    """Indices of rows and columns made entirely of ``colour``."""
+    row_counts, col_counts = axis_counts(grid, colour)
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
+    return (
+        [r for r, n in enumerate(row_counts) if n == width],
+        [c for c, n in enumerate(col_counts) if n == height],
+    )
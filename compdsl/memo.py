@@ -0,0 +1,211 @@
+"""Opt-in memoisation for pure typed operations over grids.
+
+Typed operations are pure, and solvers frequently call the same one on the
+same grid from several helpers (e.g. a background-colour query used by both
+the component extractor and the renderer).  :func:`memoize_grid_op` turns such
+repeated calls into lookups:
+
+- Grid arguments (lists/tuples of rows) are fingerprinted by content, or by
+  object identity with ``fingerprint="identity"`` when the caller guarantees
+  the grid is not mutated between calls.  Other arguments are keyed together
+  with their type, so ``True``, ``1`` and ``1.0`` are distinct; calls with
+  unhashable arguments (lists of grids, dicts, ...) bypass the cache.
+- Each wrapped operation keeps its own LRU bounded by entry count and by an
+  approximate byte size of the stored results.
+- Mutable results are copied on the way out, so callers may edit them freely;
+  pass ``copy_results=False`` for read-only result objects such as lookup
+  tables, which are then shared between callers.
+
+Set ``COMPDSL_MEMO=0`` in the environment to bypass every cache.
+"""
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+_ENABLED = os.environ.get("COMPDSL_MEMO", "1") != "0"
+_REGISTRY: Dict[str, "_Memo"] = {}
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class MemoInfo:
+    hits: int
+    misses: int
+    uncacheable: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+def _is_grid(value: Any) -> bool:
+    return (
+        isinstance(value, (list, tuple))
+        and bool(value)
+        and all(isinstance(row, (list, tuple)) for row in value)
+    )
+
+
+def _typed(value: Any) -> Hashable:
+    # Tag scalars with their type: True, 1 and 1.0 are equal dict keys but may
+    # give different results.
+    if isinstance(value, tuple):
+        return (tuple, tuple(_typed(item) for item in value))
+    if isinstance(value, (list, set, dict)):
+        raise _Uncacheable
+    return (type(value), value)
+
+
+def _content_key(value: Any) -> Hashable:
+    key = ("grid", tuple(map(tuple, value))) if _is_grid(value) else _typed(value)
+    try:
+        hash(key)  # e.g. a list of grids has list cells
+    except TypeError as exc:
+        raise _Uncacheable from exc
+    return key
+
+
+def _approx_size(value: Any) -> int:
+    if _is_grid(value):
+        return sys.getsizeof(value) + sum(sys.getsizeof(row) for row in value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(_approx_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_approx_size(k) + _approx_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, (int, float, complex, str, bytes, bool, type(None), frozenset)):
+        return True
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+class _Memo:
+    def __init__(
+        self, fn: Callable[..., Any], fingerprint: str, max_entries: int, max_bytes: int, copy_results: bool
+    ) -> None:
+        if fingerprint not in ("content", "identity"):
+            raise ValueError(f"unknown fingerprint mode: {fingerprint!r}")
+        self.fn = fn
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copy_results = copy_results
+        # key -> (result, size, pinned identity-keyed arguments)
+        self.entries: "OrderedDict[Hashable, Tuple[Any, int, Tuple[Any, ...]]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def _key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Hashable, Tuple[Any, ...]]:
+        parts: List[Hashable] = []
+        pinned: List[Any] = []
+        for value in list(args) + [kwargs[name] for name in sorted(kwargs)]:
+            if self.fingerprint == "identity" and _is_grid(value):
+                # Keep the object alive so its id cannot be reused by another grid.
+                parts.append(("id", id(value)))
+                pinned.append(value)
+            else:
+                parts.append(_content_key(value))
+        return (tuple(parts), tuple(sorted(kwargs))), tuple(pinned)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not _ENABLED:
+            return self.fn(*args, **kwargs)
+        try:
+            key, pinned = self._key(args, kwargs)
+        except _Uncacheable:
+            self.uncacheable += 1
+            return self.fn(*args, **kwargs)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self._deliver(entry[0])
+        self.misses += 1
+        result = self.fn(*args, **kwargs)
+        size = _approx_size(result)
+        if size <= self.max_bytes:
+            stored = result if not self.copy_results or _is_immutable(result) else copy.deepcopy(result)
+            self.entries[key] = (stored, size, pinned)
+            self.bytes += size
+            self._evict()
+        return result
+
+    def _deliver(self, result: Any) -> Any:
+        return result if not self.copy_results or _is_immutable(result) else copy.deepcopy(result)
+
+    def _evict(self) -> None:
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, size, _) = self.entries.popitem(last=False)
+            self.bytes -= size
+
+    def info(self) -> MemoInfo:
+        return MemoInfo(
+            self.hits, self.misses, self.uncacheable, len(self.entries), self.bytes,
+            self.max_entries, self.max_bytes,
+        )
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+        self.hits = self.misses = self.uncacheable = 0
+
+
+def memoize_grid_op(
+    fn: Optional[F] = None,
+    *,
+    fingerprint: str = "content",
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    copy_results: bool = True,
+) -> Any:
+    """Memoise a pure operation; usable bare (``@memoize_grid_op``) or with options.
+
+    The wrapper exposes ``cache_info()`` and ``cache_clear()`` like
+    ``functools.lru_cache``.
+    """
+
+    def decorate(func: F) -> F:
+        memo = _Memo(func, fingerprint, max_entries, max_bytes, copy_results)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return memo(*args, **kwargs)
+
+        wrapper.cache_info = memo.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = memo.clear  # type: ignore[attr-defined]
+        _REGISTRY[f"{func.__module__}.{func.__qualname__}"] = memo
+        return wrapper  # type: ignore[return-value]
+
+    if fn is not None:
+        return decorate(fn)
+    return decorate
+
+
+def memo_stats() -> Dict[str, MemoInfo]:
+    """Counters for every memoised operation created in this process."""
+    return {name: memo.info() for name, memo in sorted(_REGISTRY.items())}
+
+
+def clear_all() -> None:
+    for memo in _REGISTRY.values():
+        memo.clear()
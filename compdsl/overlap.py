@@ -0,0 +1,87 @@
+"""Maximal suffix/prefix overlap between blocks joined side by side.
+
+Merging two blocks horizontally with the widest column overlap used to mean
+trying every overlap width ``k`` and comparing row slices, ``O(W^2 * H)``.
+Here each column is interned to a small integer once (``O(H)`` per column),
+after which the widest overlap is the KMP failure value of
+``right + [sentinel] + left`` -- ``O(W_left + W_right)`` integer comparisons.
+
+:class:`ColumnChain` keeps the merged result as a list of column ids, so a
+chain of merges only looks at the last ``W_right`` columns of the running
+result and stays linear in the total width.
+"""
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+Block = List[List[int]]
+Column = Tuple[int, ...]
+
+
+def longest_overlap(left: Sequence[Hashable], right: Sequence[Hashable]) -> int:
+    """Largest ``k`` with ``left[-k:] == right[:k]`` (0 if none)."""
+    limit = min(len(left), len(right))
+    if limit == 0:
+        return 0
+    pattern = list(right[:limit])
+    failure = [0] * limit
+    k = 0
+    for i in range(1, limit):
+        while k and pattern[i] != pattern[k]:
+            k = failure[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        failure[i] = k
+    k = 0
+    for symbol in left[len(left) - limit :]:
+        while k and symbol != pattern[k]:
+            k = failure[k - 1]
+        if symbol == pattern[k]:
+            k += 1
+            if k == limit:  # only possible on the last symbol of ``left``
+                break
+    return k
+
+
+class ColumnChain:
+    """Blocks concatenated left to right, each overlapping the result maximally.
+
+    The height is fixed by the first non-empty block; later blocks contribute
+    their first ``height`` rows, as the row-by-row merge did.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[Column, int] = {}
+        self._columns: List[Column] = []
+        self._result: List[int] = []
+        self._first: Block = []  # returned as-is when no block had any columns
+        self._seen = False
+        self.height = 0
+
+    def _intern(self, column: Column) -> int:
+        ident = self._ids.get(column)
+        if ident is None:
+            ident = self._ids[column] = len(self._columns)
+            self._columns.append(column)
+        return ident
+
+    def append(self, block: Block) -> int:
+        """Merge ``block`` onto the right; returns the overlap width used."""
+        if not self._seen:
+            self._first = [row[:] for row in block]
+            self._seen = True
+        if not block or not block[0]:
+            return 0
+        if not self._result:
+            self.height = len(block)
+        rows = [block[r] for r in range(self.height)]
+        incoming = [self._intern(column) for column in zip(*rows)]
+        overlap = longest_overlap(self._result, incoming)
+        self._result.extend(incoming[overlap:])
+        return overlap
+
+    def to_block(self) -> Block:
+        if not self._result:
+            return [row[:] for row in self._first]
+        columns = [self._columns[ident] for ident in self._result]
+        return [list(row) for row in zip(*columns)]
@@ -0,0 +1,415 @@
+"""Core grid primitives with interchangeable pure-Python and NumPy backends.
+
+The vocabulary covers what most solvers re-implement with nested loops:
+colour histograms, the most common colour and the first cell of each colour,
+colour masks, bounding boxes and crops, flips/rotations/transposes, mask
+painting, tiling and upscaling.
+
+Each backend works on its own grid representation -- lists of lists for
+``"python"``, 2-D integer arrays for ``"numpy"`` -- and the active
+backend is chosen per context (``using_backend``), so grids are converted
+once at solver entry (:func:`from_lists`) and exit (:func:`to_lists`), never
+per call.  The registry does this for solvers that list ``"numpy"`` in their
+module-level ``BACKENDS`` (``load_solver(task_id, backend="numpy")``).
+
+Both backends produce identical results: ties in :func:`most_common_color`
+go to the smallest colour, histograms are ordered by colour, boxes are
+inclusive ``(top, bottom, left, right)``.  NumPy is optional; asking for the
+``"numpy"`` backend without it raises ``ImportError``.
+
+The ``"auto"`` backend keeps lists of lists and, per call, runs the NumPy
+implementation (converting in and out) only when the grid has at least the
+crossover number of cells recorded for that primitive in the dispatch table
+(``dispatch.json`` next to this module, written by ``harness.crossover``;
+``COMPDSL_DISPATCH`` overrides the path).  Without a table or NumPy it is the
+Python backend.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+Grid = List[List[int]]
+Box = Tuple[int, int, int, int]
+Position = Tuple[int, int]
+
+DISPATCH_PATH = Path(__file__).with_name("dispatch.json")
+
+
+class PythonBackend:
+    name = "python"
+
+    def from_lists(self, grid: Grid) -> Any:
+        return [list(row) for row in grid]
+
+    def to_lists(self, grid: Any) -> Grid:
+        return [[int(v) for v in row] for row in grid]
+
+    def color_histogram(self, grid: Grid) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for row in grid:
+            for v in row:
+                counts[v] = counts.get(v, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def most_common_color(self, grid: Grid) -> int:
+        counts = self.color_histogram(grid)
+        return max(counts, key=lambda color: (counts[color], -color))
+
+    def first_positions(self, grid: Grid) -> Dict[int, Position]:
+        first: Dict[int, Position] = {}
+        for r, row in enumerate(grid):
+            for c, v in enumerate(row):
+                if v not in first:
+                    first[v] = (r, c)
+        return dict(sorted(first.items()))
+
+    def mask_of(self, grid: Grid, color: int) -> List[List[bool]]:
+        return [[v == color for v in row] for row in grid]
+
+    def mask_other(self, grid: Grid, color: int) -> List[List[bool]]:
+        return [[v != color for v in row] for row in grid]
+
+    def bbox(self, mask: List[List[bool]]) -> Optional[Box]:
+        rows = [r for r, row in enumerate(mask) if any(row)]
+        if not rows:
+            return None
+        cols = [c for c in range(len(mask[0])) if any(row[c] for row in mask)]
+        return rows[0], rows[-1], cols[0], cols[-1]
+
+    def crop(self, grid: Grid, box: Box) -> Grid:
+        top, bottom, left, right = box
+        return [row[left : right + 1] for row in grid[top : bottom + 1]]
+
+    def flip_h(self, grid: Grid) -> Grid:
+        return [row[::-1] for row in grid]
+
+    def flip_v(self, grid: Grid) -> Grid:
+        return [row[:] for row in grid[::-1]]
+
+    def transpose(self, grid: Grid) -> Grid:
+        return [list(col) for col in zip(*grid)]
+
+    def rotate(self, grid: Grid, k: int = 1) -> Grid:
+        out = [row[:] for row in grid]
+        for _ in range(k % 4):  # counter-clockwise, like numpy.rot90
+            out = [list(col) for col in zip(*out)][::-1]
+        return out
+
+    def paint_mask(self, grid: Grid, mask: List[List[bool]], color: int) -> Grid:
+        return [[color if m else v for v, m in zip(row, mrow)] for row, mrow in zip(grid, mask)]
+
+    def tile(self, grid: Grid, reps_r: int, reps_c: int) -> Grid:
+        return [list(row) * reps_c for _ in range(reps_r) for row in grid]
+
+    def upscale(self, grid: Grid, k: int) -> Grid:
+        return [[v for v in row for _ in range(k)] for row in grid for _ in range(k)]
+
+    def label_components(self, grid: Grid, background: int) -> Tuple[Grid, int]:
+        height = len(grid)
+        width = len(grid[0]) if height else 0
+        labels = [[0] * width for _ in range(height)]
+        count = 0
+        for r in range(height):
+            for c in range(width):
+                color = grid[r][c]
+                if color == background or labels[r][c]:
+                    continue
+                count += 1
+                labels[r][c] = count
+                queue = deque([(r, c)])
+                while queue:
+                    rr, cc = queue.popleft()
+                    for nr, nc in ((rr - 1, cc), (rr + 1, cc), (rr, cc - 1), (rr, cc + 1)):
+                        if 0 <= nr < height and 0 <= nc < width and not labels[nr][nc] and grid[nr][nc] == color:
+                            labels[nr][nc] = count
+                            queue.append((nr, nc))
+        return labels, count
+
+    def match_template(self, grid: Grid, template: Grid) -> List[Position]:
+        th, tw = len(template), len(template[0])
+        height = len(grid)
+        width = len(grid[0]) if height else 0
+        first = template[0]
+        hits: List[Position] = []
+        for r in range(height - th + 1):
+            for c in range(width - tw + 1):
+                if grid[r][c : c + tw] == first and all(
+                    grid[r + dr][c : c + tw] == template[dr] for dr in range(1, th)
+                ):
+                    hits.append((r, c))
+        return hits
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("the numpy backend requires numpy")
+
+    def from_lists(self, grid: Grid) -> Any:
+        return np.array(grid, dtype=np.int64).reshape(len(grid), len(grid[0]) if grid else 0)
+
+    def to_lists(self, grid: Any) -> Grid:
+        return np.asarray(grid, dtype=np.int64).tolist()
+
+    def color_histogram(self, grid: Any) -> Dict[int, int]:
+        counts = np.bincount(grid.ravel()) if grid.size else np.zeros(0, dtype=np.int64)
+        return {int(color): int(n) for color, n in enumerate(counts) if n}
+
+    def most_common_color(self, grid: Any) -> int:
+        return int(np.bincount(grid.ravel()).argmax())
+
+    def first_positions(self, grid: Any) -> Dict[int, Position]:
+        flat = grid.ravel()
+        if not flat.size:
+            return {}
+        width = grid.shape[1]
+        return {int(color): divmod(int(np.argmax(flat == color)), width) for color in np.flatnonzero(np.bincount(flat))}
+
+    def mask_of(self, grid: Any, color: int) -> Any:
+        return grid == color
+
+    def mask_other(self, grid: Any, color: int) -> Any:
+        return grid != color
+
+    def bbox(self, mask: Any) -> Optional[Box]:
+        rows = np.flatnonzero(mask.any(axis=1))
+        if not rows.size:
+            return None
+        cols = np.flatnonzero(mask.any(axis=0))
+        return int(rows[0]), int(rows[-1]), int(cols[0]), int(cols[-1])
+
+    def crop(self, grid: Any, box: Box) -> Any:
+        top, bottom, left, right = box
+        return grid[top : bottom + 1, left : right + 1].copy()
+
+    def flip_h(self, grid: Any) -> Any:
+        return grid[:, ::-1].copy()
+
+    def flip_v(self, grid: Any) -> Any:
+        return grid[::-1].copy()
+
+    def transpose(self, grid: Any) -> Any:
+        return grid.T.copy()
+
+    def rotate(self, grid: Any, k: int = 1) -> Any:
+        return np.rot90(grid, k).copy()
+
+    def paint_mask(self, grid: Any, mask: Any, color: int) -> Any:
+        return np.where(mask, color, grid)
+
+    def tile(self, grid: Any, reps_r: int, reps_c: int) -> Any:
+        return np.tile(grid, (reps_r, reps_c))
+
+    def upscale(self, grid: Any, k: int) -> Any:
+        return np.repeat(np.repeat(grid, k, axis=0), k, axis=1)
+
+    def label_components(self, grid: Any, background: int) -> Tuple[Any, int]:
+        # Min-label propagation with pointer jumping: every cell converges to
+        # the flat index of its component's first cell in row-major order.
+        height, width = grid.shape
+        fg = grid != background
+        size = height * width
+        roots = np.where(fg, np.arange(size).reshape(height, width), size)
+        flat = np.append(roots.ravel(), size)
+        same_down = fg[:-1] & (grid[:-1] == grid[1:])
+        same_right = fg[:, :-1] & (grid[:, :-1] == grid[:, 1:])
+        while True:
+            cur = flat[:size].reshape(height, width)
+            nxt = cur.copy()
+            np.minimum(nxt[1:], np.where(same_down, cur[:-1], size), out=nxt[1:])
+            np.minimum(nxt[:-1], np.where(same_down, cur[1:], size), out=nxt[:-1])
+            np.minimum(nxt[:, 1:], np.where(same_right, cur[:, :-1], size), out=nxt[:, 1:])
+            np.minimum(nxt[:, :-1], np.where(same_right, cur[:, 1:], size), out=nxt[:, :-1])
+            jumped = np.append(nxt.ravel(), size)
+            jumped = jumped[jumped]
+            if np.array_equal(jumped, flat):
+                break
+            flat = jumped
+        root_ids = flat[:size]
+        uniq = np.unique(root_ids[root_ids < size])
+        lookup = np.zeros(size + 1, dtype=np.int64)
+        lookup[uniq] = np.arange(1, len(uniq) + 1)
+        return lookup[root_ids].reshape(height, width), int(len(uniq))
+
+    def match_template(self, grid: Any, template: Any) -> List[Position]:
+        template = np.asarray(template)
+        th, tw = template.shape
+        if th > grid.shape[0] or tw > grid.shape[1]:
+            return []
+        windows = np.lib.stride_tricks.sliding_window_view(grid, (th, tw))
+        hits = np.argwhere((windows == template).all(axis=(2, 3)))
+        return [(int(r), int(c)) for r, c in hits]
+
+
+def dispatch_path() -> Path:
+    """The dispatch table ``AutoBackend`` reads by default."""
+    return Path(os.environ.get("COMPDSL_DISPATCH", DISPATCH_PATH))
+
+
+def load_dispatch_table(path: Optional[Path] = None) -> Dict[str, Optional[int]]:
+    """``primitive -> minimum cells for the NumPy path`` (None: always Python)."""
+    path = path or dispatch_path()
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {name: entry.get("min_cells") for name, entry in data.get("primitives", {}).items()}
+
+
+def _to_python(value: Any) -> Any:
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return tuple(_to_python(v) for v in value)
+    return value
+
+
+class AutoBackend(PythonBackend):
+    """Python representation; NumPy per call above the measured crossover."""
+
+    name = "auto"
+
+    def __init__(self, table: Optional[Dict[str, Optional[int]]] = None) -> None:
+        self.table = load_dispatch_table() if table is None else table
+        self._numpy = NumpyBackend() if np is not None else None
+        for primitive, min_cells in self.table.items():
+            if min_cells is not None and self._numpy is not None and hasattr(PythonBackend, primitive):
+                setattr(self, primitive, self._dispatcher(primitive, min_cells))
+
+    def _dispatcher(self, primitive: str, min_cells: int) -> Callable[..., Any]:
+        slow = getattr(PythonBackend, primitive).__get__(self)
+        fast = getattr(self._numpy, primitive)
+
+        def call(grid: Any, *args: Any) -> Any:
+            if len(grid) * (len(grid[0]) if grid else 0) < min_cells:
+                return slow(grid, *args)
+            converted = [np.asarray(a) if isinstance(a, list) else a for a in args]
+            return _to_python(fast(np.asarray(grid), *converted))
+
+        return call
+
+
+BACKENDS: Dict[str, Any] = {"python": PythonBackend, "auto": AutoBackend}
+if np is not None:
+    BACKENDS["numpy"] = NumpyBackend
+
+_INSTANCES: Dict[str, Any] = {}
+_ACTIVE: ContextVar[str] = ContextVar("compdsl_backend", default="python")
+
+
+def get_backend(name: Optional[str] = None) -> Any:
+    name = name or _ACTIVE.get()
+    backend = _INSTANCES.get(name)
+    if backend is None:
+        if name == "numpy" and name not in BACKENDS:
+            raise ImportError("the numpy backend requires numpy")
+        if name not in BACKENDS:
+            raise ValueError(f"unknown backend {name!r}")
+        backend = _INSTANCES[name] = BACKENDS[name]()
+    return backend
+
+
+@contextmanager
+def using_backend(name: str) -> Iterator[Any]:
+    """Make ``name`` the active backend for the current thread/context."""
+    backend = get_backend(name)
+    token = _ACTIVE.set(name)
+    try:
+        yield backend
+    finally:
+        _ACTIVE.reset(token)
+
+
+def from_lists(grid: Grid) -> Any:
+    return get_backend().from_lists(grid)
+
+
+def to_lists(grid: Any) -> Grid:
+    return get_backend().to_lists(grid)
+
+
+def color_histogram(grid: Any) -> Dict[int, int]:
+    return get_backend().color_histogram(grid)
+
+
+def most_common_color(grid: Any) -> int:
+    return get_backend().most_common_color(grid)
+
+
+def first_positions(grid: Any) -> Dict[int, Position]:
+    """Row-major first cell of each colour, ordered by colour."""
+    return get_backend().first_positions(grid)
+
+
+def mask_of(grid: Any, color: int) -> Any:
+    return get_backend().mask_of(grid, color)
+
+
+def mask_other(grid: Any, color: int) -> Any:
+    return get_backend().mask_other(grid, color)
+
+
+def bbox(mask: Any) -> Optional[Box]:
+    return get_backend().bbox(mask)
+
+
+def crop(grid: Any, box: Box) -> Any:
+    return get_backend().crop(grid, box)
+
+
+def crop_to_content(grid: Any, background: int) -> Any:
+    """Crop to the bounding box of the non-``background`` cells (unchanged if none)."""
+    backend = get_backend()
+    box = backend.bbox(backend.mask_other(grid, background))
+    return grid if box is None else backend.crop(grid, box)
+
+
+def flip_h(grid: Any) -> Any:
+    return get_backend().flip_h(grid)
+
+
+def flip_v(grid: Any) -> Any:
+    return get_backend().flip_v(grid)
+
+
+def transpose(grid: Any) -> Any:
+    return get_backend().transpose(grid)
+
+
+def rotate(grid: Any, k: int = 1) -> Any:
+    return get_backend().rotate(grid, k)
+
+
+def paint_mask(grid: Any, mask: Any, color: int) -> Any:
+    return get_backend().paint_mask(grid, mask, color)
+
+
+def tile(grid: Any, reps_r: int, reps_c: int) -> Any:
+    return get_backend().tile(grid, reps_r, reps_c)
+
+
+def upscale(grid: Any, k: int) -> Any:
+    return get_backend().upscale(grid, k)
+
+
+def label_components(grid: Any, background: int) -> Tuple[Any, int]:
+    """4-connected same-colour components: ``(labels, count)``, numbered 1.. in
+    row-major order of each component's first cell, background labelled 0."""
+    return get_backend().label_components(grid, background)
+
+
+def match_template(grid: Any, template: Any) -> List[Position]:
+    """Top-left positions where ``template`` occurs exactly, row-major."""
+    return get_backend().match_template(grid, template)
@@ -0,0 +1,99 @@
+"""Precomputed ray tables: distance to the next differing cell per direction.
+
+Ray-casting helpers typically walk ``while grid[r][c] == colour: r += dr``
+cell by cell for every ray.  :class:`RayTables` instead stores, for each cell
+and direction, the length of the run of equal values starting at that cell.
+Each table is one linear sweep over the grid, built lazily per direction, so
+finding a ray's end is O(1) and emitting it is O(length).
+
+Tables snapshot the grid when built, so callers must rebuild after painting
+if later rays should see the painted cells.  Solvers build one
+:class:`RayTables` per solve and pass it to their ray helpers.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Point = Tuple[int, int]
+Direction = Tuple[int, int]
+
+DIRECTIONS_4: Tuple[Direction, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIRECTIONS_8: Tuple[Direction, ...] = DIRECTIONS_4 + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class RayTables:
+    __slots__ = ("cells", "height", "width", "_runs")
+
+    def __init__(self, grid: Sequence[Sequence[int]]) -> None:
+        self.cells: Tuple[Tuple[int, ...], ...] = tuple(tuple(row) for row in grid)
+        self.height = len(self.cells)
+        self.width = len(self.cells[0]) if self.cells else 0
+        self._runs: Dict[Direction, List[List[int]]] = {}
+
+    def _table(self, direction: Direction) -> List[List[int]]:
+        table = self._runs.get(direction)
+        if table is None:
+            table = self._sweep(direction)
+            self._runs[direction] = table
+        return table
+
+    def _sweep(self, direction: Direction) -> List[List[int]]:
+        dr, dc = direction
+        h, w = self.height, self.width
+        cells = self.cells
+        runs = [[1] * w for _ in range(h)]
+        # Visit each cell after its successor along the direction (for dr == 0
+        # the successor is in the same row, earlier in ``col_order``).
+        row_order = range(h - 1, -1, -1) if dr > 0 else range(h)
+        col_order = list(range(w - 1, -1, -1) if dc > 0 else range(w))
+        for r in row_order:
+            nr = r + dr
+            if not 0 <= nr < h:
+                continue
+            row, next_row, run_row, next_runs = cells[r], cells[nr], runs[r], runs[nr]
+            for c in col_order:
+                nc = c + dc
+                if 0 <= nc < w and next_row[nc] == row[c]:
+                    run_row[c] = next_runs[nc] + 1
+        return runs
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def run_length(self, r: int, c: int, direction: Direction) -> int:
+        """Cells from ``(r, c)`` inclusive that share its value along ``direction``."""
+        return self._table(direction)[r][c]
+
+    def ray(self, origin: Point, direction: Direction, through: Optional[int] = None) -> List[Point]:
+        """Cells after ``origin`` along ``direction`` while their value equals ``through``.
+
+        Without ``through`` the ray follows whatever value the first cell has.
+        """
+        dr, dc = direction
+        r, c = origin[0] + dr, origin[1] + dc
+        if not self.in_bounds(r, c):
+            return []
+        if through is not None and self.cells[r][c] != through:
+            return []
+        length = self._table(direction)[r][c]
+        return [(r + k * dr, c + k * dc) for k in range(length)]
+
+    def ray_end(self, origin: Point, direction: Direction) -> Optional[Point]:
+        """First cell after the run that starts next to ``origin``; ``None`` at the border."""
+        dr, dc = direction
+        r, c = origin[0] + dr, origin[1] + dc
+        if not self.in_bounds(r, c):
+            return None
+        length = self._table(direction)[r][c]
+        end = (r + length * dr, c + length * dc)
+        return end if self.in_bounds(*end) else None
+
+    def next_obstacle(self, origin: Point, direction: Direction, background: int) -> Optional[Point]:
+        """First cell after ``origin`` along ``direction`` whose value is not ``background``."""
+        dr, dc = direction
+        r, c = origin[0] + dr, origin[1] + dc
+        if not self.in_bounds(r, c):
+            return None
+        if self.cells[r][c] != background:
+            return (r, c)
+        return self.ray_end(origin, direction)
@@ -0,0 +1,148 @@
+"""Run-length encoded rows and columns for stripe- and segment-oriented solvers.
+
+A line (row or column) becomes a list of :class:`Run` records -- maximal
+stretches of one colour -- built in a single pass.  :class:`RLEGrid` holds
+the row runs of a grid and derives the column runs on first use; solvers
+build one per grid and pass it to the helpers that need runs.
+
+The run-level operations (:func:`paint_run`, :func:`split_runs`,
+:func:`merge_runs`, :func:`spans`, :func:`run_at`) work in ``O(runs)`` and
+return new lists; runs are never mutated.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Run(NamedTuple):
+    color: int
+    start: int
+    length: int
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.length
+
+
+def encode_line(values: Iterable[int]) -> List[Run]:
+    runs: List[Run] = []
+    color: Optional[int] = None
+    start = length = 0
+    for idx, value in enumerate(values):
+        if value == color:
+            length += 1
+            continue
+        if length:
+            runs.append(Run(color, start, length))  # type: ignore[arg-type]
+        color, start, length = value, idx, 1
+    if length:
+        runs.append(Run(color, start, length))  # type: ignore[arg-type]
+    return runs
+
+
+def decode_line(runs: Sequence[Run]) -> List[int]:
+    line: List[int] = []
+    for run in runs:
+        line.extend([run.color] * run.length)
+    return line
+
+
+def merge_runs(runs: Iterable[Run]) -> List[Run]:
+    """Coalesce adjacent runs of the same colour (and drop empty ones)."""
+    merged: List[Run] = []
+    for run in runs:
+        if not run.length:
+            continue
+        if merged and merged[-1].color == run.color and merged[-1].stop == run.start:
+            last = merged[-1]
+            merged[-1] = Run(last.color, last.start, last.length + run.length)
+        else:
+            merged.append(run)
+    return merged
+
+
+def split_runs(runs: Sequence[Run], pos: int) -> Tuple[List[Run], List[Run]]:
+    """Runs covering ``[.., pos)`` and ``[pos, ..)``; a run straddling ``pos`` is cut."""
+    left: List[Run] = []
+    right: List[Run] = []
+    for run in runs:
+        if run.stop <= pos:
+            left.append(run)
+        elif run.start >= pos:
+            right.append(run)
+        else:
+            left.append(Run(run.color, run.start, pos - run.start))
+            right.append(Run(run.color, pos, run.stop - pos))
+    return left, right
+
+
+def paint_run(runs: Sequence[Run], start: int, stop: int, color: int) -> List[Run]:
+    """Runs with cells ``[start, stop)`` set to ``color`` (clipped to the line)."""
+    if not runs:
+        return []
+    start = max(start, runs[0].start)
+    stop = min(stop, runs[-1].stop)
+    if start >= stop:
+        return list(runs)
+    before, rest = split_runs(runs, start)
+    _, after = split_runs(rest, stop)
+    return merge_runs(before + [Run(color, start, stop - start)] + after)
+
+
+def run_at(runs: Sequence[Run], pos: int) -> Optional[Run]:
+    """The run containing ``pos`` (None if outside the line)."""
+    idx = bisect_right([run.start for run in runs], pos) - 1
+    if idx < 0 or pos >= runs[idx].stop:
+        return None
+    return runs[idx]
+
+
+def spans(runs: Sequence[Run], exclude: int) -> List[Tuple[int, int]]:
+    """Maximal ``(start, stop)`` stretches whose cells all differ from ``exclude``."""
+    out: List[Tuple[int, int]] = []
+    for run in runs:
+        if run.color == exclude:
+            continue
+        if out and out[-1][1] == run.start:
+            out[-1] = (out[-1][0], run.stop)
+        else:
+            out.append((run.start, run.stop))
+    return out
+
+
+class RLEGrid:
+    """Row runs of a grid, with column runs derived lazily.
+
+    The grid is read again when column runs are first requested, so it must
+    not be mutated before then.
+    """
+
+    __slots__ = ("height", "width", "rows", "_cols", "_grid")
+
+    def __init__(self, grid: Sequence[Sequence[int]]) -> None:
+        self.height = len(grid)
+        self.width = len(grid[0]) if self.height else 0
+        self.rows: List[List[Run]] = [encode_line(row) for row in grid]
+        self._cols: Optional[List[List[Run]]] = None
+        self._grid = grid
+
+    @property
+    def cols(self) -> List[List[Run]]:
+        if self._cols is None:
+            self._cols = [encode_line(col) for col in zip(*self._grid)]
+            self._grid = ()  # no longer needed
+        return self._cols
+
+    def row(self, r: int) -> List[Run]:
+        return self.rows[r]
+
+    def col(self, c: int) -> List[Run]:
+        return self.cols[c]
+
+    def runs(self, orientation: str, index: int) -> List[Run]:
+        """``orientation`` is ``"row"`` or ``"col"``."""
+        return self.rows[index] if orientation == "row" else self.cols[index]
+
+    def decode(self) -> List[List[int]]:
+        return [decode_line(runs) for runs in self.rows]
@@ -0,0 +1,109 @@
+"""Bucketed spatial index for nearest-anchor queries over grid points.
+
+Points are hashed into square buckets of side ``bucket``.  A query scans
+buckets ring by ring around its own bucket; once the best distance found is
+no larger than the smallest distance any unscanned ring could offer, the
+search stops.  Ties are broken by insertion order, so replacing a scan such as
+
+    for anchor in anchors:
+        if best is None or dist(q, anchor) < best: ...
+
+with ``index.nearest(q)`` returns the same anchor as long as the index was
+filled in the same order.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+Point = Tuple[int, int]
+
+
+def manhattan(a: Point, b: Point) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def chebyshev(a: Point, b: Point) -> int:
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+METRICS: Dict[str, Callable[[Point, Point], int]] = {"manhattan": manhattan, "chebyshev": chebyshev}
+
+
+class PointIndex(Generic[T]):
+    """Nearest and k-nearest queries over ``(point, payload)`` pairs."""
+
+    def __init__(
+        self,
+        items: Iterable[Tuple[Point, T]] = (),
+        metric: str = "manhattan",
+        bucket: int = 4,
+    ) -> None:
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric: {metric!r}")
+        if bucket < 1:
+            raise ValueError("bucket size must be positive")
+        self.metric = metric
+        self._distance = METRICS[metric]
+        self.bucket = bucket
+        # bucket -> [(insertion order, point, payload)]
+        self._buckets: Dict[Point, List[Tuple[int, Point, T]]] = {}
+        self._count = 0
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+        for point, payload in items:
+            self.add(point, payload)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, point: Point) -> Point:
+        return point[0] // self.bucket, point[1] // self.bucket
+
+    def add(self, point: Point, payload: T) -> None:
+        key = self._key(point)
+        self._buckets.setdefault(key, []).append((self._count, point, payload))
+        self._count += 1
+        if self._bounds is None:
+            self._bounds = (key[0], key[0], key[1], key[1])
+        else:
+            r0, r1, c0, c1 = self._bounds
+            self._bounds = (min(r0, key[0]), max(r1, key[0]), min(c0, key[1]), max(c1, key[1]))
+
+    def _ring(self, centre: Point, radius: int) -> Iterable[Point]:
+        br, bc = centre
+        if radius == 0:
+            yield centre
+            return
+        for dc in range(-radius, radius + 1):
+            yield br - radius, bc + dc
+            yield br + radius, bc + dc
+        for dr in range(-radius + 1, radius):
+            yield br + dr, bc - radius
+            yield br + dr, bc + radius
+
+    def _max_radius(self, centre: Point) -> int:
+        assert self._bounds is not None
+        r0, r1, c0, c1 = self._bounds
+        return max(abs(centre[0] - r0), abs(centre[0] - r1), abs(centre[1] - c0), abs(centre[1] - c1))
+
+    def k_nearest(self, query: Point, k: int) -> List[Tuple[Point, T, int]]:
+        """Up to ``k`` entries as ``(point, payload, distance)``, nearest first."""
+        if k <= 0 or not self._count:
+            return []
+        centre = self._key(query)
+        found: List[Tuple[int, int, Point, T]] = []
+        for radius in range(self._max_radius(centre) + 1):
+            for key in self._ring(centre, radius):
+                for order, point, payload in self._buckets.get(key, ()):
+                    found.append((self._distance(query, point), order, point, payload))
+            if len(found) >= k:
+                found.sort(key=lambda item: (item[0], item[1]))
+                # Anything in ring radius + 1 is at least radius * bucket + 1 away.
+                if found[k - 1][0] <= radius * self.bucket:
+                    break
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [(point, payload, dist) for dist, _, point, payload in found[:k]]
+
+    def nearest(self, query: Point) -> Optional[Tuple[Point, T, int]]:
+        hits = self.k_nearest(query, 1)
+        return hits[0] if hits else None
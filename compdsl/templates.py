@@ -0,0 +1,81 @@
+"""Template stores keyed by composite attributes, and copy-on-write stamping.
+
+Template-lookup solvers keep a literal table of patterns and, per component,
+filter every key for matching attributes (colour, size, ...).
+:class:`TemplateIndex` groups the keys once by a caller-supplied attribute
+tuple so candidates come back from one dict lookup, in table order.
+
+Stamping a template used to copy the whole canvas.  :func:`paint` and
+:func:`overlay` return a new grid that shares every untouched row with the
+input and copies only the rows they write, so a fold of ``k`` stamps costs
+``O(k * (H + template area))`` rather than ``O(k * H * W)``.  The input grid is
+never mutated; callers must not mutate results in place either, since rows
+may be shared with earlier canvases.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+Grid = List[List[int]]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TemplateIndex(Generic[K, V]):
+    """Keys of a template table grouped by ``attributes(key, template)``."""
+
+    def __init__(self, templates: Mapping[K, V], attributes: Callable[[K, V], Hashable]):
+        self.templates = templates
+        grouped: Dict[Hashable, List[K]] = {}
+        for key, template in templates.items():
+            grouped.setdefault(attributes(key, template), []).append(key)
+        self._groups: Dict[Hashable, Tuple[K, ...]] = {attrs: tuple(keys) for attrs, keys in grouped.items()}
+
+    def keys(self, attrs: Hashable) -> Tuple[K, ...]:
+        """Template keys whose attributes equal ``attrs``, in table order."""
+        return self._groups.get(attrs, ())
+
+    def __getitem__(self, key: K) -> V:
+        return self.templates[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.templates
+
+
+def paint(canvas: Grid, writes: Iterable[Tuple[int, int, int]]) -> Grid:
+    """Apply ``(row, col, value)`` writes (out-of-bounds ones skipped) copy-on-write."""
+    height = len(canvas)
+    width = len(canvas[0]) if height else 0
+    out = list(canvas)
+    copied = set()
+    for r, c, value in writes:
+        if 0 <= r < height and 0 <= c < width:
+            if r not in copied:
+                out[r] = out[r][:]
+                copied.add(r)
+            out[r][c] = value
+    return out
+
+
+def overlay(
+    canvas: Grid,
+    template: Iterable[Iterable[Optional[int]]],
+    start_row: int,
+    start_col: int,
+    transparent: Optional[int] = None,
+) -> Grid:
+    """Stamp ``template`` with its top-left at ``(start_row, start_col)``.
+
+    Cells equal to ``transparent`` (``None`` by default) leave the canvas as
+    is; parts falling outside the canvas are clipped.
+    """
+    return paint(
+        canvas,
+        (
+            (start_row + dr, start_col + dc, value)
+            for dr, row in enumerate(template)
+            for dc, value in enumerate(row)
+            if value is not None and value != transparent
+        ),
+    )
@@ -4,15 +4,21 @@ Extract typed-operation declarations and lambda representations from
 ARC abstraction notes, synthesise Python stubs, and run mypy against
 the generated module.  This flags mismatches such as undefined helpers,
 incorrect arity, or missing arguments in the pseudo-code.
+
+The stub modules share no imports, so ``--jobs N`` splits them into N shards
+type-checked by parallel mypy processes (each with its own persistent cache
+directory, ``.mypy_cache/shard-N``) and merges the diagnostics in file order.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import ast
 from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple, TypeVar
@@ -358,7 +364,41 @@ def build_stub_module(
     return "\n".join(module_parts)
 
 
-def run_mypy_on_modules(modules: Dict[Path, str]) -> Tuple[int, str]:
+MYPY_CMD = ["mypy", "--hide-error-context", "--no-color-output"]
+# Shard N always uses <repo>/.mypy_cache/shard-N, so repeated runs reuse the
+# typeshed and stub caches instead of re-analysing them in a fresh directory.
+MYPY_CACHE_ROOT = Path(__file__).resolve().parents[1] / ".mypy_cache"
+MYPY_SUMMARY = re.compile(r"^(Success: no issues found|Found \d+ errors?) in ")
+
+
+def _merge_mypy_outputs(file_paths: List[Path], outputs: List[str]) -> str:
+    """Combine per-shard mypy output into one report ordered by stub file."""
+    by_file: Dict[str, List[str]] = {}
+    other: List[str] = []
+    names = {str(path) for path in file_paths}
+    for output in outputs:
+        for line in output.splitlines():
+            if MYPY_SUMMARY.match(line):
+                continue
+            name = line.split(":", 1)[0]
+            if name in names:
+                by_file.setdefault(name, []).append(line)
+            elif line.strip():
+                other.append(line)
+    lines = [line for name in sorted(by_file) for line in by_file[name]] + other
+    errors = sum(1 for line in lines if ": error:" in line)
+    failing = len({name for name, block in by_file.items() if any(": error:" in line for line in block)})
+    checked = len(file_paths)
+    if errors:
+        plural = "s" if errors != 1 else ""
+        files = "file" if failing == 1 else "files"
+        lines.append(f"Found {errors} error{plural} in {failing} {files} (checked {checked} source files)")
+    else:
+        lines.append(f"Success: no issues found in {checked} source files")
+    return "\n".join(lines) + "\n"
+
+
+def run_mypy_on_modules(modules: Dict[Path, str], jobs: int = 1) -> Tuple[int, str]:
     with tempfile.TemporaryDirectory(prefix="dsl_lambda_typecheck_") as tmp_dir:
         tmp_path = Path(tmp_dir)
         file_paths: List[Path] = []
@@ -368,15 +408,36 @@ def run_mypy_on_modules(modules: Dict[Path, str]) -> Tuple[int, str]:
             dest.write_text(code)
             file_paths.append(dest)
 
-        cmd = ["mypy", "--hide-error-context", "--no-color-output"] + [str(p) for p in file_paths]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        output = proc.stdout + proc.stderr
-        return proc.returncode, output
+        shards = max(1, min(jobs, len(file_paths)))
+        if shards == 1:
+            proc = subprocess.run(MYPY_CMD + [str(p) for p in file_paths], capture_output=True, text=True)
+            output = proc.stdout + proc.stderr
+            return proc.returncode, output
+
+        # Largest stubs first, each to the currently lightest shard.
+        groups: List[List[Path]] = [[] for _ in range(shards)]
+        loads = [0] * shards
+        for path in sorted(file_paths, key=lambda p: (-p.stat().st_size, p.name)):
+            idx = loads.index(min(loads))
+            groups[idx].append(path)
+            loads[idx] += path.stat().st_size
+
+        def run_shard(idx: int) -> subprocess.CompletedProcess:
+            cache_dir = MYPY_CACHE_ROOT / f"shard-{idx}"
+            cmd = MYPY_CMD + ["--cache-dir", str(cache_dir)] + [str(p) for p in sorted(groups[idx])]
+            return subprocess.run(cmd, capture_output=True, text=True)
+
+        with ThreadPoolExecutor(max_workers=shards) as executor:
+            procs = list(executor.map(run_shard, range(shards)))
+        output = _merge_mypy_outputs(file_paths, [proc.stdout + proc.stderr for proc in procs])
+        return max(proc.returncode for proc in procs), output
 
 
 def main(argv: Sequence[str]) -> int:
     parser = argparse.ArgumentParser(description="Type-check lambda representations against declared DSL signatures.")
     parser.add_argument("paths", nargs="+", help="Abstraction files or directories to analyse.")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Parallel mypy shards (0: one per CPU).")
     args = parser.parse_args(argv)
 
     abstraction_files = collect_abstraction_files(args.paths)
@@ -410,7 +471,7 @@ def main(argv: Sequence[str]) -> int:
             print(f"purity violation: {message}", file=sys.stderr)
         return 1
 
-    exit_code, output = run_mypy_on_modules(modules)
+    exit_code, output = run_mypy_on_modules(modules, args.jobs or os.cpu_count() or 1)
     sys.stdout.write(output)
     return exit_code
 
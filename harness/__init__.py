@@ -0,0 +1,7 @@
+"""Evaluation harness for the ARC-AGI-2 task bundles.
+
+The harness loads ``tasks/<id>/solution.py`` solvers by path (task ids are not
+valid module names), iterates task examples the same way each bundle's
+``abstractions.py::evaluate`` does, and layers tooling such as result caching
+on top.  Everything here is optional: solvers never import the harness.
+"""
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Measure where NumPy overtakes pure Python for each shared grid primitive.
+
+For every primitive in ``compdsl.primitives`` this times the list-of-lists
+implementation against the NumPy one *including* the list/array conversions
+the ``"auto"`` backend performs per call, on blocky random grids with side
+lengths from 3 to 256.  The crossover is the smallest side from which NumPy
+is faster at every larger measured side; it is written, as a cell count, to
+the dispatch table that ``AutoBackend`` reads (``compdsl/dispatch.json`` by
+default).  Primitives where NumPy never wins get ``min_cells: null``.  The
+table keeps only the derived thresholds; ``--timings PATH`` also writes the
+raw per-size measurements (e.g. to ``.cache/``) for inspection.  With
+``--primitives`` only those entries of an existing table are replaced, measured
+at the table's sizes; the others are kept.
+
+Usage: ``python -m harness.crossover [--primitives P ...] [--sizes 3 8 30 256] [--output PATH] [--timings PATH] [--min-time 0.02]``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from compdsl.primitives import DISPATCH_PATH, NumpyBackend, PythonBackend, np
+
+Grid = List[List[int]]
+
+DEFAULT_SIZES = (3, 4, 5, 6, 8, 10, 12, 16, 20, 24, 30, 40, 48, 64, 96, 128, 192, 256)
+
+
+def make_grid(size: int, seed: int = 0) -> Grid:
+    """Square grid of random 1-4 cell blocks over a dominant background, like ARC inputs."""
+    rng = random.Random(seed * 1000003 + size)
+    grid = [[0] * size for _ in range(size)]
+    for _ in range(max(1, size * size // 12)):
+        color = rng.randint(1, 9)
+        r, c = rng.randrange(size), rng.randrange(size)
+        for rr in range(r, min(size, r + rng.randint(1, 4))):
+            for cc in range(c, min(size, c + rng.randint(1, 4))):
+                grid[rr][cc] = color
+    return grid
+
+
+def _content_box(g: Grid) -> Tuple[int, int, int, int]:
+    n = len(g)
+    return n // 4, n - 1 - n // 4, n // 4, n - 1 - n // 4
+
+
+# primitive -> builds its arguments from a list-of-lists grid
+CASES: Dict[str, Callable[[Grid], Tuple[Any, ...]]] = {
+    "color_histogram": lambda g: (g,),
+    "most_common_color": lambda g: (g,),
+    "first_positions": lambda g: (g,),
+    "mask_of": lambda g: (g, g[0][0]),
+    "mask_other": lambda g: (g, 0),
+    "bbox": lambda g: ([[v != 0 for v in row] for row in g],),
+    "crop": lambda g: (g, _content_box(g)),
+    "flip_h": lambda g: (g,),
+    "flip_v": lambda g: (g,),
+    "transpose": lambda g: (g,),
+    "rotate": lambda g: (g, 1),
+    "paint_mask": lambda g: (g, [[v == 0 for v in row] for row in g], 5),
+    "tile": lambda g: (g, 2, 2),
+    "upscale": lambda g: (g, 2),
+    "label_components": lambda g: (g, 0),
+    "match_template": lambda g: (g, [row[:3] for row in g[:3]]),
+}
+
+
+def _numpy_path(numpy_backend: NumpyBackend, primitive: str) -> Callable[..., Any]:
+    fast = getattr(numpy_backend, primitive)
+
+    def call(grid: Grid, *args: Any) -> Any:
+        converted = [np.asarray(a) if isinstance(a, list) else a for a in args]
+        result = fast(np.asarray(grid), *converted)
+        if isinstance(result, tuple):
+            return tuple(r.tolist() if isinstance(r, np.ndarray) else r for r in result)
+        return result.tolist() if isinstance(result, np.ndarray) else result
+
+    return call
+
+
+def best_time(fn: Callable[..., Any], args: Tuple[Any, ...], min_time: float, repeat: int = 3) -> float:
+    """Best per-call seconds over ``repeat`` batches each lasting at least ``min_time``."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def crossover(timings: Sequence[Tuple[int, float, float]]) -> Optional[int]:
+    """Smallest size from which NumPy wins at every larger measured size."""
+    side: Optional[int] = None
+    for size, python_s, numpy_s in reversed(timings):
+        if numpy_s >= python_s:
+            break
+        side = size
+    return side
+
+
+def run(sizes: Sequence[int], primitives: Sequence[str], min_time: float) -> Dict[str, Any]:
+    python_backend = PythonBackend()
+    numpy_backend = NumpyBackend()
+    results: Dict[str, Any] = {}
+    for primitive in primitives:
+        slow = getattr(python_backend, primitive)
+        fast = _numpy_path(numpy_backend, primitive)
+        timings: List[Tuple[int, float, float]] = []
+        for size in sorted(sizes):
+            args = CASES[primitive](make_grid(size))
+            if slow(*args) != fast(*args):
+                raise AssertionError(f"{primitive} backends disagree at size {size}")
+            timings.append((size, best_time(slow, args, min_time), best_time(fast, args, min_time)))
+        side = crossover(timings)
+        results[primitive] = {
+            "crossover_side": side,
+            "min_cells": None if side is None else side * side,
+            "timings": {str(size): {"python": py, "numpy": nb} for size, py, nb in timings},
+        }
+        label = "never" if side is None else f"{side}x{side}"
+        print(f"{primitive:18s} numpy wins from {label}")
+    return results
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Python vs NumPy primitives and write a dispatch table.")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        help="Grid sides to measure (default: the existing table's, else a 3-256 ladder).")
+    parser.add_argument("--primitives", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--min-time", type=float, default=0.02, help="Seconds per timing batch.")
+    parser.add_argument("--output", type=Path, default=DISPATCH_PATH, help="Dispatch table to write.")
+    parser.add_argument("--timings", type=Path, help="Also write the raw timings behind each threshold here.")
+    args = parser.parse_args(argv)
+    if np is None:
+        print("numpy is not installed; nothing to compare", file=sys.stderr)
+        return 1
+
+    previous = json.loads(args.output.read_text()) if args.output.exists() else {}
+    kept = {
+        name: entry
+        for name, entry in previous.get("primitives", {}).items()
+        if name in CASES and name not in args.primitives
+    }
+    sizes = sorted(args.sizes or previous.get("sizes") or DEFAULT_SIZES)
+    if kept and previous.get("sizes") != sizes:
+        parser.error("--sizes differs from the existing table's; re-measure every primitive or use another --output")
+
+    results = run(sizes, args.primitives, args.min_time)
+    merged = dict(kept)
+    for name, entry in results.items():
+        merged[name] = {key: value for key, value in entry.items() if key != "timings"}
+    table = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sizes": sizes,
+        "primitives": {name: merged[name] for name in CASES if name in merged},
+    }
+    args.output.write_text(json.dumps(table, indent=1) + "\n")
+    print(f"wrote {args.output}")
+    if args.timings is not None:
+        args.timings.parent.mkdir(parents=True, exist_ok=True)
+        args.timings.write_text(json.dumps(dict(table, primitives=results), indent=1) + "\n")
+        print(f"wrote {args.timings}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Find helpers duplicated across solvers and check them against ``compdsl.helpers``.
+
+Every top-level function in ``tasks/*/solution.py`` gets the structural
+fingerprint ``check_consistency.function_fingerprint`` computes (docstrings
+and annotations dropped, locals renamed, module constants inlined, reachable
+module helpers included),
+and functions sharing one across several bundles are reported as clusters.
+
+Each family in :data:`FAMILIES` gathers the local variants whose folded name
+(case and underscores ignored) matches, one per fingerprint, and runs them on
+the same random inputs as the shared implementation in ``compdsl.helpers``:
+variants whose results (or exception types), or whose in-place changes to
+their arguments, differ are marked as not equivalent, and all are timed with ``harness.crossover.best_time``.  With
+``--verify`` every equivalent variant is swapped for the shared function in
+its solver module and the solver is re-run on all of its examples, which must
+produce the same outputs as before.
+
+Usage: ``python -m harness.duplicates [--min-size 2] [--benchmark] [--verify] [--data-dir DIR] [--json OUT]``
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import copy
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .crossover import best_time
+from .registry import REPO_ROOT, SPLITS, Grid, iter_examples, load_module, load_task, solver_path, task_ids
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import compdsl.helpers  # noqa: E402
+from check_consistency import function_fingerprint, module_definitions  # noqa: E402
+
+SHARED_MODULE = "compdsl.helpers"
+
+
+def folded(name: str) -> str:
+    return name.replace("_", "").lower()
+
+
+def _grid(rng: random.Random) -> Grid:
+    h, w = rng.randint(1, 30), rng.randint(1, 30)
+    colors = rng.sample(range(10), rng.randint(1, 5))
+    return [[rng.choice(colors) for _ in range(w)] for _ in range(h)]
+
+
+def _cells(rng: random.Random) -> List[Tuple[int, int]]:
+    return [(rng.randrange(30), rng.randrange(30)) for _ in range(rng.randint(1, 40))]
+
+
+def _paint(grid: Grid, item: Tuple[int, int, int]) -> Grid:
+    r, c, color = item
+    if r < len(grid) and c < len(grid[r]):
+        grid[r][c] = color
+    return grid
+
+
+def _fold_inputs(rng: random.Random) -> Tuple[Any, ...]:
+    items = [(rng.randrange(30), rng.randrange(30), rng.randrange(10)) for _ in range(rng.randint(0, 20))]
+    return _grid(rng), items, _paint
+
+
+@dataclass(frozen=True)
+class Family:
+    shared: str  # function in compdsl.helpers
+    names: FrozenSet[str]  # folded local names that may be copies of it
+    inputs: Callable[[random.Random], Tuple[Any, ...]]
+
+
+FAMILIES: Tuple[Family, ...] = (
+    Family("copy_grid", frozenset({"copygrid", "clonegrid", "clone", "copy", "deepcopy"}), lambda rng: (_grid(rng),)),
+    Family("transpose", frozenset({"transpose"}), lambda rng: (_grid(rng),)),
+    Family(
+        "majority_color",
+        frozenset({"majoritycolor", "mostcommoncolor", "backgroundcolor", "getbackground", "dominantcolor"}),
+        lambda rng: (_grid(rng),),
+    ),
+    Family("cells_bbox", frozenset({"bbox", "boundingbox"}), lambda rng: (_cells(rng),)),
+    Family("fold_repaint", frozenset({"foldrepaint"}), _fold_inputs),
+    Family("fold_repaint_copy", frozenset({"foldrepaint"}), _fold_inputs),
+)
+
+
+@dataclass
+class Helper:
+    task_id: str
+    name: str
+    fingerprint: str
+    lines: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.task_id}:{self.name}"
+
+
+def scan(tasks: Sequence[str]) -> Tuple[List[Helper], Dict[str, List[str]]]:
+    """All top-level solver functions, plus the bundles already importing each shared helper."""
+    helpers: List[Helper] = []
+    shared_users: Dict[str, List[str]] = {}
+    for task_id in tasks:
+        source = solver_path(task_id).read_text(encoding="utf-8")
+        functions, constants = module_definitions(source)
+        for name, node in functions.items():
+            lines = (node.end_lineno or node.lineno) - node.lineno + 1
+            helpers.append(Helper(task_id, name, function_fingerprint(name, functions, constants), lines))
+        for stmt in ast.parse(source).body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module == SHARED_MODULE:
+                for alias in stmt.names:
+                    shared_users.setdefault(alias.name, []).append(task_id)
+    return helpers, shared_users
+
+
+def clusters(helpers: Sequence[Helper], min_size: int = 2) -> List[List[Helper]]:
+    """Groups of structurally identical functions spanning at least ``min_size`` bundles."""
+    groups: Dict[str, List[Helper]] = {}
+    for helper in helpers:
+        groups.setdefault(helper.fingerprint, []).append(helper)
+    found = [g for g in groups.values() if len({h.task_id for h in g}) >= min_size]
+    return sorted(found, key=lambda g: (-len(g), g[0].name))
+
+
+def _shared_fingerprints() -> Dict[str, str]:
+    functions, constants = module_definitions(Path(compdsl.helpers.__file__).read_text(encoding="utf-8"))
+    return {name: function_fingerprint(name, functions, constants) for name in functions}
+
+
+@dataclass
+class Variant:
+    fingerprint: str
+    members: List[str]
+    identical_to_shared: bool = False
+    equivalent: Optional[bool] = None
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class FamilyReport:
+    shared: str
+    shared_seconds: Optional[float] = None
+    already_shared: List[str] = field(default_factory=list)
+    variants: List[Variant] = field(default_factory=list)
+    verified: Dict[str, str] = field(default_factory=dict)  # member -> "ok" / mismatch detail
+
+    @property
+    def copies(self) -> int:
+        return sum(len(v.members) for v in self.variants)
+
+
+def _outcome(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[str, Any, Tuple[Any, ...]]:
+    """Status, result (or exception type) and the arguments as left by the call."""
+    args = copy.deepcopy(args)
+    try:
+        return "ok", fn(*args), args
+    except Exception as exc:  # noqa: BLE001 - the exception type is part of the behaviour
+        return "error", type(exc).__name__, args
+
+
+def _per_call(fn: Callable[..., Any], inputs: Sequence[Tuple[Any, ...]], min_time: float) -> float:
+    def run_all() -> None:
+        for args in inputs:
+            try:
+                fn(*args)
+            except Exception:  # noqa: BLE001 - equivalence is checked separately
+                pass
+
+    return best_time(run_all, (), min_time) / len(inputs)
+
+
+def examine_family(
+    family: Family,
+    helpers: Sequence[Helper],
+    shared_users: Dict[str, List[str]],
+    benchmark: bool = False,
+    samples: int = 64,
+    min_time: float = 0.02,
+) -> FamilyReport:
+    shared = getattr(compdsl.helpers, family.shared)
+    shared_fp = _shared_fingerprints()[family.shared]
+    report = FamilyReport(family.shared, already_shared=sorted(shared_users.get(family.shared, [])))
+    by_fp: Dict[str, List[Helper]] = {}
+    for helper in helpers:
+        if folded(helper.name) in family.names:
+            by_fp.setdefault(helper.fingerprint, []).append(helper)
+
+    rng = random.Random(0)
+    inputs = [family.inputs(rng) for _ in range(samples)]
+    expected = [_outcome(shared, args) for args in inputs]
+    if benchmark:
+        report.shared_seconds = _per_call(shared, inputs, min_time)
+    for fp, members in sorted(by_fp.items(), key=lambda item: -len(item[1])):
+        variant = Variant(fp, [h.label for h in members], identical_to_shared=fp == shared_fp)
+        report.variants.append(variant)
+        try:
+            fn = getattr(load_module(members[0].task_id), members[0].name)
+        except Exception as exc:  # noqa: BLE001 - a broken bundle should not stop the scan
+            variant.error = repr(exc)
+            continue
+        variant.equivalent = [_outcome(fn, args) for args in inputs] == expected
+        if benchmark:
+            variant.seconds = _per_call(fn, inputs, min_time)
+    return report
+
+
+def verify_family(
+    report: FamilyReport,
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+) -> None:
+    """Swap each equivalent variant for the shared helper and compare solver outputs on all examples."""
+    shared = getattr(compdsl.helpers, report.shared)
+    for variant in report.variants:
+        if not variant.equivalent:
+            continue
+        for member in variant.members:
+            task_id, name = member.split(":")
+            try:
+                task = load_task(task_id, data_dir)
+            except FileNotFoundError:
+                report.verified[member] = "no task data"
+                continue
+            module = load_module(task_id)
+            solver = getattr(module, f"solve_{task_id}")
+            original = getattr(module, name)
+            examples = [(split, idx, ex["input"]) for split, idx, ex in iter_examples(task, splits)]
+            before = [_outcome(solver, (grid,)) for _, _, grid in examples]
+            setattr(module, name, shared)
+            try:
+                after = [_outcome(solver, (grid,)) for _, _, grid in examples]
+            finally:
+                setattr(module, name, original)
+            diffs = [f"{split}[{idx}]" for (split, idx, _), b, a in zip(examples, before, after) if a != b]
+            report.verified[member] = f"differs on {', '.join(diffs)}" if diffs else f"ok ({len(examples)} examples)"
+
+
+def _us(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1e6:.2f}us"
+
+
+def render(found: Sequence[List[Helper]], reports: Sequence[FamilyReport]) -> str:
+    lines = [f"structural clusters spanning several bundles: {len(found)}"]
+    for group in found:
+        names = sorted({h.name for h in group})
+        tasks = len({h.task_id for h in group})
+        lines.append(f"  {len(group):3d} copies in {tasks:3d} bundles, {group[0].lines:3d} lines: {', '.join(names)}")
+    for report in reports:
+        lines.append("")
+        lines.append(
+            f"{SHARED_MODULE}.{report.shared}: {report.copies} local copies in {len(report.variants)} variants, "
+            f"{len(report.already_shared)} bundles import it, shared {_us(report.shared_seconds)}"
+        )
+        for variant in report.variants:
+            if variant.error is not None:
+                status = f"error {variant.error}"
+            elif variant.identical_to_shared:
+                status = "identical"
+            else:
+                status = "equivalent" if variant.equivalent else "NOT equivalent"
+            members = ", ".join(variant.members[:4]) + (" ..." if len(variant.members) > 4 else "")
+            lines.append(f"  {variant.fingerprint[:10]} x{len(variant.members):<3d} {_us(variant.seconds):>10s}  {status}: {members}")
+        for member, outcome in sorted(report.verified.items()):
+            lines.append(f"    verify {member}: {outcome}")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Cluster duplicated solver helpers and check them against compdsl.helpers.")
+    parser.add_argument("tasks", nargs="*", help="Task ids to scan (default: all bundles).")
+    parser.add_argument("--min-size", type=int, default=2, help="Smallest number of bundles for a reported cluster.")
+    parser.add_argument("--benchmark", action="store_true", help="Time every variant against the shared helper.")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Seconds per timing batch.")
+    parser.add_argument("--verify", action="store_true", help="Re-run solvers with equivalent variants swapped for the shared helper.")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--splits", nargs="+", default=list(SPLITS), choices=SPLITS)
+    parser.add_argument("--json", type=Path, help="Also write clusters and family reports to this JSON file.")
+    args = parser.parse_args(argv)
+
+    helpers, shared_users = scan(args.tasks or task_ids())
+    found = clusters(helpers, args.min_size)
+    reports = [
+        examine_family(family, helpers, shared_users, args.benchmark, min_time=args.min_time)
+        for family in FAMILIES
+    ]
+    if args.verify:
+        for report in reports:
+            verify_family(report, args.data_dir, args.splits)
+    print(render(found, reports))
+
+    if args.json is not None:
+        payload = {
+            "clusters": [[asdict(h) for h in group] for group in found],
+            "families": [asdict(r) for r in reports],
+        }
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    bad = [m for r in reports for m, outcome in r.verified.items() if outcome.startswith("differs")]
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
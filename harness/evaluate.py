@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Run the task solvers over their examples and summarise matches per split.
+
+This mirrors ``abstractions.py::evaluate`` across the whole corpus.  With
+``--cache`` the solver outputs are memoised on disk (see ``result_cache``), so
+repeated sweeps only re-execute tasks whose ``solution.py`` changed.  With
+``--sandbox`` each solve runs in a resource-limited worker process (see
+``sandbox``) and runaway inputs are recorded as ``timeout`` or ``oom``.  With
+``--packed`` examples are read lazily from a file built by ``harness.packed``;
+with ``--stream-arcgen`` arc-gen sidecars are parsed one example at a time
+and ``--arcgen-shard I/K`` evaluates only every K-th of them.  ``--backend
+numpy`` (or ``auto``, which picks per primitive call from the crossover
+dispatch table) runs solvers that declare it on that primitive backend;
+others stay on Python.
+
+Usage: ``python -m harness.evaluate [task_id ...] [--cache] [--sandbox] [--data-dir DIR]``
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .registry import (
+    SPLITS,
+    Grid,
+    iter_arcgen_examples,
+    iter_examples,
+    load_solver,
+    load_task,
+    supported_backends,
+    task_ids,
+)
+from .result_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, ResultCache
+from .packed import PackedDataset
+from .sandbox import SandboxPool
+
+
+@dataclass
+class ExampleResult:
+    task_id: str
+    split: str
+    index: int
+    status: str  # "ok", "error", or a sandbox status ("timeout", "oom", "killed", "crash")
+    correct: Optional[bool]  # None when the example has no target output
+    seconds: float
+    error: Optional[str] = None
+
+
+Runner = Callable[[str, Grid], Grid]
+
+
+def direct_runner(task_id: str, grid: Grid) -> Grid:
+    return load_solver(task_id)(grid)
+
+
+def backend_runner(backend: str) -> Runner:
+    """Run solvers on ``backend`` where they support it, else on Python."""
+
+    def run(task_id: str, grid: Grid) -> Grid:
+        chosen = backend if backend in supported_backends(task_id) else "python"
+        return load_solver(task_id, chosen)(grid)
+
+    return run
+
+
+def _task_examples(
+    task_id: str,
+    data_dir: Optional[Path],
+    splits: Sequence[str],
+    dataset: Optional[PackedDataset],
+    stream_arcgen: bool,
+    arcgen_shard: Tuple[int, int],
+) -> Iterator[Tuple[str, int, Mapping[str, Grid]]]:
+    if dataset is not None:
+        yield from iter_examples(dataset.load_task(task_id), splits)
+        return
+    if not stream_arcgen:
+        yield from iter_examples(load_task(task_id, data_dir), splits)
+        return
+    task = load_task(task_id, data_dir, arcgen=False)
+    for split in splits:
+        if split == "arc-gen":
+            for idx, example in iter_arcgen_examples(task_id, data_dir, arcgen_shard):
+                yield split, idx, example
+        else:
+            yield from iter_examples(task, [split])
+
+
+def _parse_shard(text: str) -> Tuple[int, int]:
+    index, _, count = text.partition("/")
+    shard = (int(index), int(count or 1))
+    if not 0 <= shard[0] < shard[1]:
+        raise argparse.ArgumentTypeError(f"invalid shard {text!r}; expected I/K with 0 <= I < K")
+    return shard
+
+
+def evaluate_task(
+    task_id: str,
+    runner: Runner = direct_runner,
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+    dataset: Optional[PackedDataset] = None,
+    stream_arcgen: bool = False,
+    arcgen_shard: Tuple[int, int] = (0, 1),
+) -> List[ExampleResult]:
+    results: List[ExampleResult] = []
+    for split, idx, example in _task_examples(task_id, data_dir, splits, dataset, stream_arcgen, arcgen_shard):
+        expected = example.get("output")
+        start = time.perf_counter()
+        try:
+            pred = runner(task_id, example["input"])
+        except Exception as exc:  # noqa: BLE001 - report and keep sweeping
+            status = getattr(exc, "status", "error")
+            correct = None if expected is None else False
+            results.append(
+                ExampleResult(task_id, split, idx, status, correct, time.perf_counter() - start, repr(exc))
+            )
+            continue
+        elapsed = time.perf_counter() - start
+        correct = None if expected is None else pred == expected
+        results.append(ExampleResult(task_id, split, idx, "ok", correct, elapsed))
+    return results
+
+
+def summarise(task_id: str, results: List[ExampleResult]) -> None:
+    print(f"== {task_id} ==")
+    for split in SPLITS:
+        rows = [r for r in results if r.split == split]
+        if not rows:
+            continue
+        scored = [r for r in rows if r.correct is not None]
+        errors = sum(1 for r in rows if r.status == "error")
+        limited = [r.status for r in rows if r.status not in ("ok", "error")]
+        if scored:
+            matches = sum(1 for r in scored if r.correct)
+            first_failure = next((r.index for r in scored if not r.correct), None)
+            line = f"  {split}: {matches}/{len(scored)} matches; first failure index: {first_failure}"
+        else:
+            line = f"  {split}: {len(rows)} examples (no targets)"
+        if errors:
+            line += f"; {errors} errors"
+        for status in sorted(set(limited)):
+            line += f"; {limited.count(status)} {status}"
+        print(line)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate task solvers against their examples.")
+    parser.add_argument("tasks", nargs="*", help="Task ids to evaluate (default: all bundles).")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--packed", type=Path, help="Read examples from a packed dataset file instead of JSON.")
+    parser.add_argument("--stream-arcgen", action="store_true",
+                        help="Parse arc-gen sidecars incrementally instead of loading them whole.")
+    parser.add_argument("--arcgen-shard", type=_parse_shard, default=(0, 1), metavar="I/K",
+                        help="With --stream-arcgen, evaluate only arc-gen examples whose index is I mod K.")
+    parser.add_argument("--backend", choices=("python", "numpy", "auto"), default="python",
+                        help="Primitive backend for solvers that declare support (see compdsl.primitives).")
+    parser.add_argument("--splits", nargs="+", default=list(SPLITS), choices=SPLITS)
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_PATH, type=Path,
+                        help=f"Memoise solver outputs in a SQLite file (default: {DEFAULT_CACHE_PATH}).")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    parser.add_argument("--cache-max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument("--sandbox", action="store_true", help="Run each solve in a limited worker process.")
+    parser.add_argument("--workers", type=int, default=1, help="Sandbox worker processes (tasks run concurrently).")
+    parser.add_argument("--cpu-seconds", type=float, default=10.0, help="Per-solve CPU limit in the sandbox.")
+    parser.add_argument("--memory-mb", type=int, default=2048, help="Per-worker address-space limit.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-solve wall-clock limit in the sandbox.")
+    parser.add_argument("--recycle-after", type=int, default=200, help="Restart sandbox workers after N solves.")
+    args = parser.parse_args(argv)
+    if args.sandbox and args.backend != "python":
+        parser.error("--backend is not supported with --sandbox")
+
+    sandbox: Optional[SandboxPool] = None
+    runner: Runner = direct_runner if args.backend == "python" else backend_runner(args.backend)
+    if args.sandbox:
+        sandbox = SandboxPool(args.workers, args.cpu_seconds, args.memory_mb, args.timeout, args.recycle_after)
+        runner = sandbox.solve
+    cache: Optional[ResultCache] = None
+    if args.cache is not None:
+        cache = store = ResultCache(args.cache, args.cache_max_entries, args.cache_max_bytes, args.backend)
+        base = runner
+
+        def cached_runner(task_id: str, grid: Grid) -> Grid:
+            return store.solve(task_id, grid, partial(base, task_id))
+
+        runner = cached_runner
+    concurrency = args.workers if sandbox is not None else 1
+    dataset = PackedDataset(args.packed) if args.packed is not None else None
+
+    missing: List[str] = []
+    failed = 0
+
+    def run_task(task_id: str) -> Optional[List[ExampleResult]]:
+        try:
+            return evaluate_task(
+                task_id, runner, args.data_dir, args.splits, dataset, args.stream_arcgen, args.arcgen_shard
+            )
+        except FileNotFoundError:
+            return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            selected = args.tasks or (dataset.task_ids() if dataset is not None else task_ids())
+            for task_id, results in zip(selected, executor.map(run_task, selected)):
+                if results is None:
+                    missing.append(task_id)
+                    continue
+                summarise(task_id, results)
+                failed += sum(1 for r in results if r.correct is False)
+    finally:
+        if dataset is not None:
+            dataset.close()
+        if sandbox is not None:
+            print(f"sandbox: {sandbox.recycled} workers recycled")
+            sandbox.close()
+        if cache is not None:
+            stats: Dict[str, float] = dict(cache.stats.as_dict())
+            stats["hit_rate"] = round(cache.stats.hit_rate, 3)
+            print(f"cache: {stats}")
+            cache.close()
+
+    if missing:
+        print(f"no task data for {len(missing)} tasks: {' '.join(missing)}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
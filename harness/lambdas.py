@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Execute the "Lambda Representation" of each bundle and compare it to ``solution.py``.
+
+``dsl/check_lambda_types.py`` only type-checks the lambda block against
+stubs.  This tool extracts the same block (``parse_lambda_block``), compiles
+it once, and executes it in a copy of the sibling ``solution.py`` namespace,
+so every operation name binds to the real helper.  The compiled code object
+is cached in memory by source hash and on disk under ``.cache/lambdas``
+(``marshal``, keyed by interpreter bytecode magic), so repeated runs skip
+compilation.
+
+For each example the lambda entry point and the hand-written ``solve_<id>``
+are run once untimed (warm-up and equivalence check) and then ``--repeat``
+times each, alternating which goes first.  Every ``compdsl.memo`` cache is
+cleared before each timed run, so neither side is timed against results the
+other left behind.  The report gives output equivalence, errors, and the
+lambda's runtime overhead relative to the solver.
+
+Usage: ``python -m harness.lambdas [task_id ...] [--repeat N] [--json OUT]``
+"""
+from __future__ import annotations
+
+import __future__
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import marshal
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .registry import REPO_ROOT, SPLITS, TASKS_DIR, Grid, iter_examples, load_module, load_solver, load_task, task_ids
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from compdsl.memo import clear_all  # noqa: E402
+from dsl.check_lambda_types import parse_lambda_block  # noqa: E402
+
+CODE_CACHE_DIR = REPO_ROOT / ".cache" / "lambdas"
+DEFAULT_REPEAT = 3
+
+_CODE: Dict[str, CodeType] = {}
+
+
+def _compile(source: str, filename: str, cache_dir: Optional[Path]) -> CodeType:
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    code = _CODE.get(digest)
+    if code is not None:
+        return code
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f"{digest[:32]}-{importlib.util.MAGIC_NUMBER.hex()}.marshal"
+        if cache_file.exists():
+            code = marshal.loads(cache_file.read_bytes())
+    if code is None:
+        # Annotations in the block name DSL types; keep them unevaluated.
+        flags = __future__.annotations.compiler_flag
+        code = compile(source, filename, "exec", flags=flags, dont_inherit=True)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(marshal.dumps(code))
+    _CODE[digest] = code
+    return code
+
+
+def entry_name(source: str, task_id: str) -> str:
+    """``solve_<id>`` if the block defines it, else its first top-level function."""
+    names = [node.name for node in ast.parse(source).body if isinstance(node, ast.FunctionDef)]
+    if not names:
+        raise ValueError(f"lambda block for {task_id} defines no function")
+    return f"solve_{task_id}" if f"solve_{task_id}" in names else names[0]
+
+
+def compile_lambda(task_id: str, cache_dir: Optional[Path] = CODE_CACHE_DIR) -> Callable[[Grid], Grid]:
+    """The bundle's lambda block as a callable bound to ``solution.py``'s helpers."""
+    md_path = TASKS_DIR / task_id / "abstractions.md"
+    source, _ = parse_lambda_block(md_path.read_text())
+    if not source:
+        raise LookupError(f"{md_path} has no Lambda Representation block")
+    namespace: Dict[str, Any] = dict(vars(load_module(task_id)))
+    exec(_compile(source, f"{md_path}#lambda", cache_dir), namespace)
+    return namespace[entry_name(source, task_id)]
+
+
+@dataclass
+class LambdaReport:
+    task_id: str
+    examples: int = 0
+    equivalent: int = 0
+    lambda_errors: int = 0
+    solver_seconds: float = 0.0
+    lambda_seconds: float = 0.0
+    first_mismatch: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def overhead(self) -> Optional[float]:
+        """Lambda time relative to the solver (0.05 = 5% slower)."""
+        if self.solver_seconds <= 0:
+            return None
+        return self.lambda_seconds / self.solver_seconds - 1.0
+
+
+def _timed(fn: Callable[[Grid], Grid], grid: Grid) -> Tuple[Grid, float]:
+    clear_all()
+    start = time.perf_counter()
+    out = fn(grid)
+    return out, time.perf_counter() - start
+
+
+def compare_task(
+    task_id: str,
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+    repeat: int = DEFAULT_REPEAT,
+) -> LambdaReport:
+    report = LambdaReport(task_id)
+    try:
+        lam = compile_lambda(task_id)
+    except (LookupError, ValueError, SyntaxError, KeyError) as exc:
+        report.error = repr(exc)
+        return report
+    solver = load_solver(task_id)
+    for split, idx, example in iter_examples(load_task(task_id, data_dir), splits):
+        grid = example["input"]
+        try:
+            expected, _ = _timed(solver, grid)
+        except Exception:  # noqa: BLE001 - nothing to compare against
+            continue
+        report.examples += 1
+        try:
+            actual, _ = _timed(lam, grid)
+            seconds = [0.0, 0.0]  # solver, lambda
+            for rep in range(repeat):
+                for side in ((0, 1) if rep % 2 == 0 else (1, 0)):
+                    seconds[side] += _timed((solver, lam)[side], grid)[1]
+        except Exception as exc:  # noqa: BLE001 - report and keep going
+            report.lambda_errors += 1
+            report.first_mismatch = report.first_mismatch or f"{split}[{idx}]: {exc!r}"
+            continue
+        report.solver_seconds += seconds[0] / repeat
+        report.lambda_seconds += seconds[1] / repeat
+        if actual == expected:
+            report.equivalent += 1
+        elif report.first_mismatch is None:
+            report.first_mismatch = f"{split}[{idx}]"
+    return report
+
+
+def render(report: LambdaReport) -> str:
+    if report.error is not None:
+        return f"{report.task_id}: skipped ({report.error})"
+    overhead = report.overhead
+    cost = "n/a" if overhead is None else f"{overhead:+.1%}"
+    line = f"{report.task_id}: {report.equivalent}/{report.examples} equivalent, overhead {cost}"
+    if report.lambda_errors:
+        line += f", {report.lambda_errors} lambda errors"
+    if report.first_mismatch:
+        line += f" (first mismatch {report.first_mismatch})"
+    return line
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run lambda representations against their solution.py.")
+    parser.add_argument("tasks", nargs="*", help="Task ids to compare (default: all bundles).")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--splits", nargs="+", default=list(SPLITS), choices=SPLITS)
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per example and implementation."
+    )
+    parser.add_argument("--json", type=Path, help="Also write the reports to this JSON file.")
+    args = parser.parse_args(argv)
+
+    reports: List[LambdaReport] = []
+    for task_id in args.tasks or task_ids():
+        try:
+            report = compare_task(task_id, args.data_dir, args.splits, args.repeat)
+        except FileNotFoundError:
+            continue
+        reports.append(report)
+        print(render(report))
+
+    if args.json is not None:
+        payload = [dict(asdict(r), overhead=r.overhead) for r in reports]
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    diverged = [r.task_id for r in reports if r.error is None and r.equivalent < r.examples]
+    if diverged:
+        print(f"lambda differs from solution.py: {' '.join(diverged)}")
+    return 1 if diverged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Pack task data into one memory-mapped binary file with an offset index.
+
+Parsing every ``<id>.json`` (and its ``<id>_arcgen.json`` sidecar) on each
+sweep dominates evaluation time once arc-gen data reaches thousands of
+examples per task.  ``pack`` converts the JSON once; :class:`PackedDataset`
+then ``mmap``\\ s the result and decodes a grid only when it is accessed, so a
+sweep touches just the bytes of the examples it visits.
+
+File layout (little-endian)::
+
+    header   magic b"ARCPACK\\0", u32 version, u64 index offset, u64 index size
+    grids    row-major uint8 cells, one block per grid, back to back
+    index    u32 name-table length, JSON {"tasks": [...], "splits": [...]},
+             then one record per example (see ``_RECORD``)
+
+Each record holds ``(task, split, example)`` and the offset and shape of the
+input and output grids; examples without a target carry ``NO_OUTPUT``.
+
+Usage::
+
+    python -m harness.packed build OUT.pack [task_id ...] [--data-dir DIR]
+    python -m harness.packed info OUT.pack
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .registry import SPLITS, Example, Grid, iter_examples, load_task, task_ids
+
+MAGIC = b"ARCPACK\0"
+VERSION = 1
+NO_OUTPUT = 2**64 - 1
+
+_HEADER = struct.Struct("<8sIQQ")
+# task, split, example, input offset, input h, input w, output offset, output h, output w
+_RECORD = struct.Struct("<IBIQHHQHH")
+_NAMES_LEN = struct.Struct("<I")
+
+
+def _encode(grid: Grid) -> Tuple[bytes, int, int]:
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    if any(len(row) != width for row in grid):
+        raise ValueError("cannot pack a ragged grid")
+    return bytes(value for row in grid for value in row), height, width
+
+
+def _write_grid(out: BinaryIO, grid: Grid) -> Tuple[int, int, int]:
+    payload, height, width = _encode(grid)
+    offset = out.tell()
+    out.write(payload)
+    return offset, height, width
+
+
+def pack(
+    tasks: Iterable[Tuple[str, Mapping[str, Sequence[Example]]]],
+    path: Path,
+    splits: Sequence[str] = SPLITS,
+) -> int:
+    """Write ``(task_id, task)`` pairs to ``path``; returns the example count."""
+    task_names: List[str] = []
+    records: List[bytes] = []
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+        for task_id, task in tasks:
+            task_idx = len(task_names)
+            task_names.append(task_id)
+            for split, idx, example in iter_examples(task, splits):
+                in_off, in_h, in_w = _write_grid(out, example["input"])
+                if "output" in example:
+                    out_off, out_h, out_w = _write_grid(out, example["output"])
+                else:
+                    out_off, out_h, out_w = NO_OUTPUT, 0, 0
+                records.append(
+                    _RECORD.pack(task_idx, splits.index(split), idx, in_off, in_h, in_w, out_off, out_h, out_w)
+                )
+        index_offset = out.tell()
+        names = json.dumps({"tasks": task_names, "splits": list(splits)}).encode()
+        out.write(_NAMES_LEN.pack(len(names)))
+        out.write(names)
+        out.write(b"".join(records))
+        index_size = out.tell() - index_offset
+        out.seek(0)
+        out.write(_HEADER.pack(MAGIC, VERSION, index_offset, index_size))
+    return len(records)
+
+
+class PackedExample(Mapping[str, Grid]):
+    """One example whose grids are decoded from the mapped file on access."""
+
+    __slots__ = ("_data", "_input", "_output")
+
+    def __init__(self, data: mmap.mmap, input_ref: Tuple[int, int, int], output_ref: Optional[Tuple[int, int, int]]):
+        self._data = data
+        self._input = input_ref
+        self._output = output_ref
+
+    def _decode(self, ref: Tuple[int, int, int]) -> Grid:
+        offset, height, width = ref
+        block = self._data[offset : offset + height * width]
+        return [list(block[r * width : (r + 1) * width]) for r in range(height)]
+
+    def __getitem__(self, key: str) -> Grid:
+        if key == "input":
+            return self._decode(self._input)
+        if key == "output" and self._output is not None:
+            return self._decode(self._output)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "input"
+        if self._output is not None:
+            yield "output"
+
+    def __len__(self) -> int:
+        return 1 if self._output is None else 2
+
+
+class PackedDataset:
+    """Read-only view of a packed file; only the index is parsed eagerly."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = path.open("rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_offset, index_size = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version-{VERSION} packed dataset")
+        (names_len,) = _NAMES_LEN.unpack_from(self._data, index_offset)
+        names_start = index_offset + _NAMES_LEN.size
+        names = json.loads(self._data[names_start : names_start + names_len])
+        self.splits: List[str] = names["splits"]
+        self._tasks: Dict[str, Dict[str, List[PackedExample]]] = {task_id: {} for task_id in names["tasks"]}
+        task_names: List[str] = names["tasks"]
+        records_start = names_start + names_len
+        records = self._data[records_start : index_offset + index_size]
+        for task_idx, split_idx, _, in_off, in_h, in_w, out_off, out_h, out_w in _RECORD.iter_unpack(records):
+            output_ref = None if out_off == NO_OUTPUT else (out_off, out_h, out_w)
+            example = PackedExample(self._data, (in_off, in_h, in_w), output_ref)
+            task = self._tasks[task_names[task_idx]]
+            task.setdefault(self.splits[split_idx], []).append(example)
+
+    def task_ids(self) -> List[str]:
+        return list(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def load_task(self, task_id: str) -> Dict[str, List[PackedExample]]:
+        """Same shape as ``registry.load_task``; grids decode lazily."""
+        try:
+            return self._tasks[task_id]
+        except KeyError:
+            raise FileNotFoundError(f"{task_id} is not in {self.path}") from None
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackedDataset":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _iter_json_tasks(selected: Sequence[str], data_dir: Optional[Path]) -> Iterator[Tuple[str, Dict[str, List[Example]]]]:
+    for task_id in selected:
+        try:
+            yield task_id, load_task(task_id, data_dir)
+        except FileNotFoundError:
+            print(f"skipping {task_id}: no task data", file=sys.stderr)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Build or inspect a packed ARC dataset file.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Pack task JSON into one binary file.")
+    build.add_argument("output", type=Path)
+    build.add_argument("tasks", nargs="*", help="Task ids to pack (default: all bundles).")
+    build.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    info = sub.add_parser("info", help="Summarise a packed file.")
+    info.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = pack(_iter_json_tasks(args.tasks or task_ids(), args.data_dir), args.output)
+        print(f"packed {count} examples into {args.output} ({args.output.stat().st_size} bytes)")
+        return 0
+
+    with PackedDataset(args.path) as dataset:
+        for task_id in dataset.task_ids():
+            task = dataset.load_task(task_id)
+            counts = ", ".join(f"{split}={len(task[split])}" for split in dataset.splits if split in task)
+            print(f"{task_id}: {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
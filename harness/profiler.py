@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Profile solvers per typed operation, as declared in each ``abstractions.md``.
+
+The "DSL Structure" section of a bundle's ``abstractions.md`` names the typed
+operations its solver is built from (e.g. ``collectSegments`` and
+``repeatSegments`` for 1ae2feb7).  This tool parses those declarations with
+``dsl/check_lambda_types.py``, temporarily replaces the same-named functions
+in the loaded ``solution.py`` with timing wrappers, runs the solver on the
+task's examples, and restores the originals -- no solver source is edited.
+
+Per operation it records call count, cumulative time, self time (excluding
+nested typed operations) and, with ``--memory``, net bytes allocated
+(``tracemalloc``).  Results are aggregated by call path and printed as an
+indented tree; ``--folded`` additionally writes folded stacks
+(``solve;opA;opB <self-microseconds>``) for flame-graph viewers.
+
+Usage: ``python -m harness.profiler 1ae2feb7 [--memory] [--folded out.txt]``
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .registry import REPO_ROOT, SPLITS, TASKS_DIR, iter_examples, load_module, load_task, task_ids
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from dsl.check_lambda_types import parse_typed_operations  # noqa: E402
+
+Path_ = Tuple[str, ...]
+
+
+@dataclass
+class OpStats:
+    calls: int = 0
+    cumulative: float = 0.0
+    self_time: float = 0.0
+    allocated: int = 0
+
+
+@dataclass
+class _Frame:
+    start: float
+    mem_start: int
+    child_time: float = 0.0
+    child_mem: int = 0
+
+
+@dataclass
+class Profile:
+    task_id: str
+    operations: List[str]
+    by_path: Dict[Path_, OpStats] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+    def by_operation(self) -> Dict[str, OpStats]:
+        """Totals per operation name; cumulative time counts outermost calls only."""
+        totals: Dict[str, OpStats] = {}
+        for path, stats in self.by_path.items():
+            name = path[-1]
+            agg = totals.setdefault(name, OpStats())
+            agg.calls += stats.calls
+            agg.self_time += stats.self_time
+            agg.allocated += stats.allocated
+            if name not in path[:-1]:
+                agg.cumulative += stats.cumulative
+        return totals
+
+
+class _Recorder:
+    def __init__(self, profile: Profile, memory: bool) -> None:
+        self.profile = profile
+        self.memory = memory
+        self.stack: List[Tuple[str, _Frame]] = []
+
+    def _mem(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.memory else 0
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            frame = _Frame(time.perf_counter(), self._mem())
+            self.stack.append((name, frame))
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - frame.start
+                allocated = self._mem() - frame.mem_start
+                path = tuple(entry for entry, _ in self.stack)
+                self.stack.pop()
+                stats = self.profile.by_path.setdefault(path, OpStats())
+                stats.calls += 1
+                stats.cumulative += elapsed
+                stats.self_time += elapsed - frame.child_time
+                stats.allocated += allocated - frame.child_mem
+                if self.stack:
+                    parent = self.stack[-1][1]
+                    parent.child_time += elapsed
+                    parent.child_mem += allocated
+
+        return wrapper
+
+
+def declared_operations(task_id: str) -> List[str]:
+    doc = TASKS_DIR / task_id / "abstractions.md"
+    if not doc.exists():
+        return []
+    typed_ops, _ = parse_typed_operations(doc.read_text())
+    return sorted(typed_ops)
+
+
+def profile_task(
+    task_id: str,
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+    memory: bool = False,
+    repeat: int = 1,
+) -> Profile:
+    module: ModuleType = load_module(task_id)
+    entry = f"solve_{task_id}"
+    operations = declared_operations(task_id)
+    profile = Profile(task_id, operations)
+    recorder = _Recorder(profile, memory)
+
+    originals: Dict[str, Any] = {}
+    for name in [entry] + operations:
+        if name in originals:
+            continue
+        fn = getattr(module, name, None)
+        if not callable(fn):
+            profile.missing.append(name)
+            continue
+        originals[name] = fn
+    task = load_task(task_id, data_dir)
+
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        # Module globals are looked up at call time, so helpers calling each
+        # other by name go through the wrappers too.
+        for name, fn in originals.items():
+            setattr(module, name, recorder.wrap(name, fn))
+        solver = getattr(module, entry)
+        for _ in range(repeat):
+            for _, _, example in iter_examples(task, splits):
+                try:
+                    solver(example["input"])
+                except Exception:  # noqa: BLE001 - failures still yield timings
+                    recorder.stack.clear()
+    finally:
+        for name, fn in originals.items():
+            setattr(module, name, fn)
+        if started_tracing:
+            tracemalloc.stop()
+    return profile
+
+
+def _fmt_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f}{unit}"
+        n /= 1024  # type: ignore[assignment]
+    return f"{n:.1f}GiB"
+
+
+def render_tree(profile: Profile, memory: bool = False) -> str:
+    lines = [f"== {profile.task_id} =="]
+    if not profile.by_path:
+        lines.append("  (no calls recorded)")
+        return "\n".join(lines)
+    roots = [path for path in profile.by_path if len(path) == 1]
+    total = sum(profile.by_path[path].cumulative for path in roots) or 1e-12
+
+    def emit(path: Path_) -> None:
+        stats = profile.by_path[path]
+        indent = "  " * len(path)
+        line = (
+            f"{indent}{path[-1]:<{max(1, 40 - len(indent))}} calls={stats.calls:<6} "
+            f"cum={stats.cumulative * 1e3:9.3f}ms self={stats.self_time * 1e3:9.3f}ms "
+            f"({100 * stats.cumulative / total:5.1f}%)"
+        )
+        if memory:
+            line += f" alloc={_fmt_bytes(stats.allocated)}"
+        lines.append(line)
+        children = [p for p in profile.by_path if len(p) == len(path) + 1 and p[: len(path)] == path]
+        for child in sorted(children, key=lambda p: -profile.by_path[p].cumulative):
+            emit(child)
+
+    for root in sorted(roots, key=lambda p: -profile.by_path[p].cumulative):
+        emit(root)
+    ops = profile.by_operation()
+    dominant = max((name for name in ops if name != f"solve_{profile.task_id}"),
+                   key=lambda name: ops[name].self_time, default=None)
+    if dominant is not None:
+        lines.append(f"  dominant typed operation (self time): {dominant}")
+    if profile.missing:
+        lines.append(f"  declared but not found in solution.py: {', '.join(profile.missing)}")
+    return "\n".join(lines)
+
+
+def folded_stacks(profile: Profile) -> List[str]:
+    return [
+        f"{profile.task_id};{';'.join(path)} {int(stats.self_time * 1e6)}"
+        for path, stats in sorted(profile.by_path.items())
+    ]
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Profile solvers per declared typed operation.")
+    parser.add_argument("tasks", nargs="*", help="Task ids (default: all bundles with task data).")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--splits", nargs="+", default=list(SPLITS), choices=SPLITS)
+    parser.add_argument("--memory", action="store_true", help="Record net allocations with tracemalloc.")
+    parser.add_argument("--repeat", type=int, default=1, help="Run each example this many times.")
+    parser.add_argument("--folded", type=Path, help="Write folded stacks for flame-graph tools.")
+    args = parser.parse_args(argv)
+
+    folded: List[str] = []
+    for task_id in args.tasks or task_ids():
+        try:
+            profile = profile_task(task_id, args.data_dir, args.splits, args.memory, args.repeat)
+        except FileNotFoundError:
+            print(f"== {task_id} ==\n  no task data", file=sys.stderr)
+            continue
+        print(render_tree(profile, args.memory))
+        print()
+        folded.extend(folded_stacks(profile))
+
+    if args.folded is not None:
+        args.folded.write_text("\n".join(folded) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,320 @@
+"""Solver registry: locate, load, and invoke the per-task solvers.
+
+Solvers live in ``tasks/<id>/solution.py`` and export ``solve_<id>(grid)``.
+Because task ids start with digits they cannot be imported as regular
+modules, so the registry loads them with ``importlib`` by file path and keeps
+one module object per task.
+
+Solvers may opt into batch evaluation (:func:`solve_many`) by exposing a
+split form next to ``solve_<id>``:
+
+- ``prepare_<id>()`` computes grid-independent state once (training
+  features, template tables, ...);
+- ``apply_<id>(prepared, grid)`` solves one grid using that state.
+
+A solver may define ``prepare_<id>`` alone to warm module-level caches; the
+batch then calls ``solve_<id>`` per grid.  Without either hook, the batch
+simply maps ``solve_<id>`` over the grids.
+
+Task data follows the ARC JSON layout (``{"train": [...], "test": [...],
+"arc-gen": [...]}``).  Bundles historically looked for it in a few places, so
+:func:`find_task_file` checks them in order; ``<id>_arcgen.json`` sidecars are
+merged in as the ``arc-gen`` split.
+"""
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.util
+import json
+import multiprocessing as mp
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar, Union
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TASKS_DIR = REPO_ROOT / "tasks"
+SPLITS: Tuple[str, ...] = ("train", "test", "arc-gen")
+
+Grid = List[List[int]]
+Solver = Callable[[Grid], Grid]
+Example = Dict[str, Grid]
+# Any example mapping: parsed JSON dicts or lazily decoded packed examples.
+E = TypeVar("E", bound=Mapping[str, Grid])
+
+_MODULES: Dict[str, ModuleType] = {}
+# prepare_<id>() results, valid for the module object currently in _MODULES.
+_PREPARED: Dict[str, Any] = {}
+
+
+def task_ids(root: Path = TASKS_DIR) -> List[str]:
+    return sorted(p.name for p in root.iterdir() if (p / "solution.py").exists())
+
+
+def solver_path(task_id: str) -> Path:
+    return TASKS_DIR / task_id / "solution.py"
+
+
+def _local_imports(path: Path) -> List[Path]:
+    """Repo-local modules (e.g. ``compdsl.rays``) imported by the file at ``path``."""
+    found: List[Path] = []
+    package = path.parent.relative_to(REPO_ROOT).parts
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = list(package[: len(package) - node.level + 1]) if node.level else []
+            module = base + (node.module.split(".") if node.module else [])
+            names = [".".join(module + [alias.name]) for alias in node.names] + [".".join(module)]
+        else:
+            continue
+        for name in names:
+            parts = name.split(".")
+            for candidate in (REPO_ROOT.joinpath(*parts).with_suffix(".py"), REPO_ROOT.joinpath(*parts, "__init__.py")):
+                if parts[0] != "tasks" and candidate.is_file():
+                    found.append(candidate)
+    return found
+
+
+def solver_sources(task_id: str) -> List[Path]:
+    """The solver's ``solution.py`` and the repo modules it imports (transitively), sorted."""
+    seen: Set[Path] = set()
+    pending = [solver_path(task_id)]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        pending.extend(_local_imports(path))
+    return sorted(seen)
+
+
+def sources_hash(paths: Sequence[Path]) -> str:
+    """Hash of the files' repo-relative names and contents; with
+    :func:`solver_sources` it changes whenever ``solution.py`` or one of the
+    ``compdsl`` modules it depends on is edited."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path.relative_to(REPO_ROOT)).encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def grid_hash(grid: Grid) -> str:
+    """Canonical content hash of a grid (shape and cell values only)."""
+    payload = json.dumps(grid, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+def load_module(task_id: str, reload: bool = False) -> ModuleType:
+    if not reload and task_id in _MODULES:
+        return _MODULES[task_id]
+    path = solver_path(task_id)
+    if not path.exists():
+        raise FileNotFoundError(f"No solver for task {task_id}: {path}")
+    # Shared helper packages (e.g. ``compdsl``) are imported relative to the repo root.
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(f"solution_{task_id}", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution so dataclasses can resolve the module's namespace.
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    _MODULES[task_id] = module
+    _PREPARED.pop(task_id, None)
+    return module
+
+
+def supported_backends(task_id: str) -> Tuple[str, ...]:
+    """Primitive backends the solver declares via ``BACKENDS`` (default: python only)."""
+    return tuple(getattr(load_module(task_id), "BACKENDS", ("python",)))
+
+
+def load_solver(task_id: str, backend: str = "python") -> Solver:
+    """The task's solver; with another ``backend`` (see ``compdsl.primitives``) it
+    runs under that backend and converts the grid once on entry and exit."""
+    module = load_module(task_id)
+    solver = getattr(module, f"solve_{task_id}", None)
+    if solver is None:
+        raise AttributeError(f"{solver_path(task_id)} does not define solve_{task_id}")
+    if backend == "python":
+        return solver
+    if backend not in supported_backends(task_id):
+        raise ValueError(f"solve_{task_id} does not support the {backend!r} backend")
+    from compdsl.primitives import using_backend
+
+    def run(grid: Grid) -> Grid:
+        with using_backend(backend) as impl:
+            return impl.to_lists(solver(impl.from_lists(grid)))
+
+    return run
+
+
+def solve(task_id: str, grid: Grid) -> Grid:
+    return load_solver(task_id)(grid)
+
+
+def batch_solver(task_id: str) -> Solver:
+    """A per-grid solver with the task's ``prepare_<id>`` hook already applied."""
+    module = load_module(task_id)
+    prepare = getattr(module, f"prepare_{task_id}", None)
+    apply = getattr(module, f"apply_{task_id}", None)
+    if prepare is not None and task_id not in _PREPARED:
+        _PREPARED[task_id] = prepare()
+    if apply is not None:
+        if prepare is None:
+            raise AttributeError(f"{solver_path(task_id)} defines apply_{task_id} without prepare_{task_id}")
+        prepared = _PREPARED[task_id]
+        return lambda grid: apply(prepared, grid)
+    return load_solver(task_id)
+
+
+_WORKER_SOLVER: Optional[Solver] = None
+
+
+def _init_batch_worker(task_id: str) -> None:
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = batch_solver(task_id)
+
+
+def _solve_in_worker(grid: Grid) -> Grid:
+    assert _WORKER_SOLVER is not None
+    return _WORKER_SOLVER(grid)
+
+
+def solve_many(
+    task_id: str,
+    grids: Sequence[Grid],
+    executor: Optional[str] = None,
+    workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Union[Grid, BaseException]]:
+    """Solve several grids of one task, preparing shared state once.
+
+    ``executor`` is ``None`` (serial), ``"thread"`` or ``"process"``.  Process
+    workers each load the solver and run ``prepare_<id>`` once in their
+    initializer.  Outputs are returned in input order; with
+    ``return_exceptions`` a failing grid yields its exception instead of
+    aborting the batch.
+    """
+    if executor not in (None, "thread", "process"):
+        raise ValueError(f"unknown executor: {executor!r}")
+
+    def guarded(fn: Solver) -> Callable[[Grid], Union[Grid, BaseException]]:
+        if not return_exceptions:
+            return fn
+
+        def call(grid: Grid) -> Union[Grid, BaseException]:
+            try:
+                return fn(grid)
+            except Exception as exc:  # noqa: BLE001 - returned to the caller
+                return exc
+
+        return call
+
+    if executor is None or len(grids) <= 1:
+        run = guarded(batch_solver(task_id))
+        return [run(grid) for grid in grids]
+
+    pool: Executor
+    if executor == "thread":
+        run = guarded(batch_solver(task_id))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, grids))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_batch_worker,
+        initargs=(task_id,),
+    ) as pool:
+        futures = [pool.submit(_solve_in_worker, grid) for grid in grids]
+        results: List[Union[Grid, BaseException]] = []
+        for future in futures:
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+            elif return_exceptions:
+                results.append(exc)
+            else:
+                raise exc
+        return results
+
+
+def find_task_file(task_id: str, data_dir: Optional[Path] = None) -> Optional[Path]:
+    candidates: List[Path] = []
+    if data_dir is not None:
+        candidates.append(data_dir / f"{task_id}.json")
+    candidates.extend(
+        [
+            TASKS_DIR / task_id / "task.json",
+            REPO_ROOT / "arc2_samples" / f"{task_id}.json",
+            TASKS_DIR / "arc2_samples" / f"{task_id}.json",
+            TASKS_DIR / task_id / "arc2_samples" / f"{task_id}.json",
+        ]
+    )
+    for path in candidates:
+        if path.exists():
+            return path
+    return None
+
+
+def find_arcgen_file(task_file: Path, task_id: str) -> Optional[Path]:
+    path = task_file.with_name(f"{task_id}_arcgen.json")
+    return path if path.exists() else None
+
+
+def load_task(task_id: str, data_dir: Optional[Path] = None, arcgen: bool = True) -> Dict[str, List[Example]]:
+    """Parse the task file; ``arcgen=False`` skips the sidecar (see :func:`iter_arcgen_examples`)."""
+    task_file = find_task_file(task_id, data_dir)
+    if task_file is None:
+        raise FileNotFoundError(f"No task data found for {task_id}")
+    task = json.loads(task_file.read_text())
+    arcgen_file = find_arcgen_file(task_file, task_id) if arcgen else None
+    if arcgen_file is not None and not task.get("arc-gen"):
+        # Sidecars store their examples under "train", as in 16de56c4/221dfab4.
+        task["arc-gen"] = json.loads(arcgen_file.read_text()).get("train", [])
+    return task
+
+
+def iter_arcgen_examples(
+    task_id: str,
+    data_dir: Optional[Path] = None,
+    shard: Tuple[int, int] = (0, 1),
+) -> Iterator[Tuple[int, Example]]:
+    """Stream ``(index, example)`` for the arc-gen split, keeping every ``k``-th of ``shard=(i, k)``.
+
+    Sidecar files are parsed incrementally (``harness.stream``); arc-gen
+    examples stored inline in the task file are sliced from the parsed task.
+    """
+    from .stream import iter_arcgen
+
+    task_file = find_task_file(task_id, data_dir)
+    if task_file is None:
+        raise FileNotFoundError(f"No task data found for {task_id}")
+    first, step = shard
+    inline = load_task(task_id, data_dir, arcgen=False).get("arc-gen")
+    arcgen_file = find_arcgen_file(task_file, task_id)
+    if inline or arcgen_file is None:
+        examples: Iterator[Example] = iter((inline or [])[first::step])
+    else:
+        examples = iter_arcgen(arcgen_file, shard)
+    for pos, example in enumerate(examples):
+        yield first + pos * step, example
+
+
+def iter_examples(
+    task: Mapping[str, Sequence[E]],
+    splits: Sequence[str] = SPLITS,
+) -> Iterator[Tuple[str, int, E]]:
+    """Yield ``(split, index, example)`` in the order ``evaluate`` visits them."""
+    for split in splits:
+        for idx, example in enumerate(task.get(split, [])):
+            yield split, idx, example
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""Deterministic per-split evaluation report: correctness, latency percentiles, peak RSS.
+
+Each task is evaluated with ``harness.evaluate.evaluate_task`` -- the same
+example iteration ``abstractions.py::evaluate`` performs -- in a fresh
+spawned process, so the peak resident set size (``ru_maxrss``) reported for
+a task is that of the process which loaded and ran only its solver.  The
+solver is loaded before timing starts.  Per split the report gives example
+counts, matches, errors, and p50/p95/max latency (nearest-rank percentiles).
+
+The JSON report has sorted keys, fixed rounding, tasks in id order, and
+environment details (commit, Python, platform) kept under ``meta``, so two
+reports diff cleanly across commits.  The Markdown summary lists identity
+baselines (``check_consistency.detect_identity_solver``) in their own
+section, apart from the solver totals.  ``--baseline OLD.json`` adds the
+tasks whose matches changed or whose p95 latency moved beyond
+``--latency-ratio``.
+
+Usage: ``python -m harness.report [task_id ...] [--data-dir DIR] [--json OUT] [--markdown OUT] [--baseline OLD.json]``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing as mp
+import platform
+import subprocess
+import sys
+from dataclasses import asdict
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+from .evaluate import ExampleResult, Runner, backend_runner, direct_runner, evaluate_task
+from .packed import PackedDataset
+from .registry import REPO_ROOT, SPLITS, load_solver, solver_path, task_ids
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from check_consistency import detect_identity_solver  # noqa: E402
+
+REPORT_VERSION = 1
+PERCENTILES = (50, 95)
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1e3, 3)
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS, KiB elsewhere
+
+
+def latency_stats(results: Sequence[ExampleResult]) -> Dict[str, Optional[float]]:
+    """p50/p95/max milliseconds over the examples that finished."""
+    seconds = [r.seconds for r in results if r.status == "ok"]
+    stats = {f"p{pct}_ms": _ms(percentile(seconds, pct)) for pct in PERCENTILES}
+    stats["max_ms"] = _ms(max(seconds)) if seconds else None
+    return stats
+
+
+def split_stats(results: Sequence[ExampleResult]) -> Dict[str, Any]:
+    scored = [r for r in results if r.correct is not None]
+    statuses: Dict[str, int] = {}
+    for r in results:
+        if r.status != "ok":
+            statuses[r.status] = statuses.get(r.status, 0) + 1
+    stats: Dict[str, Any] = {
+        "examples": len(results),
+        "scored": len(scored),
+        "correct": sum(1 for r in scored if r.correct),
+        "first_failure": next((r.index for r in scored if not r.correct), None),
+        "statuses": statuses,
+    }
+    stats.update(latency_stats(results))
+    return stats
+
+
+def task_entry(results: Sequence[ExampleResult], peak_rss_kb: Optional[int], identity: bool) -> Dict[str, Any]:
+    return {
+        "identity": identity,
+        "peak_rss_kb": peak_rss_kb,
+        "latency": latency_stats(results),
+        "splits": {
+            split: split_stats([r for r in results if r.split == split])
+            for split in SPLITS
+            if any(r.split == split for r in results)
+        },
+    }
+
+
+def _measure(
+    task_id: str,
+    data_dir: Optional[Path],
+    splits: Sequence[str],
+    packed: Optional[Path],
+    backend: str,
+) -> Tuple[List[ExampleResult], Optional[int]]:
+    runner: Runner = direct_runner if backend == "python" else backend_runner(backend)
+    load_solver(task_id)  # import cost stays out of the first example's latency
+    dataset = PackedDataset(packed) if packed is not None else None
+    try:
+        results = evaluate_task(task_id, runner, data_dir, splits, dataset)
+    finally:
+        if dataset is not None:
+            dataset.close()
+    return results, _peak_rss_kb()
+
+
+def _measure_in_child(conn: Connection, *args: Any) -> None:
+    try:
+        results, peak = _measure(*args)
+        conn.send(("ok", [asdict(r) for r in results], peak))
+    except FileNotFoundError as exc:
+        conn.send(("missing", None, str(exc)))
+    except Exception as exc:  # noqa: BLE001 - reported to the parent
+        conn.send(("error", None, repr(exc)))
+    finally:
+        conn.close()
+
+
+def measure_task(
+    task_id: str,
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+    packed: Optional[Path] = None,
+    backend: str = "python",
+    isolate: bool = True,
+    timeout: Optional[float] = None,
+) -> Tuple[str, Optional[List[ExampleResult]], Any]:
+    """``(status, results, peak_rss_kb or error)``; status is ok, missing, error, or timeout."""
+    args = (task_id, data_dir, splits, packed, backend)
+    if not isolate:
+        try:
+            results, _ = _measure(*args)
+        except FileNotFoundError as exc:
+            return "missing", None, str(exc)
+        except Exception as exc:  # noqa: BLE001 - recorded like a failed worker
+            return "error", None, repr(exc)
+        return "ok", results, None  # a shared process has no per-task peak
+    ctx = mp.get_context("spawn")
+    conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_measure_in_child, args=(child_conn,) + args, daemon=True)
+    process.start()
+    child_conn.close()
+    try:
+        if not conn.poll(timeout):
+            process.kill()
+            return "timeout", None, f"exceeded {timeout}s"
+        status, payload, extra = conn.recv()
+    except EOFError:
+        process.join()
+        return "error", None, f"worker exited with code {process.exitcode}"
+    finally:
+        process.join()
+        conn.close()
+    if payload is None:
+        return status, None, extra
+    return status, [ExampleResult(**row) for row in payload], extra
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform()}
+
+
+def _totals(entries: Dict[str, Dict[str, Any]], raw: Dict[str, List[ExampleResult]]) -> Dict[str, Any]:
+    merged: List[ExampleResult] = [r for tid in sorted(entries) for r in raw.get(tid, [])]
+    return {
+        "tasks": len(entries),
+        "splits": {
+            split: _without_first_failure(split_stats([r for r in merged if r.split == split]))
+            for split in SPLITS
+            if any(r.split == split for r in merged)
+        },
+    }
+
+
+def _without_first_failure(stats: Dict[str, Any]) -> Dict[str, Any]:
+    # Example indices are per task, so a first failure across tasks means nothing.
+    del stats["first_failure"]
+    return stats
+
+
+def build_report(
+    tasks: Sequence[str],
+    data_dir: Optional[Path] = None,
+    splits: Sequence[str] = SPLITS,
+    packed: Optional[Path] = None,
+    backend: str = "python",
+    isolate: bool = True,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    entries: Dict[str, Dict[str, Any]] = {}
+    raw: Dict[str, List[ExampleResult]] = {}
+    missing: List[str] = []
+    failed: Dict[str, str] = {}
+    for task_id in sorted(tasks):
+        status, results, extra = measure_task(task_id, data_dir, splits, packed, backend, isolate, timeout)
+        if status == "missing":
+            missing.append(task_id)
+            continue
+        if results is None:
+            failed[task_id] = f"{status}: {extra}"
+            continue
+        raw[task_id] = results
+        entries[task_id] = task_entry(results, extra, detect_identity_solver(solver_path(task_id)))
+    solvers = {tid: e for tid, e in entries.items() if not e["identity"]}
+    baselines = {tid: e for tid, e in entries.items() if e["identity"]}
+    return {
+        "version": REPORT_VERSION,
+        "meta": dict(_environment(), backend=backend, isolated=isolate, splits=list(splits)),
+        "tasks": entries,
+        "totals": {"solvers": _totals(solvers, raw), "identity_baselines": _totals(baselines, raw)},
+        "missing": missing,
+        "failed": failed,
+    }
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], latency_ratio: float = 1.5) -> List[str]:
+    """Human-readable changes in matches and p95 latency between two reports."""
+    changes: List[str] = []
+    for tid in sorted(set(old["tasks"]) | set(new["tasks"])):
+        before, after = old["tasks"].get(tid), new["tasks"].get(tid)
+        if before is None or after is None:
+            changes.append(f"{tid}: {'added' if before is None else 'removed'}")
+            continue
+        for split in SPLITS:
+            a, b = before["splits"].get(split), after["splits"].get(split)
+            if a is None or b is None:
+                continue
+            if (a["correct"], a["scored"]) != (b["correct"], b["scored"]):
+                changes.append(f"{tid} {split}: {a['correct']}/{a['scored']} -> {b['correct']}/{b['scored']}")
+            if a["p95_ms"] and b["p95_ms"]:
+                ratio = b["p95_ms"] / a["p95_ms"]
+                if ratio >= latency_ratio or ratio <= 1 / latency_ratio:
+                    changes.append(f"{tid} {split}: p95 {a['p95_ms']}ms -> {b['p95_ms']}ms ({ratio:.2f}x)")
+    return changes
+
+
+def _cell(value: Any) -> str:
+    return "-" if value is None else str(value)
+
+
+def _task_rows(entries: Dict[str, Dict[str, Any]], splits: Sequence[str]) -> List[str]:
+    # Latency columns cover all of the task's examples; per-split figures are in the JSON.
+    header = "| task | " + " | ".join(splits) + " | p50 ms | p95 ms | max ms | peak RSS MiB |"
+    rows = [header, "|" + "---|" * (len(splits) + 5)]
+    for tid in sorted(entries):
+        entry = entries[tid]
+        scores = []
+        for split in splits:
+            stats = entry["splits"].get(split)
+            if stats is None:
+                scores.append("-")
+                continue
+            score = f"{stats['correct']}/{stats['scored']}" if stats["scored"] else f"{stats['examples']} (no targets)"
+            if stats["statuses"]:
+                score += " " + ", ".join(f"{n} {s}" for s, n in sorted(stats["statuses"].items()))
+            scores.append(score)
+        lat = [_cell(entry["latency"][k]) for k in ("p50_ms", "p95_ms", "max_ms")]
+        rss = entry["peak_rss_kb"]
+        rows.append(f"| {tid} | " + " | ".join(scores + lat) + f" | {_cell(None if rss is None else round(rss / 1024, 1))} |")
+    return rows
+
+
+def _totals_rows(totals: Dict[str, Any]) -> List[str]:
+    rows = ["| split | examples | correct/scored | errors | p50 ms | p95 ms | max ms |", "|---|---|---|---|---|---|---|"]
+    for split, stats in totals["splits"].items():
+        errors = sum(stats["statuses"].values())
+        rows.append(
+            f"| {split} | {stats['examples']} | {stats['correct']}/{stats['scored']} | {errors} | "
+            f"{_cell(stats['p50_ms'])} | {_cell(stats['p95_ms'])} | {_cell(stats['max_ms'])} |"
+        )
+    return rows
+
+
+def render_markdown(report: Dict[str, Any], changes: Optional[List[str]] = None) -> str:
+    meta = report["meta"]
+    splits = meta["splits"]
+    solvers = {tid: e for tid, e in report["tasks"].items() if not e["identity"]}
+    baselines = {tid: e for tid, e in report["tasks"].items() if e["identity"]}
+    lines = [
+        "# Evaluation report",
+        "",
+        f"Commit `{meta['commit'] or 'unknown'}`, Python {meta['python']}, backend `{meta['backend']}`"
+        + ("" if meta["isolated"] else ", not isolated (no per-task RSS)"),
+        "",
+        f"## Solvers ({len(solvers)} tasks)",
+        "",
+        *_totals_rows(report["totals"]["solvers"]),
+        "",
+        f"## Identity baselines ({len(baselines)} tasks)",
+        "",
+        *_totals_rows(report["totals"]["identity_baselines"]),
+        "",
+    ]
+    if baselines:
+        lines += _task_rows(baselines, splits) + [""]
+    if changes is not None:
+        lines += ["## Changes vs baseline", ""] + ([f"- {c}" for c in changes] or ["- none"]) + [""]
+    if report["failed"]:
+        lines += ["## Failed runs", ""] + [f"- {tid}: {why}" for tid, why in sorted(report["failed"].items())] + [""]
+    if report["missing"]:
+        lines += [f"No task data for {len(report['missing'])} tasks: {' '.join(report['missing'])}", ""]
+    lines += ["## Per task", "", *_task_rows(solvers, splits), ""]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Write a per-split correctness and latency report.")
+    parser.add_argument("tasks", nargs="*", help="Task ids to evaluate (default: all bundles).")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--packed", type=Path, help="Read examples from a packed dataset file instead of JSON.")
+    parser.add_argument("--splits", nargs="+", default=list(SPLITS), choices=SPLITS)
+    parser.add_argument("--backend", choices=("python", "numpy", "auto"), default="python")
+    parser.add_argument("--no-isolate", dest="isolate", action="store_false",
+                        help="Run every task in this process (faster; no per-task peak RSS).")
+    parser.add_argument("--timeout", type=float, help="Wall-clock limit per task when isolated.")
+    parser.add_argument("--json", type=Path, help="Write the JSON report here.")
+    parser.add_argument("--markdown", type=Path, help="Write the Markdown summary here (default: stdout).")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against.")
+    parser.add_argument("--latency-ratio", type=float, default=1.5, help="p95 change reported against --baseline.")
+    args = parser.parse_args(argv)
+
+    report = build_report(
+        args.tasks or task_ids(), args.data_dir, args.splits, args.packed, args.backend, args.isolate, args.timeout
+    )
+    changes = None
+    if args.baseline is not None:
+        changes = compare(json.loads(args.baseline.read_text()), report, args.latency_ratio)
+    markdown = render_markdown(report, changes)
+    if args.markdown is not None:
+        args.markdown.write_text(markdown)
+    else:
+        print(markdown)
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=1, sort_keys=True) + "\n")
+    wrong = any(
+        stats["correct"] < stats["scored"]
+        for entry in report["tasks"].values()
+        if not entry["identity"]
+        for stats in entry["splits"].values()
+    )
+    return 1 if wrong or report["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
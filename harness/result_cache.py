@@ -0,0 +1,242 @@
+"""Persistent memo of solver outputs for repeated evaluation sweeps.
+
+Entries are keyed by ``(task_id, grid_hash, source_hash, backend)``: the
+task, the canonical hash of the input grid, the hash of the task's
+``solution.py`` and the ``compdsl`` modules it imports, and the primitive
+backend the outputs came from (for ``auto`` including a hash of the dispatch
+table it read), so each backend's outputs are computed and checked on their
+own.  Editing a solver, or a module it imports, changes its key and the old
+entries are purged the next time that task is looked up, so only affected
+tasks re-execute.
+
+The store is a single SQLite file bounded by entry count and payload bytes;
+when either bound is exceeded the least recently used entries are evicted.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .registry import REPO_ROOT, Grid, grid_hash, load_solver, solver_sources, sources_hash, supported_backends
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from compdsl.primitives import dispatch_path  # noqa: E402
+
+DEFAULT_CACHE_PATH = REPO_ROOT / ".cache" / "results.sqlite"
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SCHEMA_VERSION = 2  # stored as PRAGMA user_version; older result tables are dropped
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    task_id     TEXT NOT NULL,
+    grid_hash   TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    backend     TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    last_used   REAL NOT NULL,
+    PRIMARY KEY (task_id, grid_hash, source_hash, backend)
+);
+CREATE INDEX IF NOT EXISTS results_lru ON results (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def backend_key(backend: str) -> str:
+    """``backend`` as stored in the cache key; ``auto`` also names the dispatch table it reads."""
+    if backend != "auto":
+        return backend
+    path = dispatch_path()
+    table = path.read_bytes() if path.exists() else b""
+    return f"auto:{hashlib.sha256(table).hexdigest()[:16]}"
+
+
+def _stamps(paths: List[Path]) -> List[Tuple[int, int]]:
+    stamps = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stamps.append((-1, -1))
+            continue
+        stamps.append((st.st_mtime_ns, st.st_size))
+    return stamps
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class ResultCache:
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backend: str = "python",
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.backend_key = backend_key(backend)
+        self.stats = CacheStats()
+        # Sweeps may look entries up from several threads; a lock serialises DB access.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS results")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        if backend == "auto":  # outputs computed under an older dispatch table
+            self._conn.execute(
+                "DELETE FROM results WHERE backend LIKE 'auto:%' AND backend != ?", (self.backend_key,)
+            )
+        # task_id -> (source files, their (mtime_ns, size) stamps, source_hash);
+        # avoids rehashing while none of the files has changed.
+        self._sources: Dict[str, Tuple[List[Path], List[Tuple[int, int]], str]] = {}
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def source_hash(self, task_id: str) -> str:
+        with self._lock:
+            return self._source_hash(task_id)
+
+    def _source_hash(self, task_id: str) -> str:
+        known = self._sources.get(task_id)
+        if known is not None and _stamps(known[0]) == known[1]:
+            return known[2]
+        # A changed solution.py may import other modules, so re-resolve the files.
+        paths = solver_sources(task_id)
+        stamps = _stamps(paths)
+        digest = sources_hash(paths)
+        if known is None or known[2] != digest:
+            self._purge_stale(task_id, digest)
+        self._sources[task_id] = (paths, stamps, digest)
+        return digest
+
+    def _purge_stale(self, task_id: str, current: str) -> None:
+        cur = self._conn.execute(
+            "DELETE FROM results WHERE task_id = ? AND source_hash != ?", (task_id, current)
+        )
+        self.stats.invalidations += cur.rowcount
+
+    def get(self, task_id: str, grid: Grid) -> Optional[Grid]:
+        digest = grid_hash(grid)
+        with self._lock:
+            key = (task_id, digest, self._source_hash(task_id), self.backend_key)
+            row = self._conn.execute(
+                "SELECT payload FROM results"
+                " WHERE task_id = ? AND grid_hash = ? AND source_hash = ? AND backend = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._conn.execute(
+                "UPDATE results SET last_used = ?"
+                " WHERE task_id = ? AND grid_hash = ? AND source_hash = ? AND backend = ?",
+                (time.time(), *key),
+            )
+        return json.loads(row[0])
+
+    def put(self, task_id: str, grid: Grid, result: Grid) -> None:
+        digest = grid_hash(grid)
+        payload = json.dumps(result, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (task_id, digest, self._source_hash(task_id), self.backend_key, payload, len(payload), time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        excess_entries = max(0, count - self.max_entries)
+        excess_bytes = max(0, total - self.max_bytes)
+        victims: List[Tuple[int]] = []
+        freed = 0
+        for rowid, size in self._conn.execute("SELECT rowid, size FROM results ORDER BY last_used"):
+            if len(victims) >= excess_entries and freed >= excess_bytes:
+                break
+            victims.append((rowid,))
+            freed += size
+        self._conn.executemany("DELETE FROM results WHERE rowid = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def solve(self, task_id: str, grid: Grid, solver: Optional[Callable[[Grid], Grid]] = None) -> Grid:
+        """Return the cached output for ``grid`` or run the solver and store it."""
+        cached = self.get(task_id, grid)
+        if cached is not None:
+            return cached
+        if solver is None:
+            backend = self.backend if self.backend in supported_backends(task_id) else "python"
+            solver = load_solver(task_id, backend)
+        result = solver(grid)
+        self.put(task_id, grid, result)
+        return result
+
+    def totals(self) -> Dict[str, int]:
+        """Lifetime counters, including the current session."""
+        with self._lock:
+            stored = dict(self._conn.execute("SELECT name, value FROM counters"))
+        for name, value in self.stats.as_dict().items():
+            stored[name] = stored.get(name, 0) + value
+        return stored
+
+    def size(self) -> Tuple[int, int]:
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return count, total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO counters VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                self.stats.as_dict().items(),
+            )
+            self._conn.commit()
+            self._conn.close()
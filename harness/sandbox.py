@@ -0,0 +1,235 @@
+"""Run solvers in pooled worker subprocesses with CPU, memory, and wall limits.
+
+A few solvers search exponentially or iterate to a fixpoint on unusual inputs
+(``7b3084d4::searchTilings``, ``8698868d::_assign_shapes``,
+``981571dc::iterateCompletion``).  In a sweep a single such input would block
+the run indefinitely, so each solve is shipped to a worker process that runs
+under ``resource`` limits:
+
+- ``RLIMIT_CPU`` is re-armed before every solve to ``cpu_seconds`` beyond the
+  worker's current usage; exceeding it delivers ``SIGXCPU``.
+- ``RLIMIT_AS`` caps the worker's address space, so runaway allocation
+  surfaces as ``MemoryError`` inside the worker.  Only that is reported as
+  ``oom``, including a worker that ran out of memory while sending its reply
+  (it exits with :data:`OOM_EXIT_CODE`).
+- A wall-clock timeout in the parent kills workers stuck in sleeps or I/O.
+
+A worker that dies from ``SIGKILL`` for any other reason -- the kernel OOM
+killer acting on a container limit, or an operator -- is reported as
+``killed``; the parent cannot tell why it happened.  Other deaths are
+``crash``.  Workers are recycled after ``max_tasks_per_worker`` solves and
+after any result other than ``ok`` or ``error``, so one bad input cannot
+degrade later ones.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+from .registry import Grid
+
+STATUSES = ("ok", "error", "timeout", "oom", "killed", "crash")
+OOM_EXIT_CODE = 75  # worker hit RLIMIT_AS while replying
+
+
+class SandboxError(Exception):
+    """Raised by :meth:`SandboxPool.solve` when a solve does not finish with ``ok``."""
+
+    def __init__(self, status: str, message: str) -> None:
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+@dataclass
+class SandboxResult:
+    status: str
+    output: Optional[Grid] = None
+    error: Optional[str] = None
+
+
+def _arm_cpu_limit(cpu_seconds: float) -> None:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = usage.ru_utime + usage.ru_stime
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(used + cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn: Connection, cpu_seconds: Optional[float], memory_bytes: Optional[int]) -> None:
+    # Imported here so the spawned interpreter resolves solvers itself.
+    from .registry import load_solver
+
+    if resource is not None and memory_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        task_id, grid = job
+        if resource is not None and cpu_seconds:
+            _arm_cpu_limit(cpu_seconds)
+        try:
+            reply: Tuple[str, Any, Optional[str]] = ("ok", load_solver(task_id)(grid), None)
+        except MemoryError:
+            reply = ("oom", None, "MemoryError")
+        except Exception as exc:  # noqa: BLE001 - reported to the parent
+            reply = ("error", None, repr(exc))
+        try:
+            conn.send(reply)
+        except MemoryError:
+            os._exit(OOM_EXIT_CODE)
+        if reply[0] == "oom":
+            return
+
+
+class _Worker:
+    def __init__(self, ctx: Any, cpu_seconds: Optional[float], memory_bytes: Optional[int]) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, cpu_seconds, memory_bytes), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.completed = 0
+
+    def run(self, task_id: str, grid: Grid, wall_seconds: Optional[float]) -> SandboxResult:
+        try:
+            self.conn.send((task_id, grid))
+            if not self.conn.poll(wall_seconds):
+                self.kill()
+                return SandboxResult("timeout", error=f"exceeded {wall_seconds}s wall clock")
+            status, output, error = self.conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            return self._death_result()
+        self.completed += 1
+        return SandboxResult(status, output, error)
+
+    def _death_result(self) -> SandboxResult:
+        self.process.join(timeout=1.0)
+        code = self.process.exitcode
+        if code == -getattr(signal, "SIGXCPU", -1):
+            return SandboxResult("timeout", error="exceeded CPU time limit")
+        if code == OOM_EXIT_CODE:
+            return SandboxResult("oom", error="MemoryError while sending the result")
+        if code == -signal.SIGKILL:
+            return SandboxResult("killed", error="worker killed by SIGKILL")
+        return SandboxResult("crash", error=f"worker exited with code {code}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=1.0)
+        self.kill()
+
+
+class SandboxPool:
+    """A fixed-size pool of limited worker processes.
+
+    ``solve`` may be called from several threads at once; each call checks out
+    an idle worker, so at most ``workers`` solves run concurrently.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        cpu_seconds: Optional[float] = 10.0,
+        memory_mb: Optional[int] = 2048,
+        wall_seconds: Optional[float] = 30.0,
+        max_tasks_per_worker: int = 200,
+        start_method: str = "spawn",
+    ) -> None:
+        self._ctx = mp.get_context(start_method)
+        self.workers = workers
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_mb * 1024 * 1024 if memory_mb else None
+        self.wall_seconds = wall_seconds
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.recycled = 0
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all: List[_Worker] = []
+        self._lock = threading.Lock()
+        for _ in range(workers):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.cpu_seconds, self.memory_bytes)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.stop()
+        with self._lock:
+            self._all.remove(worker)
+            self.recycled += 1
+
+    def run(self, task_id: str, grid: Grid) -> SandboxResult:
+        worker = self._idle.get()
+        try:
+            result = worker.run(task_id, grid, self.wall_seconds)
+        except BaseException:
+            self._retire(worker)
+            self._idle.put(self._spawn())
+            raise
+        if result.status in ("ok", "error") and worker.alive and worker.completed < self.max_tasks_per_worker:
+            self._idle.put(worker)
+        else:
+            self._retire(worker)
+            self._idle.put(self._spawn())
+        return result
+
+    def solve(self, task_id: str, grid: Grid) -> Grid:
+        """Runner-compatible entry point: return the output or raise :class:`SandboxError`."""
+        result = self.run(task_id, grid)
+        if result.status != "ok":
+            raise SandboxError(result.status, result.error or "")
+        return result.output  # type: ignore[return-value]
+
+    def run_many(self, jobs: Iterable[Tuple[str, Grid]]) -> List[SandboxResult]:
+        """Dispatch independent solves across all workers, preserving input order."""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda job: self.run(*job), jobs))
+
+    def close(self) -> None:
+        with self._lock:
+            workers = list(self._all)
+            self._all.clear()
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Stress solvers on synthetically enlarged inputs and report runtime curves.
+
+ARC grids stop at 30x30, so helpers that are quadratic (or worse) in the
+cell count never show it.  This module grows each task's example inputs to a
+target side length while keeping their structure:
+
+- ``tile``: repeat the grid in both directions, cropped to ``size x size``;
+- ``upscale``: blow every cell up to a ``k x k`` block with the largest ``k``
+  that fits, so the result stays within ``size`` but rarely reaches it;
+- ``pad``: centre the grid on a background canvas (background = most common
+  colour).
+
+None of them shrinks a grid already larger than the target.  Each point
+records the mean height and width actually produced, and slopes are fitted
+against actual cell counts.
+
+The runner times every solver on each variant at 30/60/120/240 and fits the
+log-log slope of seconds against cells; a slope near 1 is linear in the cell
+count, and slopes above ``--cliff`` are flagged.  Outputs are not checked --
+enlarged inputs have no targets -- but exceptions are recorded, and with
+``--sandbox`` runaway solves end as ``timeout``/``oom`` instead of hanging the
+sweep.  Once a variant fails at one size, larger sizes of it are skipped.
+
+Usage: ``python -m harness.scaling [task_id ...] [--sizes 30 60 120 240] [--json OUT]``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .registry import Grid, load_solver, load_task, task_ids
+from .sandbox import SandboxPool
+
+DEFAULT_SIZES = (30, 60, 120, 240)
+DEFAULT_CLIFF = 2.5
+
+
+def tile(grid: Grid, size: int) -> Grid:
+    height = max(size, len(grid))
+    width = max(size, len(grid[0]))
+    reps_c = -(-width // len(grid[0]))
+    return [(list(grid[r % len(grid)]) * reps_c)[:width] for r in range(height)]
+
+
+def upscale(grid: Grid, size: int) -> Grid:
+    k = max(1, size // max(len(grid), len(grid[0])))
+    return [[value for value in row for _ in range(k)] for row in grid for _ in range(k)]
+
+
+def pad(grid: Grid, size: int) -> Grid:
+    background = Counter(value for row in grid for value in row).most_common(1)[0][0]
+    height = max(size, len(grid))
+    width = max(size, len(grid[0]))
+    top = (height - len(grid)) // 2
+    left = (width - len(grid[0])) // 2
+    out = [[background] * width for _ in range(height)]
+    for r, row in enumerate(grid):
+        out[top + r][left : left + len(row)] = row
+    return out
+
+
+VARIANTS: Dict[str, Callable[[Grid, int], Grid]] = {"tile": tile, "upscale": upscale, "pad": pad}
+
+
+@dataclass
+class Point:
+    variant: str
+    size: int
+    cells: int  # mean cells per input at this size
+    height: int  # mean dimensions actually produced (may differ from size)
+    width: int
+    seconds: Optional[float]  # mean seconds per solve; None if any solve failed
+    status: str
+    error: Optional[str] = None
+
+
+@dataclass
+class Curve:
+    task_id: str
+    points: List[Point]
+
+    def slope(self, variant: str) -> Optional[float]:
+        """Least-squares exponent ``b`` in ``seconds ~ cells ** b``."""
+        xs, ys = [], []
+        for point in self.points:
+            if point.variant == variant and point.seconds is not None and point.seconds > 0:
+                xs.append(math.log(point.cells))
+                ys.append(math.log(point.seconds))
+        if len(set(xs)) < 2:
+            return None
+        mx = sum(xs) / len(xs)
+        my = sum(ys) / len(ys)
+        var = sum((x - mx) ** 2 for x in xs)
+        return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+Runner = Callable[[str, Grid], Grid]
+
+
+def direct_runner(task_id: str, grid: Grid) -> Grid:
+    return load_solver(task_id)(grid)
+
+
+def stress_task(
+    task_id: str,
+    runner: Runner = direct_runner,
+    data_dir: Optional[Path] = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    variants: Sequence[str] = tuple(VARIANTS),
+    max_inputs: int = 3,
+) -> Curve:
+    task = load_task(task_id, data_dir, arcgen=False)
+    inputs = [example["input"] for example in task.get("train", [])[:max_inputs]]
+    points: List[Point] = []
+    if inputs:
+        try:  # load the module and warm caches so the first size is not penalised
+            runner(task_id, inputs[0])
+        except Exception:  # noqa: BLE001 - failures are reported per size below
+            pass
+    for variant in variants:
+        make = VARIANTS[variant]
+        for size in sorted(sizes):
+            grids = [make(grid, size) for grid in inputs]
+            count = max(1, len(grids))
+            cells = sum(len(g) * len(g[0]) for g in grids) // count
+            height = sum(len(g) for g in grids) // count
+            width = sum(len(g[0]) for g in grids) // count
+            start = time.perf_counter()
+            try:
+                for grid in grids:
+                    runner(task_id, grid)
+            except Exception as exc:  # noqa: BLE001 - record and move on
+                points.append(
+                    Point(variant, size, cells, height, width, None, getattr(exc, "status", "error"), repr(exc))
+                )
+                break
+            seconds = (time.perf_counter() - start) / max(1, len(grids))
+            points.append(Point(variant, size, cells, height, width, seconds, "ok"))
+    return Curve(task_id, points)
+
+
+def render(curve: Curve, cliff: float) -> str:
+    lines = [f"== {curve.task_id} =="]
+    for variant in VARIANTS:
+        points = [p for p in curve.points if p.variant == variant]
+        if not points:
+            continue
+        cells = "  ".join(
+            f"{p.height}x{p.width}:" + (f"{p.seconds * 1000:.1f}ms" if p.seconds is not None else p.status)
+            for p in points
+        )
+        slope = curve.slope(variant)
+        note = "" if slope is None else f"  slope {slope:.2f}" + ("  <-- cliff" if slope > cliff else "")
+        lines.append(f"  {variant:8s} {cells}{note}")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Time solvers on tiled, upscaled, and padded inputs.")
+    parser.add_argument("tasks", nargs="*", help="Task ids to stress (default: all bundles).")
+    parser.add_argument("--data-dir", type=Path, help="Directory containing <task_id>.json files.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument("--max-inputs", type=int, default=3, help="Train inputs to enlarge per task.")
+    parser.add_argument("--cliff", type=float, default=DEFAULT_CLIFF, help="Flag curves with a steeper slope.")
+    parser.add_argument("--json", type=Path, help="Also write all curves to this JSON file.")
+    parser.add_argument("--sandbox", action="store_true", help="Run each solve in a limited worker process.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-solve wall-clock limit in the sandbox.")
+    parser.add_argument("--memory-mb", type=int, default=2048, help="Per-worker address-space limit.")
+    args = parser.parse_args(argv)
+
+    sandbox: Optional[SandboxPool] = None
+    runner: Runner = direct_runner
+    if args.sandbox:
+        sandbox = SandboxPool(1, args.timeout, args.memory_mb, args.timeout)
+        runner = sandbox.solve
+
+    curves: List[Curve] = []
+    flagged: List[str] = []
+    try:
+        for task_id in args.tasks or task_ids():
+            try:
+                curve = stress_task(task_id, runner, args.data_dir, args.sizes, args.variants, args.max_inputs)
+            except FileNotFoundError:
+                print(f"skipping {task_id}: no task data", file=sys.stderr)
+                continue
+            curves.append(curve)
+            print(render(curve, args.cliff))
+            if any((curve.slope(v) or 0.0) > args.cliff for v in args.variants):
+                flagged.append(task_id)
+    finally:
+        if sandbox is not None:
+            sandbox.close()
+
+    if args.json is not None:
+        payload = [
+            {
+                "task_id": curve.task_id,
+                "slopes": {v: curve.slope(v) for v in args.variants},
+                "points": [asdict(p) for p in curve.points],
+            }
+            for curve in curves
+        ]
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    if flagged:
+        print(f"slope above {args.cliff}: {' '.join(flagged)}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,165 @@
+"""Incremental reader for large JSON arrays of examples (arc-gen sidecars).
+
+``json.loads`` on a multi-gigabyte ``<id>_arcgen.json`` holds the text and
+every parsed grid at once.  :func:`iter_json_array` instead reads the file in
+chunks and decodes one array element at a time, so memory stays bounded by
+the largest single example.
+
+Two sharding modes split a file across workers:
+
+- ``shard=(i, k)`` keeps every ``k``-th element starting at ``i``;
+- ``byte_range=(start, end)`` keeps elements whose first byte lies in
+  ``[start, end)``.  Ranges that tile the file visit every element exactly
+  once.  Resynchronising at ``start`` relies on the ARC layout: examples are
+  objects whose values are integer grids, so inside the array every ``{``
+  begins a new example.  Byte ranges also assume the array is the last
+  value in the document, as it is in the sidecars.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Tuple
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Character buffer over a binary file that tracks byte offsets."""
+
+    def __init__(self, handle: BinaryIO, chunk_size: int, position: int = 0):
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self.byte_offset = position  # byte offset of self._buffer[self._pos]
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        data = self._handle.read(size)
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(data, final=not data)
+        self._pos = 0
+        if not data:
+            self.eof = True
+        return True
+
+    def _advance(self, end: int) -> None:
+        self.byte_offset += len(self._buffer[self._pos : end].encode("utf-8"))
+        self._pos = end
+
+    def peek(self, skip: str = _WHITESPACE) -> str:
+        """Next character after ``skip`` characters, or ``""`` at end of file."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in skip:
+                self._advance(self._pos + 1)
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} at byte {self.byte_offset}, found {found or 'end of file'!r}")
+        self._advance(self._pos + 1)
+
+    def seek_char(self, char: str) -> bool:
+        """Skip to the next occurrence of ``char``; False if there is none."""
+        while True:
+            idx = self._buffer.find(char, self._pos)
+            if idx >= 0:
+                self._advance(idx)
+                return True
+            self._advance(len(self._buffer))
+            if not self._fill(self._chunk_size):
+                return False
+
+    def value(self) -> Any:
+        """Decode one JSON value, reading more of the file until it is complete."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and not self.eof:
+                self._fill(size)
+                continue
+            self._advance(end)
+            return value
+
+
+def _open_array(reader: _Reader, key: Optional[str]) -> bool:
+    """Position ``reader`` inside the target array; False if ``key`` is absent."""
+    if key is None:
+        reader.expect("[")
+        return True
+    reader.expect("{")
+    while reader.peek(_WHITESPACE + ",") not in ("}", ""):
+        name = reader.value()
+        reader.expect(":")
+        if name == key:
+            reader.expect("[")
+            return True
+        reader.value()
+    return False
+
+
+def iter_json_array(
+    path: Path,
+    key: Optional[str] = None,
+    shard: Tuple[int, int] = (0, 1),
+    byte_range: Optional[Tuple[int, int]] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time.
+
+    The array is the whole document, or the value of ``key`` in a top-level
+    object (``"train"`` for arc-gen sidecars).
+    """
+    index, count = shard
+    if not 0 <= index < count:
+        raise ValueError(f"invalid shard {shard!r}")
+    with path.open("rb") as handle:
+        reader = _Reader(handle, chunk_size)
+        if not _open_array(reader, key):
+            return
+        start, end = byte_range if byte_range is not None else (0, None)
+        if start > reader.byte_offset:
+            handle.seek(start)
+            reader = _Reader(handle, chunk_size, start)
+            if not reader.seek_char("{"):
+                return
+        position = 0
+        while True:
+            char = reader.peek(_WHITESPACE + ",")
+            if char in ("]", ""):
+                return
+            if end is not None and reader.byte_offset >= end:
+                return
+            element = reader.value()
+            if position % count == index:
+                yield element
+            position += 1
+
+
+def iter_arcgen(
+    path: Path,
+    shard: Tuple[int, int] = (0, 1),
+    byte_range: Optional[Tuple[int, int]] = None,
+) -> Iterator[Any]:
+    """Examples of an ``<id>_arcgen.json`` sidecar (``{"train": [...]}`` or a bare array)."""
+    with path.open("rb") as handle:
+        first = handle.read(64).lstrip()
+    key = None if first.startswith(b"[") else "train"
+    return iter_json_array(path, key, shard, byte_range)
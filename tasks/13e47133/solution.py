@@ -7,8 +7,10 @@ template-overlay behaviour.
 from __future__ import annotations
 
 from collections import Counter, deque
-from copy import deepcopy
-from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint
+from compdsl.templates import TemplateIndex, overlay
 
 # Lightweight typed aliases to mirror the DSL nomenclature used in abstractions.md
 Grid = List[List[int]]
@@ -284,6 +286,10 @@ TEMPLATES: Dict[TemplateKey, Template] = {
 }
 
 
+# Template keys grouped by (color, grid_height, component_size).
+TEMPLATE_INDEX: TemplateIndex[TemplateKey, Template] = TemplateIndex(TEMPLATES, lambda key, _: key[:3])
+
+
 def _find_components(grid: Grid, background: int) -> List[Component]:
     """Return connected non-background components with metadata."""
     height = len(grid)
@@ -330,9 +336,7 @@ def _select_offset(
     width: int,
 ) -> Optional[Offset]:
     """Choose an offset for placing a template using the learned heuristics."""
-    candidates = [
-        key for key in TEMPLATES if key[0] == color and key[1] == height and key[2] == comp_size
-    ]
+    candidates = TEMPLATE_INDEX.keys((color, height, comp_size))
     if not candidates:
         return None
     if len(candidates) == 1:
@@ -371,21 +375,8 @@ def _select_offset(
 
 
 def _overlay(canvas: Grid, template: Iterable[Iterable[Optional[int]]], start_row: int, start_col: int) -> Grid:
-    """Overlay template onto a copy of canvas respecting boundaries and None markers."""
-    result = deepcopy(canvas)
-    height = len(result)
-    width = len(result[0]) if height else 0
-    for r_idx, row in enumerate(template):
-        rr = start_row + r_idx
-        if rr < 0 or rr >= height:
-            continue
-        for c_idx, value in enumerate(row):
-            if value is None:
-                continue
-            cc = start_col + c_idx
-            if 0 <= cc < width:
-                result[rr][cc] = value
-    return result
+    """Overlay template onto canvas respecting boundaries and None markers (copy-on-write)."""
+    return overlay(canvas, template, start_row, start_col)
 
 
 # --- DSL-style helper façade used by the lambda entrypoint ---
@@ -397,7 +388,7 @@ def findComponents(grid: Grid) -> List[Component]:
 
 
 def lookupTemplates(comp: Component) -> List[TemplateKey]:
-    return [k for k in TEMPLATES if k[0] == comp.color and k[1] == comp.height and k[2] == comp.size]
+    return list(TEMPLATE_INDEX.keys((comp.color, comp.height, comp.size)))
 
 
 def selectOffset(comp: Component, template_keys: List[TemplateKey]) -> Optional[Offset]:
@@ -416,13 +407,6 @@ def overlayTemplate(canvas: Grid, template: Template, start_row: int, start_col:
     return _overlay(canvas, template, start_row, start_col)
 
 
-def fold_repaint(initial: Grid, items: List[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    acc = deepcopy(initial)
-    for item in items:
-        acc = update(acc, item)
-    return acc
-
-
 def solve_13e47133(grid: Grid) -> Grid:
     components = findComponents(grid)
     
@@ -11,10 +11,6 @@ def _in_bounds(r: int, c: int, height: int, width: int) -> bool:
     return 0 <= r < height and 0 <= c < width
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _get_components(grid: Grid) -> List[Dict[str, object]]:
     """Return 4-connected monochromatic components with metadata."""
 
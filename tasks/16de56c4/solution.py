@@ -3,14 +3,12 @@
 from typing import List
 from math import gcd
 
+from compdsl.helpers import copy_grid as _copy_grid
+
 # Typed alias used by the DSL checker
 Grid = List[List[int]]
 
 
-def _copy_grid(grid):
-    return [row[:] for row in grid]
-
-
 def _apply_row_rule(grid):
     result = _copy_grid(grid)
     width = len(grid[0])
@@ -7,17 +7,11 @@ on the original grid and recolour their centre and arms to 8.
 
 from __future__ import annotations
 
-from typing import Callable, List, Sequence, Tuple, TypeVar
-
-Grid = List[List[int]]
-T = TypeVar("T")
+from typing import List, Tuple
 
+from compdsl.helpers import fold_repaint
 
-def fold_repaint(canvas: Grid, items: Sequence[T], update: Callable[[Grid, T], Grid]) -> Grid:
-    acc = canvas
-    for x in items:
-        acc = update(acc, x)
-    return acc
+Grid = List[List[int]]
 
 
 def isPlus(g: Grid, position: Tuple[int, int]) -> bool:
@@ -1,7 +1,9 @@
 """Solver for ARC-AGI-2 task 195c6913 (split: evaluation)."""
 
 from collections import deque
-from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint
 
 Grid = List[List[int]]
 Anchor = Any  # anchor payload assembled by locateAnchors
@@ -172,13 +174,6 @@ def locateAnchors(grid: Grid, pattern: List[int]) -> List[Tuple[int, int, int, s
     return enriched
 
 
-def fold_repaint(initial: Grid, items: List[Anchor], update: Callable[[Grid, Anchor], Grid]) -> Grid:
-    canvas = [row[:] for row in initial]
-    for item in items:
-        canvas = update(canvas, item)
-    return canvas
-
-
 def propagatePattern(canvas: Grid, pattern: List[int], anchor: Tuple[int, int, int, str, int, int, Grid]) -> Grid:
     # anchor = (row, boundary, start_idx, role, fill_color, cap_color, base_grid)
     r_anchor, boundary, start_idx, role, fill_color, cap_color, base = anchor
@@ -2,6 +2,8 @@
 
 from typing import List, Tuple, Optional
 
+from compdsl.rle import encode_line
+
 Grid = List[List[int]]
 Row = List[int]
 
@@ -17,18 +19,7 @@ def collectSegments(row: Row) -> List[Tuple[int, int]]:
     barrier = _last_barrier(row)
     if barrier is None:
         return []
-    segments: List[Tuple[int, int]] = []
-    idx = 0
-    while idx < barrier:
-        color = row[idx]
-        if color == 0:
-            idx += 1
-            continue
-        start = idx
-        while idx < barrier and row[idx] == color:
-            idx += 1
-        segments.append((color, idx - start))
-    return segments
+    return [(run.color, run.length) for run in encode_line(row[:barrier]) if run.color != 0]
 
 
 def repeatSegments(row: Row, segments: List[Tuple[int, int]]) -> Row:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import List, Optional
 
+from compdsl.helpers import copy_grid as _copy
+
 
 BG = 1
 SPECIAL = 7
@@ -12,10 +14,6 @@ FILL = 4
 Grid = List[List[int]]
 
 
-def _copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 # DSL helper: verticalFold : Grid -> Optional[Grid]
 def verticalFold(grid: Grid) -> Optional[Grid]:
     """Overlay the right block onto the left block across a background column."""
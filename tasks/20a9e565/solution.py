@@ -7,10 +7,6 @@ Grid = List[List[int]]
 from itertools import groupby
 
 
-def _copy_grid(grid):
-    return [row[:] for row in grid]
-
-
 def _nonzero_columns(grid):
     h = len(grid)
     w = len(grid[0])
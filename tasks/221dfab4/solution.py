@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Callable, Iterable, List, Sequence, Set, Tuple, TypeVar
+from typing import List, Sequence, Set, Tuple
+
+from compdsl.helpers import fold_repaint, majority_color as majorityColor
 
 Grid = List[List[int]]
 Color = int
@@ -13,11 +15,6 @@ Row = int
 
 # --- Small, pure helpers (DSL-compatible) ---
 
-def majorityColor(grid: Grid) -> Color:
-    counts = Counter(v for row in grid for v in row)
-    return counts.most_common(1)[0][0]
-
-
 def selectStripeColumns(grid: Grid) -> Set[Column]:
     if not grid:
         return set()
@@ -34,16 +31,6 @@ def _set_cell(g: Grid, r: Row, c: Column, col: Color) -> Grid:
     return [([col if (ri == r and ci == c) else v for ci, v in enumerate(row)]) if ri == r else row[:] for ri, row in enumerate(g)]
 
 
-T = TypeVar("T")
-
-
-def fold_repaint(canvas: Grid, items: Iterable[T], update: Callable[[Grid, T], Grid]) -> Grid:
-    g = canvas
-    for x in items:
-        g = update(g, x)
-    return g
-
-
 def paintStripes(grid: Grid, stripe_cols: Set[Column], background: Color) -> Grid:
     height = len(grid)
 
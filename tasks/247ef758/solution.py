@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from compdsl.helpers import copy_grid as deep_copy, fold_repaint
 
 
 # Typed aliases for the DSL subset
@@ -13,21 +15,6 @@ Column = int
 Glyph = List[Tuple[int, int, int]]  # list of (r, c, color) cells
 
 
-def deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
-def fold_repaint(
-    initial: Grid,
-    items: List[Tuple[Color, Glyph]],
-    update: Callable[[Grid, Tuple[Color, Glyph]], Grid],
-) -> Grid:
-    canvas = initial
-    for item in items:
-        canvas = update(canvas, item)
-    return canvas
-
-
 def findAxisColumn(grid: Grid) -> Optional[Column]:
     h = len(grid)
     w = len(grid[0]) if h else 0
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Dict, List, Tuple, NamedTuple
 
+from compdsl.helpers import copy_grid as deep_copy
+
 
 BASE_PATTERN = [
     [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 1],
@@ -44,10 +46,6 @@ class Alignment(NamedTuple):
     pattern: Grid  # transformed binary grid (0/1)
 
 
-def deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def identity(grid: Grid) -> Grid:
     return [row[:] for row in grid]
 
@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
+from compdsl.helpers import copy_grid as _copy
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 
 
-def _copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def collectSupply(grid: Grid) -> List[Cell]:
     h = len(grid)
     w = len(grid[0]) if h else 0
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from typing import Iterable, List, Sequence, Tuple
 
+from compdsl.helpers import transpose as _transpose
+from compdsl.rle import encode_line, spans
+
 
 BACKGROUND = 8
 HEADER_COLORS = {0, 1, 2}
@@ -14,26 +17,16 @@ Range = range
 Segment = List[int]
 
 
-def _transpose(grid: Sequence[Sequence[int]]) -> List[List[int]]:
-    return [list(col) for col in zip(*grid)]
-
-
 def _trim_header_column(grid: Sequence[Sequence[int]]) -> List[List[int]]:
     return [list(row[1:]) for row in grid]
 
 
 def _extract_segments(row: Sequence[int]) -> List[List[int]]:
     segments: List[List[int]] = []
-    current: List[int] = []
-    for value in row:
-        if value == BACKGROUND:
-            if current and not all(v in HEADER_COLORS for v in current):
-                segments.append(current[:])
-            current.clear()
-        else:
-            current.append(value)
-    if current and not all(v in HEADER_COLORS for v in current):
-        segments.append(current)
+    for start, stop in spans(encode_line(row), BACKGROUND):
+        segment = list(row[start:stop])
+        if not all(v in HEADER_COLORS for v in segment):
+            segments.append(segment)
     return segments
 
 
@@ -10,6 +10,8 @@ from collections import Counter, defaultdict
 from statistics import mean
 from typing import Dict, List, Optional, Sequence, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid
+
 Grid = List[List[int]]
 Coord = Tuple[int, int]
 Stats = Tuple[Counter[int], Dict[int, List[int]], Dict[int, List[int]], Dict[int, List[Coord]]]
@@ -19,10 +21,6 @@ Axis = Optional[Tuple[int, Dict[int, int], Dict[int, List[Coord]]]]
 BACKGROUND = 8
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def gatherColorStats(grid: Grid) -> Stats:
     counts: Counter[int] = Counter()
     rows: Dict[int, List[int]] = defaultdict(list)
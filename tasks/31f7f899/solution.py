@@ -3,14 +3,13 @@
 from collections import Counter
 from typing import List, Sequence, Tuple
 
+from compdsl.helpers import copy_grid as _clone
+from compdsl.rle import RLEGrid, run_at
+
 Grid = List[List[int]]
 Stripe = Tuple[int, int, int]  # (column, color, height)
 
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def pinBackboneRow(grid: Grid) -> Tuple[int, List[int]]:
     rows = len(grid)
     cols = len(grid[0]) if rows else 0
@@ -43,17 +42,14 @@ def collectStripeSpans(grid: Grid, center_row_idx: int, center_row: Sequence[int
         key=lambda item: (item[1], -item[0]),
     )[0]
 
+    encoded = RLEGrid(grid)
     stripes: List[Stripe] = []
     for c, color in enumerate(center_row):
         if color == background or color == dominant_color:
             continue
-        top = bottom = center_row_idx
-        while top > 0 and grid[top - 1][c] == color:
-            top -= 1
-        while bottom + 1 < rows and grid[bottom + 1][c] == color:
-            bottom += 1
-        height = bottom - top + 1
-        stripes.append((c, color, height))
+        run = run_at(encoded.col(c), center_row_idx)
+        assert run is not None  # the centre row lies inside every column
+        stripes.append((c, color, run.length))
     return stripes
 
 
@@ -1,7 +1,9 @@
 """Solver for ARC-AGI-2 task 35ab12c3."""
 
 from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence, Set, Tuple, Optional, TypedDict
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, TypedDict
+
+from compdsl.spatial import PointIndex
 
 Coord = Tuple[int, int]
 Grid = List[List[int]]
@@ -191,23 +193,19 @@ def matchSingletons(anchors: Anchors, primary_hulls: Hulls) -> Shifts:
     coord_map, base_colors, derived_colors = anchors
     base_shapes, base_union = primary_hulls
 
+    # Insertion order matches the former scan, so distance ties resolve identically.
+    anchors_index: PointIndex[int] = PointIndex(
+        (candidate, bc) for bc in base_colors for candidate in coord_map[bc]
+    )
+
     shifts: Shifts = {}
     for color in derived_colors:
         point = coord_map[color][0]
-        best: Optional[int] = None
-        anchor_color: Optional[int] = None
-        anchor_point: Optional[Coord] = None
-        for bc in base_colors:
-            for candidate in coord_map[bc]:
-                dist = abs(point[0] - candidate[0]) + abs(point[1] - candidate[1])
-                if best is None or dist < best:
-                    best = dist
-                    anchor_color = bc
-                    anchor_point = candidate
-
-        if anchor_color is None or anchor_point is None:
+        nearest = anchors_index.nearest(point)
+        if nearest is None:
             shifts[color] = {point}
             continue
+        anchor_point, anchor_color, _ = nearest
 
         dr = point[0] - anchor_point[0]
         dc = point[1] - anchor_point[1]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Iterable, List, Set, Tuple
 
+from compdsl.rle import encode_line
+
 Grid = List[List[int]]
 Column = int
 Run = Tuple[int, int, int]  # row, left, right
@@ -11,16 +13,9 @@ Run = Tuple[int, int, int]  # row, left, right
 
 def _iter_runs(row: List[int], target: int = 2) -> Iterable[Tuple[int, int]]:
     """Yield [start, end] column spans of consecutive `target` values."""
-    start = None
-    for idx, value in enumerate(row):
-        if value == target:
-            if start is None:
-                start = idx
-        elif start is not None:
-            yield start, idx - 1
-            start = None
-    if start is not None:
-        yield start, len(row) - 1
+    for run in encode_line(row):
+        if run.color == target:
+            yield run.start, run.stop - 1
 
 
 # Typed-DSL helper building blocks (pure, no side effects)
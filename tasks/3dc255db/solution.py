@@ -10,6 +10,8 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
+from compdsl.helpers import cells_bbox as _bbox, copy_grid as _deep_copy, fold_repaint_copy as fold_repaint
+
 
 # --- Basic types ---
 Grid = List[List[int]]
@@ -19,20 +21,10 @@ Offset = Dict[str, float]  # {"drow": float, "dcol": float, "host_h": int, "host
 
 
 # --- Shared helpers (pure) ---
-def _deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _nonzero_colors(grid: Grid) -> List[int]:
     return sorted({cell for row in grid for cell in row if cell})
 
 
-def _bbox(coords: Sequence[Tuple[int, int]]) -> Tuple[int, int, int, int]:
-    rows = [r for r, _ in coords]
-    cols = [c for _, c in coords]
-    return min(rows), max(rows), min(cols), max(cols)
-
-
 def _components(grid: Grid, color: int) -> List[List[Tuple[int, int]]]:
     h = len(grid)
     w = len(grid[0])
@@ -76,13 +68,6 @@ def _collect_metadata(grid: Grid) -> Tuple[
 
 
 # --- DSL primitives ---
-def fold_repaint(initial: Grid, items: List[Component], update: Any) -> Grid:
-    g = _deep_copy(initial)
-    for it in items:
-        g = update(g, it)
-    return g
-
-
 def extractIntruders(grid: Grid) -> List[Component]:
     colors, _cells, bboxes, areas, components = _collect_metadata(grid)
     items: List[Component] = []
@@ -1,21 +1,15 @@
 """Solver for ARC-AGI-2 task 3e6067c3."""
 
-from collections import Counter, defaultdict
+from collections import defaultdict
 from typing import Any, Dict, List, Tuple
 
+from compdsl.helpers import copy_grid as _deep_copy, majority_color as _background_color
+
 Grid = List[List[int]]
 Cell = Tuple[int, int, int]  # (row, col, color)
 Node = Dict[str, int]
 
 
-def _deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
-def _background_color(grid: Grid) -> int:
-    return Counter(cell for row in grid for cell in row).most_common(1)[0][0]
-
-
 def _components(grid: Grid, background: int) -> List[Node]:
     height = len(grid)
     width = len(grid[0]) if grid else 0
@@ -1,8 +1,10 @@
 """Solver for ARC-AGI-2 task 409aa875."""
 
-from collections import Counter, deque
+from collections import deque
 from typing import Dict, List, Tuple, TypedDict
 
+from compdsl.helpers import copy_grid as _copy_grid, majority_color as _background_color
+
 
 Grid = List[List[int]]
 
@@ -27,15 +29,6 @@ class BandEntries(TypedDict):
 SHIFT_ROWS = 5
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
-def _background_color(grid: Grid) -> int:
-    flat = [cell for row in grid for cell in row]
-    return Counter(flat).most_common(1)[0][0]
-
-
 def _connected_components(grid: Grid, background: int) -> List[Component]:
     height = len(grid)
     width = len(grid[0])
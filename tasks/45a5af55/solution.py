@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from typing import List, Literal
 
+from compdsl.helpers import copy_grid as _clone
+
 Grid = List[List[int]]
 Axis = Literal["rows", "columns"]
 
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def detectDominantAxis(grid: Grid) -> Axis:
     if not grid or not grid[0]:
         return "rows"
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Set, Tuple, Union
 
+from compdsl.helpers import cells_bbox as _bbox
+
 
 # Basic typed aliases used by the DSL subset
 Grid = List[List[int]]
@@ -18,12 +20,6 @@ def _component_cells(grid: Grid, color: int) -> List[Point]:
     return [(r, c) for r, row in enumerate(grid) for c, v in enumerate(row) if v == color]
 
 
-def _bbox(cells: Iterable[Point]) -> Tuple[int, int, int, int]:
-    rows = [r for r, _ in cells]
-    cols = [c for _, c in cells]
-    return min(rows), max(rows), min(cols), max(cols)
-
-
 def _align_to_corner(cells: Iterable[Point], corner: Corner, height: int, width: int) -> Set[Point]:
     cells = list(cells)
     if not cells:
@@ -6,11 +6,9 @@ the original solver semantics.
 
 from typing import List, Tuple, Iterable, Set
 
-Grid = List[List[int]]
-
+from compdsl.helpers import copy_grid as _clone
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
+Grid = List[List[int]]
 
 
 def _find_split_col(grid: Grid) -> int:
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections import Counter, deque
 from typing import Dict, List, Sequence, Tuple
 
+from compdsl.overlap import ColumnChain, longest_overlap
+
 Grid = List[List[int]]
 Block = List[List[int]]
 
@@ -136,16 +138,9 @@ def merge_blocks(left: Block, right: Block) -> Block:
     if not left or not left[0]:
         return [row[:] for row in right]
     height = len(left)
-    overlap = min(len(left[0]), len(right[0]))
-    best = 0
-    for k in range(1, overlap + 1):
-        matches = True
-        for row in range(height):
-            if left[row][-k:] != right[row][:k]:
-                matches = False
-                break
-        if matches:
-            best = k
+    left_cols = list(zip(*left))
+    right_cols = list(zip(*(right[row] for row in range(height))))
+    best = longest_overlap(left_cols, right_cols)
     merged: Block = []
     for row in range(height):
         merged.append(left[row][:] + right[row][best:])
@@ -189,10 +184,10 @@ def assemble_components(components, background: int) -> Block:
     if not ordered:
         return []
 
-    result: Block = ordered[0]["normalized"]
-    for comp in ordered[1:]:
-        result = merge_blocks(result, comp["normalized"])
-    return result
+    chain = ColumnChain()
+    for comp in ordered:
+        chain.append(comp["normalized"])
+    return chain.to_block()
 
 
 # ---------------------------------------------------------------------------
@@ -260,10 +255,10 @@ def prioritiseComponents(typed: Sequence[Tuple[Dict, str]]) -> List[Dict]:
 def concatenateComponents(ordered: Sequence[Dict]) -> Grid:
     if not ordered:
         return []
-    stack: Block = ordered[0]["normalized"]
-    for comp in ordered[1:]:
-        stack = merge_blocks(stack, comp["normalized"])
-    return [row[:] for row in stack]
+    chain = ColumnChain()
+    for comp in ordered:
+        chain.append(comp["normalized"])
+    return chain.to_block()
 
 
 def solve_4e34c42c(grid: Grid) -> Grid:
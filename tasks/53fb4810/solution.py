@@ -1,6 +1,8 @@
 """Solver for ARC-AGI-2 task 53fb4810."""
 
-from typing import Callable, Iterable, List, Tuple
+from typing import List, Tuple
+
+from compdsl.helpers import copy_grid as _copy_grid, fold_repaint_copy as fold_repaint
 
 
 Grid = List[List[int]]
@@ -8,10 +10,6 @@ Cell = Tuple[int, int, int]
 Component = List[Cell]
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def findMixedComponents(grid: Grid) -> List[Component]:
     """Return all 4-connected components that contain both colours {2,4}."""
     h, w = len(grid), len(grid[0])
@@ -67,16 +65,6 @@ def tilePatternUpward(canvas: Grid, comp: Component) -> Grid:
     return result
 
 
-def fold_repaint(
-    canvas: Grid, items: Iterable[Component], update: Callable[[Grid, Component], Grid]
-) -> Grid:
-    """Functional fold that applies `update` sequentially over items."""
-    acc = _copy_grid(canvas)
-    for x in items:
-        acc = update(acc, x)
-    return acc
-
-
 def solve_53fb4810(grid: Grid) -> Grid:
     components = findMixedComponents(grid)
 
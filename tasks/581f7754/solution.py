@@ -1,19 +1,14 @@
 """Solver for ARC-AGI-2 task 581f7754 (split: evaluation)."""
 
-from collections import Counter, deque, defaultdict
+from collections import deque, defaultdict
 from typing import Any, Dict, List
 
+from compdsl.helpers import majority_color as most_common_color
+
 # Typed aliases used by the DSL-style entrypoint
 Grid = List[List[int]]
 
 
-def most_common_color(grid):
-    counts = Counter()
-    for row in grid:
-        counts.update(row)
-    return counts.most_common(1)[0][0]
-
-
 def extract_components(grid, background):
     height, width = len(grid), len(grid[0])
     visited = [[False] * width for _ in range(height)]
@@ -3,6 +3,8 @@
 from collections import Counter
 from typing import Dict, List, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid
+
 # Typed alias used by the DSL lambda representation
 Grid = List[List[int]]
 
@@ -29,10 +31,6 @@ PATTERNS = {
 }
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _significant_colors(grid: Grid, min_pixels: int = 10) -> Tuple[int, List[int]]:
     counts = Counter(val for row in grid for val in row)
     background = counts.most_common(1)[0][0]
@@ -7,9 +7,11 @@ abstractions.md. Logic and behavior are preserved.
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Iterable, List, Sequence, Set, Tuple, TypedDict
 
+from compdsl.bitmask import BitGrid
+from compdsl.rays import RayTables
+
 # Basic domain aliases
 Grid = List[List[int]]
 Point = Tuple[int, int]
@@ -93,20 +95,10 @@ def _component_scan(grid: Grid) -> List[Motif]:
     return components
 
 
-def _extend_ray(grid: Grid, origin: Point, direction: Tuple[int, int]) -> List[Point]:
+def _extend_ray(rays: RayTables, origin: Point, direction: Tuple[int, int]) -> List[Point]:
     """Collect background cells reached from origin while following direction."""
 
-    h, w = len(grid), len(grid[0])
-    dr, dc = direction
-    r, c = origin[0] + dr, origin[1] + dc
-    ray: List[Point] = []
-
-    while 0 <= r < h and 0 <= c < w and grid[r][c] == 8:
-        ray.append((r, c))
-        r += dr
-        c += dc
-
-    return ray
+    return rays.ray(origin, direction, through=8)
 
 
 # === DSL helper primitives ===
@@ -133,6 +125,7 @@ def buildGuideGraph(grid: Grid, filtered: Sequence[Motif]) -> GuideGraph:
     """Connect filtered motifs via their guide rays and sentinel anchors."""
     motifs = _component_scan(grid)
     sentinel = _find_sentinel(motifs)
+    rays = RayTables(grid)
 
     candidates: Set[Point] = set(sentinel["coords"])  # seed with sentinel body
 
@@ -142,7 +135,7 @@ def buildGuideGraph(grid: Grid, filtered: Sequence[Motif]) -> GuideGraph:
         if direction is None and directions:
             direction = directions[0]
         if direction:
-            candidates.update(_extend_ray(grid, cell, direction))
+            candidates.update(_extend_ray(rays, cell, direction))
 
     # Scaffold each filtered motif and cast its orange guide rays.
     for comp in filtered:
@@ -150,7 +143,7 @@ def buildGuideGraph(grid: Grid, filtered: Sequence[Motif]) -> GuideGraph:
         for (cell, directions) in comp["threes"]:
             if not directions:
                 continue
-            candidates.update(_extend_ray(grid, cell, directions[0]))
+            candidates.update(_extend_ray(rays, cell, directions[0]))
 
     h, w = len(grid), len(grid[0])
     return GuideGraph(shape=(h, w), candidates=candidates, sentinel=set(sentinel["coords"]))
@@ -162,20 +155,11 @@ def propagateScaffold(graph: GuideGraph) -> Grid:
     candidates = graph["candidates"]
     start = graph["sentinel"]
 
-    queue = deque(start)
-    reachable: Set[Point] = set(start)
-
-    while queue:
-        r, c = queue.popleft()
-        for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nr, nc = r + dr, c + dc
-            nxt = (nr, nc)
-            if nxt in candidates and nxt not in reachable:
-                reachable.add(nxt)
-                queue.append(nxt)
+    board = BitGrid(h, w)
+    reachable = board.flood(board.mask_from_cells(start), board.mask_from_cells(candidates))
 
     output: Grid = [[8] * w for _ in range(h)]
-    for r, c in reachable:
+    for r, c in board.cells(reachable):
         output[r][c] = 2
     return output
 
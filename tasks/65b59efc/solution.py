@@ -9,7 +9,9 @@ DSL helpers are thin adapters around them.
 from __future__ import annotations
 
 from collections import Counter
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import Any, List, Optional, Sequence, Tuple
+
+from compdsl.helpers import fold_repaint
 
 
 MAPPING: dict[Any, Any] = {
@@ -441,17 +443,6 @@ def placeTemplate(canvas: Grid, region: CellRegion, template: Grid) -> Grid:
     return _blit(canvas, template, top, left, slot_h, slot_w)
 
 
-T = TypeVar("T")
-
-
-def fold_repaint(canvas: Grid, items: Iterable[T], update: Callable[[Grid, T], Grid]) -> Grid:
-    """Right-fold style reducer to sequentially repaint onto a canvas."""
-    acc = canvas
-    for item in items:
-        acc = update(acc, item)
-    return acc
-
-
 def solve_65b59efc(grid: Grid) -> Grid:
     regions = segmentBoardCells(grid)
     tiles = [(region, lookupCellTemplate(region)) for region in regions]
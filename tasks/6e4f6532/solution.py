@@ -1,7 +1,10 @@
 """Hand-tuned solver for ARC-AGI-2 task 6e4f6532 (evaluation split)."""
 
 from collections import Counter, deque
-from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import Iterable, List, Optional, Tuple
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint, majority_color as _most_common_color
+from compdsl.templates import paint
 
 
 Grid = List[List[int]]
@@ -80,13 +83,6 @@ PATTERNS: dict[tuple[tuple[int, int], ...], List[Tuple[int, int, int]]] = {
 }
 
 
-def _most_common_color(grid: Grid) -> int:
-    """Return the color appearing most frequently in the grid."""
-
-    counts = Counter(val for row in grid for val in row)
-    return counts.most_common(1)[0][0]
-
-
 def _describe_components(grid: Grid, base: int) -> List[dict]:
     """Return metadata for every 4-connected component not in the base color."""
 
@@ -149,10 +145,6 @@ def _describe_components(grid: Grid, base: int) -> List[dict]:
     return components
 
 
-def mostCommonColor(grid: Grid) -> int:
-    return _most_common_color(grid)
-
-
 def extractComponents(grid: Grid) -> List[dict]:
     base = _most_common_color(grid)
     comps = _describe_components(grid, base)
@@ -207,33 +199,15 @@ def clearObjects(grid: Grid, objects: List[dict], base: int) -> Grid:
 
 
 def stampPatternAtMarker(canvas: Grid, pattern: List[Tuple[int, int, int]], marker: dict) -> Grid:
-    height = len(canvas)
-    width = len(canvas[0])
-    out = [row[:] for row in canvas]
+    writes: List[Tuple[int, int, int]] = []
     # clear associated object's original cells to base if provided
     base = marker.get("base")
     obj_cells = marker.get("obj_cells")
     if base is not None and obj_cells is not None:
-        for r, c in obj_cells:
-            if 0 <= r < height and 0 <= c < width:
-                out[r][c] = base
+        writes.extend((r, c, base) for r, c in obj_cells)
     min_r, min_c = marker["min_rc"]
-    for dr, dc, val in pattern:
-        r = min_r + dr
-        c = min_c + dc
-        if 0 <= r < height and 0 <= c < width:
-            out[r][c] = val
-    return out
-
-
-T = TypeVar("T")
-
-
-def fold_repaint(canvas: Grid, items: Sequence[T], update: Callable[[Grid, T], Grid]) -> Grid:
-    acc = [row[:] for row in canvas]
-    for it in items:
-        acc = update(acc, it)
-    return acc
+    writes.extend((min_r + dr, min_c + dc, val) for dr, dc, val in pattern)
+    return paint(canvas, writes)
 
 
 def solve_6e4f6532(grid: Grid) -> Grid:
@@ -3,16 +3,14 @@
 from collections import Counter, deque
 from typing import List, Tuple, Set, Optional
 
+from compdsl.helpers import copy_grid
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 Component = List[Cell]
 Summary = Tuple[int, int, int]  # (u = r+c, v_min = min(c-r), v_max = max(c-r))
 
 
-def copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def background_and_single_foreground(grid: Grid) -> Tuple[int, Optional[int]]:
     if not grid or not grid[0]:
         return 0, None
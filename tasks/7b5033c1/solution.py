@@ -1,19 +1,23 @@
 """Solver for ARC-AGI-2 task 7b5033c1."""
 
 from typing import Dict, List, Tuple
-from collections import Counter
+
+from compdsl.primitives import color_histogram, first_positions
 
 Grid = List[List[int]]
 
+# Runs unchanged on every primitive backend (harness.registry.load_solver).  The
+# output column is as large as the input and built in Python, so NumPy does
+# not pay off here; the declaration demonstrates backend portability.
+BACKENDS = ("python", "numpy", "auto")
+
 
 def tallyColours(grid: Grid) -> Dict[int, int]:
-    return dict(Counter(color for row in grid for color in row))
+    return color_histogram(grid)
 
 
 def findFirstPosition(grid: Grid) -> Dict[int, Tuple[int, int]]:
-    positions = [(color, (r, c)) for r, row in enumerate(grid) for c, color in enumerate(row)]
-    ordered = sorted(positions, key=lambda t: (t[1][0], t[1][1]))
-    return {color: pos for color, pos in reversed(ordered)}
+    return first_positions(grid)
 
 
 def orderColoursByFirstSeen(counts: Dict[int, int], first_seen: Dict[int, Tuple[int, int]]) -> List[Tuple[int, int]]:
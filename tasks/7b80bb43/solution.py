@@ -12,10 +12,6 @@ BoolMatrix = List[List[bool]]
 ColumnMasks = Dict[int, List[bool]]
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def computeForegroundMask(grid: Grid) -> Tuple[int, int, BoolMatrix]:
     """Return (foreground_color, background_color, mask) for the dominant line color.
 
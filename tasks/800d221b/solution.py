@@ -22,6 +22,9 @@ from collections import Counter, deque
 from functools import lru_cache
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+from compdsl.helpers import fold_repaint_copy as fold_repaint
+from compdsl.memo import memoize_grid_op
+
 Grid = List[List[int]]
 Coord = Tuple[int, int]
 Component = List[Coord]
@@ -162,12 +165,18 @@ def _distance_map(comp: set[Coord], seeds: set[Coord]) -> Dict[Coord, int]:
     return dist
 
 
+@memoize_grid_op(copy_results=False)
+def _colour_counts(grid: Grid) -> Counter[int]:
+    # Shared read-only by both colour queries, each called twice per solve.
+    return Counter(val for row in grid for val in row)
+
+
 def _dominant_colour(grid: Grid) -> int:
-    return Counter(val for row in grid for val in row).most_common(1)[0][0]
+    return _colour_counts(grid).most_common(1)[0][0]
 
 
 def _guess_target_colour(grid: Grid) -> int:
-    counts = Counter(val for row in grid for val in row)
+    counts = _colour_counts(grid)
     bg = counts.most_common(1)[0][0]
     for colour, _ in counts.most_common():
         if colour != bg:
@@ -276,11 +285,9 @@ def repaintByLabels(canvas: Grid, component: Component, labels: List[Label], col
     return out
 
 
-def fold_repaint(canvas: Grid, items: List[Component], update) -> Grid:
-    out = [row[:] for row in canvas]
-    for item in items:
-        out = update(out, item)
-    return out
+def prepare_800d221b() -> List[Tuple[Feature, str]]:
+    """Batch hook: build the kNN training set once before solving many grids."""
+    return _training_samples()
 
 
 def solve_800d221b(grid: Grid) -> Grid:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from compdsl.helpers import copy_grid as _copy_grid, fold_repaint
 
 
 Grid = List[List[int]]
@@ -11,10 +13,6 @@ Color = int
 Pos = Tuple[int, int]
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def background_palette(grid: Grid) -> set[int]:
     counts = Counter(pixel for row in grid for pixel in row)
     palette = {c for c in (0, 1) if c in counts}
@@ -146,13 +144,6 @@ def extendAlongAxis(canvas: Grid, handle_runs, colour: Color) -> Grid:
     return output
 
 
-def fold_repaint(canvas: Grid, items: Sequence[Color], update: Callable[[Grid, Color], Grid]) -> Grid:
-    result = canvas
-    for item in items:
-        result = update(result, item)
-    return result
-
-
 def solve_80a900e0(grid: Grid) -> Grid:
     handles = groupHandlesByColour(grid)
     handle_runs = findHandleRuns(handles)
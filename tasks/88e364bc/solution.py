@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Callable, Iterable, List, Optional, Tuple, cast
+from typing import Iterable, List, Optional, Tuple, cast
+
+from compdsl.helpers import copy_grid as _copy_grid, fold_repaint
 
 # Typed aliases used by the DSL-style solver
 Grid = List[List[int]]
@@ -64,10 +66,6 @@ BLOCK_RULES: dict[Key5x5, Optional[Position]] = {
 }
 
 
-def _copy_grid(g: Grid) -> Grid:
-    return [row[:] for row in g]
-
-
 def enumerateBlocks5x5(grid: Grid) -> Iterable[Block]:
     """Yield each full 5x5 block as (top,left,data). If grid is not divisible by 5, yield none (preserves identity)."""
     h = len(grid)
@@ -108,13 +106,6 @@ def placeFourAtOffset(canvas: Grid, block: Block, position: Position) -> Grid:
     return out
 
 
-def fold_repaint(canvas: Grid, items: Iterable[Block], update: Callable[[Grid, Block], Grid]) -> Grid:
-    out = canvas
-    for x in items:
-        out = update(out, x)
-    return out
-
-
 def solve_88e364bc(grid: Grid) -> Grid:
     blocks = list(enumerateBlocks5x5(grid))
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections import Counter, defaultdict, deque
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid, fold_repaint_copy as fold_repaint
+
 
 Grid = List[List[int]]
 # Use an immutable, hashable representation for components so they can be dict keys.
@@ -13,12 +15,6 @@ Component = Tuple[Tuple[int, int], ...]
 
 # --- Minimal functional DSL helpers (runtime implementations) ---
 
-def fold_repaint(initial: Grid, items: List[Component], update):
-    canvas = [row[:] for row in initial]
-    for item in items:
-        canvas = update(canvas, item)
-    return canvas
-
 
 class _Info:
     def __init__(
@@ -36,10 +32,6 @@ class _Info:
         self.has_higher = has_higher
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _zero_components(grid: Sequence[Sequence[int]]) -> List[Component]:
     h, w = len(grid), len(grid[0])
     seen = [[False] * w for _ in range(h)]
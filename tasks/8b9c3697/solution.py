@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from compdsl.helpers import copy_grid as _copy
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 
 
-def _copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _background(grid: Grid) -> int:
     counts = [0] * 10
     for row in grid:
@@ -6,23 +6,13 @@ deletions and trim asymmetric pixels using a fold-style repaint.
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from compdsl.helpers import fold_repaint, majority_color as background_color
 
 Grid = List[List[int]]
 Pos = Tuple[int, int]
-T = TypeVar("T")
-
-
-def fold_repaint(canvas: Grid, items: Sequence[T], update: Callable[[Grid, T], Grid]) -> Grid:
-    acc = canvas
-    for x in items:
-        acc = update(acc, x)
-    return acc
-
-
-def background_color(grid: Grid) -> int:
-    return Counter(pixel for row in grid for pixel in row).most_common(1)[0][0]
 
 
 def groupCellsByColor(grid: Grid) -> Dict[int, List[Pos]]:
@@ -11,8 +11,9 @@ then determine which interior columns in the frame are repainted.
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint, majority_color as _most_common_color
 
 # DSL-friendly type aliases
 Grid = List[List[int]]
@@ -90,10 +91,6 @@ PATCH_STRIPES: Dict[Tuple[Tuple[int, ...], ...], int] = {
 }
 
 
-def _most_common_color(grid: Sequence[Sequence[int]]) -> int:
-    return Counter(v for row in grid for v in row).most_common(1)[0][0]
-
-
 def _find_blocks(
     grid: Sequence[Sequence[int]], background: int
 ) -> Iterable[Tuple[int, int, int, int, int]]:
@@ -287,13 +284,6 @@ def clearNoise(canvas: Grid, frames: List[Frame]) -> Grid:
     return out
 
 
-def fold_repaint(canvas: Grid, items: List[Frame], update: Callable[[Grid, Frame], Grid]) -> Grid:
-    acc = [row[:] for row in canvas]
-    for item in items:
-        acc = update(acc, item)
-    return acc
-
-
 def solve_8f215267(grid: Grid) -> Grid:
     frames = extractFrames(grid)
 
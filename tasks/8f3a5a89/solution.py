@@ -8,6 +8,9 @@ Refactored to match the DSL-style lambda while preserving behavior.
 from collections import deque
 from typing import Iterable, List, Set, Tuple
 
+from compdsl.bitmask import BitGrid
+from compdsl.helpers import copy_grid as _copy_grid
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 
@@ -18,10 +21,6 @@ def _shape(grid: Grid) -> Tuple[int, int]:
     return h, w
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _in_bounds(h: int, w: int, r: int, c: int) -> bool:
     return 0 <= r < h and 0 <= c < w
 
@@ -31,22 +30,9 @@ def floodAccessibleBackground(grid: Grid) -> Set[Cell]:
     h, w = _shape(grid)
     if h == 0 or w == 0:
         return set()
-    acc: Set[Cell] = set()
-    seen = [[False] * w for _ in range(h)]
-    q: deque[Cell] = deque()
-    for r in range(h):
-        if grid[r][0] == 8 and not seen[r][0]:
-            seen[r][0] = True
-            q.append((r, 0))
-    while q:
-        r, c = q.popleft()
-        acc.add((r, c))
-        for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nr, nc = r + dr, c + dc
-            if _in_bounds(h, w, nr, nc) and grid[nr][nc] == 8 and not seen[nr][nc]:
-                seen[nr][nc] = True
-                q.append((nr, nc))
-    return acc
+    board = BitGrid(h, w)
+    background = board.mask_of(grid, 8)
+    return set(board.cells(board.flood(background & board.left, background)))
 
 
 def labelInaccessibleRegions(grid: Grid, accessible: Set[Cell]) -> List[List[bool]]:
@@ -56,30 +42,13 @@ def labelInaccessibleRegions(grid: Grid, accessible: Set[Cell]) -> List[List[boo
     containing (r,c) touches any border. Cells in `accessible` are ignored.
     """
     h, w = _shape(grid)
-    touch = [[False] * w for _ in range(h)]
-    all_cells = {(r, c) for r in range(h) for c in range(w)}
-    blocked = all_cells - accessible
-    visited: Set[Cell] = set()
-    for cell in blocked:
-        if cell in visited:
-            continue
-        q: deque[Cell] = deque([cell])
-        visited.add(cell)
-        component: List[Cell] = []
-        touches_border = False
-        while q:
-            r, c = q.popleft()
-            component.append((r, c))
-            if r in (0, h - 1) or c in (0, w - 1):
-                touches_border = True
-            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nr, nc = r + dr, c + dc
-                if _in_bounds(h, w, nr, nc) and (nr, nc) in blocked and (nr, nc) not in visited:
-                    visited.add((nr, nc))
-                    q.append((nr, nc))
-        for r, c in component:
-            touch[r][c] = touches_border
-    return touch
+    board = BitGrid(h, w)
+    blocked = board.full & ~board.mask_from_cells(accessible)
+    touching = 0
+    for component in board.components(blocked):
+        if board.touches_border(component):
+            touching |= component
+    return board.to_bool_grid(touching)
 
 
 def pruneOnes(grid: Grid, accessible: Set[Cell]) -> Grid:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from typing import NamedTuple
 
+from compdsl.helpers import fold_repaint_copy as fold_repaint
+from compdsl.rle import RLEGrid
+
 
 # Local DSL type aliases
 Grid = List[List[int]]
@@ -20,33 +23,12 @@ ColumnRuns = Dict[int, List[Run]]
 CapPattern = Tuple[Run, Run, Run]
 
 
-def fold_repaint(initial: Grid, items: List[Tuple[int, List[Run]]], update: Callable[[Grid, Tuple[int, List[Run]]], Grid]) -> Grid:
-    canvas = [row[:] for row in initial]
-    for item in items:
-        canvas = update(canvas, item)
-    return canvas
-
-
 def parseColumnRuns(grid: Grid) -> ColumnRuns:
-    h, w = len(grid), len(grid[0])
-    cols: ColumnRuns = {}
-    for c in range(w):
-        runs: List[Run] = []
-        current = grid[0][c]
-        length = 1
-        start = 0
-        for r in range(1, h):
-            val = grid[r][c]
-            if val == current:
-                length += 1
-            else:
-                runs.append(Run(current, length, start))
-                start += length
-                current = val
-                length = 1
-        runs.append(Run(current, length, start))
-        cols[c] = runs
-    return cols
+    encoded = RLEGrid(grid)
+    return {
+        c: [Run(run.color, run.length, run.start) for run in encoded.col(c)]
+        for c in range(encoded.width)
+    }
 
 
 def detectCapPattern(runs: List[Run]) -> Optional[CapPattern]:
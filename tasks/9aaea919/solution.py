@@ -1,18 +1,14 @@
 """Solver for ARC task 9aaea919 (evaluation split)."""
 
-from collections import Counter
-from typing import Any, Callable, Dict, Iterable, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+from compdsl.helpers import fold_repaint, majority_color as getBackground
 
 
 Grid = List[List[int]]
 ColumnIndex = int
 
 
-def _get_background(grid: Grid) -> int:
-    flat = [cell for row in grid for cell in row]
-    return Counter(flat).most_common(1)[0][0]
-
-
 def _find_cross_columns(grid: Grid) -> Dict[int, Dict[str, Any]]:
     height, width = len(grid), len(grid[0])
     visited = [[False] * width for _ in range(height)]
@@ -177,26 +173,12 @@ def _build_assignments(
     return assignments
 
 
-def fold_repaint(
-    canvas: Grid, items: Iterable[Any], update: Callable[[Grid, Any], Grid]
-) -> Grid:
-    """Functional fold over items to repaint the canvas."""
-    g = canvas
-    for x in items:
-        g = update(g, x)
-    return g
-
-
 # Public DSL-named wrappers to align with abstractions.md
 
 def extractCrossColumns(grid: Grid) -> Dict[int, Dict[str, Any]]:
     return _find_cross_columns(grid)
 
 
-def getBackground(grid: Grid) -> int:
-    return _get_background(grid)
-
-
 def readInstructionSegments(grid: Grid) -> List[Tuple[int, int, int]]:
     return _instruction_segments(grid, getBackground(grid))
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections import defaultdict, deque
 from typing import Dict, Iterable, List, Tuple
 
+from compdsl.helpers import fold_repaint_copy as fold_repaint
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 ColourCentres = Dict[int, List[Cell]]
@@ -293,13 +295,6 @@ def placeDiagonalX(canvas: Grid, centre: Tuple[int, int], colour: int) -> Grid:
     return out
 
 
-def fold_repaint(canvas: Grid, items: Iterable, update):
-    out = [row[:] for row in canvas]
-    for entry in items:
-        out = update(out, entry)
-    return out
-
-
 def solve_a47bf94d(grid: Grid) -> Grid:
     squares = detect3x3Squares(grid)
     plus_axes, x_axes = detectExistingPatterns(grid)
@@ -5,14 +5,13 @@ from __future__ import annotations
 from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple, cast
 
+from compdsl.fixpoint import line_fixpoint
+from compdsl.helpers import copy_grid as _clone
+
 # Simple alias to support the typed lambda in the DSL doc.
 Grid = List[List[int]]
 
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def detectFrame(grid: Grid) -> Dict[str, Any]:
     """Detect the smallest valid rectangular frame and basic stats.
 
@@ -341,53 +340,55 @@ def closeGaps(current: Grid, frame: Dict[str, Any]) -> Grid:
     inner_height: int = frame.get("inner_height")  # type: ignore[assignment]
     inner_width: int = frame.get("inner_width")  # type: ignore[assignment]
 
-    changed = True
-    while changed:
-        changed = False
-        # Horizontal pass
-        for r in range(inner_height):
-            last_color: Optional[int] = None
-            last_idx: Optional[int] = None
-            for c in range(inner_width):
-                val = result[r][c]
-                if val == base_color:
-                    continue
-                if last_color is None:
-                    last_color = val
-                    last_idx = c
-                    continue
-                if val == last_color and last_idx is not None and c - last_idx == 2:
-                    mid = last_idx + 1
-                    if result[r][mid] == base_color:
-                        result[r][mid] = val
-                        changed = True
-                    last_idx = c
-                else:
-                    last_color = val
-                    last_idx = c
-        # Vertical pass
+    def closeRow(r: int) -> List[Tuple[int, int]]:
+        filled: List[Tuple[int, int]] = []
+        last_color: Optional[int] = None
+        last_idx: Optional[int] = None
         for c in range(inner_width):
-            last_color = None
-            last_idx = None
-            for r in range(inner_height):
-                val = result[r][c]
-                if val == base_color:
-                    continue
-                if last_color is None:
-                    last_color = val
-                    last_idx = r
-                    continue
-                if val == last_color and last_idx is not None and r - last_idx > 1:
-                    fill_range = range(last_idx + 1, r)
-                    if all(result[k][c] == base_color for k in fill_range):
-                        for k in fill_range:
-                            result[k][c] = val
-                        changed = True
-                    last_idx = r
-                else:
-                    last_color = val
-                    last_idx = r
-
+            val = result[r][c]
+            if val == base_color:
+                continue
+            if last_color is None:
+                last_color = val
+                last_idx = c
+                continue
+            if val == last_color and last_idx is not None and c - last_idx == 2:
+                mid = last_idx + 1
+                if result[r][mid] == base_color:
+                    result[r][mid] = val
+                    filled.append((r, mid))
+                last_idx = c
+            else:
+                last_color = val
+                last_idx = c
+        return filled
+
+    def closeColumn(c: int) -> List[Tuple[int, int]]:
+        filled: List[Tuple[int, int]] = []
+        last_color: Optional[int] = None
+        last_idx: Optional[int] = None
+        for r in range(inner_height):
+            val = result[r][c]
+            if val == base_color:
+                continue
+            if last_color is None:
+                last_color = val
+                last_idx = r
+                continue
+            if val == last_color and last_idx is not None and r - last_idx > 1:
+                fill_range = range(last_idx + 1, r)
+                if all(result[k][c] == base_color for k in fill_range):
+                    for k in fill_range:
+                        result[k][c] = val
+                        filled.append((k, c))
+                last_idx = r
+            else:
+                last_color = val
+                last_idx = r
+        return filled
+
+    # Horizontal then vertical passes until stable; only lines touched by a fill are rescanned.
+    line_fixpoint(inner_height, inner_width, closeRow, closeColumn)
     return result
 
 
@@ -1,7 +1,8 @@
 """ARC-AGI-2 task aa4ec2a5 – DSL-style solver with identical semantics."""
 
-from collections import Counter
-from typing import Callable, Dict, Iterable, List, Set, Tuple
+from typing import Dict, List, Set, Tuple
+
+from compdsl.helpers import fold_repaint, majority_color as background_color
 
 
 Grid = List[List[int]]
@@ -12,10 +13,6 @@ Component = Tuple[Set[Cell], Dict[int, List[int]], Tuple[int, int, int, int]]
 DIRS: List[Cell] = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
 
-def background_color(grid: Grid) -> int:
-    return Counter(val for row in grid for val in row).most_common(1)[0][0]
-
-
 def in_bounds(h: int, w: int, r: int, c: int) -> bool:
     return 0 <= r < h and 0 <= c < w
 
@@ -144,13 +141,6 @@ def markComponentBody(canvas: Grid, component: Component, has_hole: bool) -> Gri
 # (no separate paintHoles; handled by markComponentBody)
 
 
-def fold_repaint(canvas: Grid, items: Iterable[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    acc = canvas
-    for item in items:
-        acc = update(acc, item)
-    return acc
-
-
 def solve_aa4ec2a5(grid: Grid) -> Grid:
     components = extractOneComponents(grid)
 
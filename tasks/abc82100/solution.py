@@ -351,6 +351,11 @@ def nearestColour(feats: FeatureVector, samples: Iterable[Tuple[FeatureVector, C
     return _nearest_colour(feats, samples)
 
 
+def prepare_abc82100() -> List[Tuple[FeatureVector, Color]]:
+    """Batch hook: build the training feature table once before solving many grids."""
+    return loadTrainingFeatures(None)
+
+
 def solve_abc82100(grid: Grid) -> Grid:
     samples = loadTrainingFeatures(None)
     row_stats, col_stats, bounds = precomputeAxisStats(grid)
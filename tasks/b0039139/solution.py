@@ -5,15 +5,14 @@ from __future__ import annotations
 from collections import deque
 from typing import List, Tuple
 
+from compdsl.lines import full_lines
+
 
 Grid = List[List[int]]
 
 
 def findFullLines(grid: Grid) -> Tuple[List[int], List[int]]:
-    rows, cols = len(grid), len(grid[0])
-    row_breaks = [r for r in range(rows) if all(cell == 1 for cell in grid[r])]
-    col_breaks = [c for c in range(cols) if all(grid[r][c] == 1 for r in range(rows))]
-    return row_breaks, col_breaks
+    return full_lines(grid, 1)
 
 
 def _slice_by_breaks(grid: Grid, breaks: List[int], axis: str) -> List[Grid]:
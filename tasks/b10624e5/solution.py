@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Callable, Iterable, List, Sequence, Tuple, TypedDict, Optional
+from typing import List, Sequence, Tuple, TypedDict, Optional
+
+from compdsl.helpers import copy_grid as _clone_grid, fold_repaint
 
 # Typed aliases for clarity and mypy
 Grid = List[List[int]]
@@ -18,10 +20,6 @@ class OrnamentPalette(TypedDict, total=False):
     outer_v: int | None
 
 
-def _clone_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def findCenterCross(grid: Grid) -> Tuple[int, int]:
     """Locate the dominant row and column of ones that form the cross."""
     # Reset per-solve globals to ensure purity across calls
@@ -260,13 +258,6 @@ def paintOrnaments(canvas: Grid, component: Component, palette: OrnamentPalette)
     return result
 
 
-def fold_repaint(canvas: Grid, items: Iterable[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    result = canvas
-    for item in items:
-        result = update(result, item)
-    return result
-
-
 def solve_b10624e5(grid: Grid) -> Grid:
     cross = findCenterCross(grid)
     components = extractTwoComponents(grid)
@@ -24,10 +24,6 @@ class LanePlan:
     right_avg_left: Optional[float] = None
 
 
-def copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def detectRingObjects(grid: Grid) -> List[Ring]:
     h = len(grid)
     w = len(grid[0]) if h else 0
@@ -3,14 +3,12 @@
 from __future__ import annotations
 from typing import List, Tuple, Dict, Set
 
+from compdsl.helpers import copy_grid
+
 # Typed alias used by the DSL lambda and local helpers
 Grid = List[List[int]]
 
 
-def copy_grid(grid):
-    return [row[:] for row in grid]
-
-
 def count_colors(grid):
     counts = {}
     for row in grid:
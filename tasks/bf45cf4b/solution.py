@@ -1,8 +1,9 @@
 """Solver for ARC-AGI-2 task bf45cf4b (DSL-aligned composition)."""
 
-from collections import Counter
 from typing import List, Tuple
 
+from compdsl.helpers import cells_bbox as _bounding_box, majority_color as majorityColor
+
 
 Grid = List[List[int]]
 Component = List[Tuple[int, int]]
@@ -40,18 +41,8 @@ def _extract_components(grid: Grid, background: int) -> List[Component]:
     return components
 
 
-def _bounding_box(cells: Component) -> Tuple[int, int, int, int]:
-    rows = [r for r, _ in cells]
-    cols = [c for _, c in cells]
-    return min(rows), max(rows), min(cols), max(cols)
-
-
 # === DSL helper primitives (pure) ===
 
-def majorityColor(grid: Grid) -> Color:
-    return Counter(cell for row in grid for cell in row).most_common(1)[0][0]
-
-
 def extractComponents(grid: Grid) -> Tuple[Component, Component]:
     background = majorityColor(grid)
     components = _extract_components(grid, background)
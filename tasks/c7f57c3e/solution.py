@@ -1,23 +1,14 @@
 """Solver for ARC-AGI-2 task c7f57c3e (evaluation split)."""
 
-from collections import Counter, deque
+from collections import deque
 from typing import List, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid, majority_color as _most_common_color
+
 Grid = List[List[int]]
 Color = int
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
-def _most_common_color(grid: Grid) -> Color:
-    counts: Counter[int] = Counter()
-    for row in grid:
-        counts.update(row)
-    return counts.most_common(1)[0][0]
-
-
 def _palette_without(grid: Grid, background: Color) -> list[int]:
     colors = {val for row in grid for val in row if val != background}
     return sorted(colors)
@@ -4,15 +4,9 @@ from __future__ import annotations
 
 from typing import Iterable, List, Sequence, Tuple
 
-Grid = List[List[int]]
-
-
-def copy_grid(grid):
-    return [row[:] for row in grid]
+from compdsl.helpers import copy_grid, transpose
 
-
-def transpose(grid):
-    return [list(col) for col in zip(*grid)]
+Grid = List[List[int]]
 
 
 def get_components(grid):
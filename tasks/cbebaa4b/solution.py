@@ -3,6 +3,8 @@
 from collections import Counter, defaultdict, deque
 from typing import Dict, Iterable, List, Sequence, Tuple, cast
 
+from compdsl.helpers import copy_grid as deep_copy
+
 
 Grid = List[List[int]]
 Point = Tuple[int, int]
@@ -23,10 +25,6 @@ def in_bounds(h: int, w: int, r: int, c: int) -> bool:
     return 0 <= r < h and 0 <= c < w
 
 
-def deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def get_components(grid: Grid) -> Tuple[List[Dict[str, object]], List[List[int]]]:
     """Return connected components (excluding colours 0 and 2) and owner map."""
 
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Callable, List, Set, Tuple, TypedDict
+from typing import List, Set, Tuple, TypedDict
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint
 
 Grid = List[List[int]]
 
@@ -21,12 +23,6 @@ class Component(TypedDict):
 
 # --- Minimal DSL helpers ----------------------------------------------------
 
-def fold_repaint(canvas: Grid, items: List[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    result = [row[:] for row in canvas]
-    for item in items:
-        result = update(result, item)
-    return result
-
 
 def extractNonSevenComponents(grid: Grid) -> List[Component]:
     """Return 4-connected components of non-7 cells with basic stats."""
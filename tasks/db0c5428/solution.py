@@ -5,19 +5,12 @@ from __future__ import annotations
 from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid, majority_color as _most_common_color
+
 Grid = List[List[int]]
 Block = List[List[int]]
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
-def _most_common_color(grid: Grid) -> int:
-    counts: Counter[int] = Counter(value for row in grid for value in row)
-    return counts.most_common(1)[0][0]
-
-
 def _bounding_box(grid: Grid, background: int) -> Optional[Tuple[int, int, int, int]]:
     coords = [(r, c) for r, row in enumerate(grid) for c, value in enumerate(row) if value != background]
     if not coords:
@@ -5,16 +5,14 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Dict, List, Tuple, Set, Iterable
 
+from compdsl.helpers import copy_grid as _clone
+
 Grid = List[List[int]]
 Coord = Tuple[int, int]
 DiagonalGroups = Dict[str, Dict[int, List[Coord]]]
 SixSeeds = Dict[str, Set[Coord]]
 
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _fill_nwse_path(grid: Grid, output: Grid, coords: List[Coord], six_seeds: SixSeeds) -> None:
     """Fill the NW–SE diagonal segment defined by coords with color 1, collect 6 seeds for anti-diagonal extension."""
     key = coords[0][0] - coords[0][1]  # r - c stays constant on NW–SE diagonals
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Callable, List, Optional, Set, Tuple, TypedDict
+from typing import List, Optional, Set, Tuple, TypedDict
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint
 
 
 # --- Types ---
@@ -31,11 +33,6 @@ def _in_bounds(r: int, c: int, rows: int, cols: int) -> bool:
 
 
 # --- DSL helper primitives ---
-def fold_repaint(canvas: Grid, items: List[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    acc = [row[:] for row in canvas]
-    for it in items:
-        acc = update(acc, it)
-    return acc
 
 
 def enumerateZeroCavities(grid: Grid) -> List[Component]:
@@ -2,16 +2,14 @@
 
 from typing import List, Tuple
 
+from compdsl.helpers import copy_grid as _copy_grid
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 Color = int
 Seed = Tuple[Cell, Color]
 
 
-def _copy_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _dims(grid: Grid) -> Tuple[int, int]:
     return len(grid), len(grid[0]) if grid else 0
 
@@ -2,6 +2,8 @@
 
 from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
+from compdsl.templates import overlay
+
 Grid = List[List[int]]
 Cell = Tuple[int, int]
 Patch = Tuple[Tuple[int, ...], ...]
@@ -218,23 +220,6 @@ def _extract_patch(grid: Grid, r: int, c: int) -> Patch:
     return tuple(patch_rows)
 
 
-def _stamp_patch(out: Grid, patch: Patch, r: int, c: int) -> None:
-    """Overlay a 4x4 patch onto the output grid, ignoring zero entries."""
-
-    rows = len(out)
-    cols = len(out[0])
-    for dr, patch_row in enumerate(patch):
-        rr = r + dr
-        if rr >= rows:
-            break
-        for dc, val in enumerate(patch_row):
-            if val == 0:
-                continue
-            cc = c + dc
-            if cc >= cols:
-                continue
-            out[rr][cc] = val
-
 def extractPatch4x4(grid: Grid, cell: Cell) -> Patch:
     return _extract_patch(grid, cell[0], cell[1])
 
@@ -247,9 +232,7 @@ def lookupPatchTemplate(colour: int, patch: Patch) -> Optional[Patch]:
 
 
 def stampTemplate(canvas: Grid, template: Patch, cell: Cell) -> Grid:
-    out = [row[:] for row in canvas]
-    _stamp_patch(out, template, cell[0], cell[1])
-    return out
+    return overlay(canvas, template, cell[0], cell[1], transparent=0)
 
 
 T = TypeVar("T")
@@ -5,8 +5,9 @@ Refactored to match the typed-DSL lambda while preserving behaviour.
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from compdsl.helpers import copy_grid as _clone, fold_repaint, majority_color as _dominant_color
 
 # Type aliases for readability and mypy.
 Grid = List[List[int]]
@@ -250,19 +251,8 @@ DIGIT_TEMPLATE_VARIANTS = {
 }
 
 
-def _clone(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 # Helper routines ---------------------------------------------------------
 
-def _dominant_color(grid: Grid) -> int:
-    counter: Counter[int] = Counter()
-    for row in grid:
-        counter.update(row)
-    return counter.most_common(1)[0][0]
-
-
 def _components(grid: Grid) -> Iterable[Tuple[int, List[Cell]]]:
     height = len(grid)
     width = len(grid[0])
@@ -385,14 +375,6 @@ def paintDigitTemplate(canvas: Grid, seed: Seed, offsets: Sequence[Offset]) -> G
     return out
 
 
-def fold_repaint(canvas: Grid, items: Iterable[Seed], update: Callable[[Grid, Seed], Grid]) -> Grid:
-    """Functional fold: repeatedly repaint the canvas for each item."""
-    acc = canvas
-    for it in items:
-        acc = update(acc, it)
-    return acc
-
-
 def solve_e12f9a14(grid: Grid) -> Grid:
     components = extractComponents(grid)
     seeds = filterSeedBlocks(components)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Callable, Iterable, List, Sequence, Tuple
+from typing import Iterable, List, Tuple
+
+from compdsl.helpers import copy_grid as _clone_grid, fold_repaint_copy as fold_repaint
 
 
 # Type aliases for clarity and mypy
@@ -101,10 +103,6 @@ def _classify_component_impl(mask: Mask, holes: int) -> Color:
     return 2
 
 
-def _clone_grid(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 # --- DSL surface (typed ops used by the lambda) ---
 
 def extractComponents(grid: Grid, target: int) -> List[Component]:
@@ -130,13 +128,6 @@ def paintComponent(canvas: Grid, component: Component, colour: Color) -> Grid:
     return out
 
 
-def fold_repaint(canvas: Grid, items: Sequence[Component], update: Callable[[Grid, Component], Grid]) -> Grid:
-    acc = _clone_grid(canvas)
-    for it in items:
-        acc = update(acc, it)
-    return acc
-
-
 # --- Main solver rewritten to match the DSL Lambda Representation ---
 
 def solve_e3721c99(grid: Grid) -> Grid:
@@ -7,9 +7,12 @@ function matches the Lambda Representation in `abstractions.md` exactly.
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import Counter
 from typing import Dict, Iterable, List, Literal, Sequence, Tuple, Union
 
+from compdsl.helpers import copy_grid as _deep_copy
+from compdsl.lines import group_by_line, line_histograms
+
 Grid = List[List[int]]
 Color = int
 Cell = Tuple[int, int, int]  # (row, col, color)
@@ -24,28 +27,12 @@ Diag2Pattern = Tuple[Literal["diag2"], List[Tuple[int, int]], int]
 Pattern = Union[RowPattern, ColPattern, Diag1Pattern, Diag2Pattern]
 
 
-def _deep_copy(grid: Grid) -> Grid:
-    return [row[:] for row in grid]
-
-
 def _flatten(grid: Grid) -> Iterable[int]:
     for row in grid:
         for value in row:
             yield value
 
 
-def _orientation_key(name: Orientation, r: int, c: int) -> int:
-    if name == "row":
-        return r
-    if name == "col":
-        return c
-    if name == "diag1":  # main diagonal (slope +1)
-        return r - c
-    if name == "diag2":  # anti-diagonal (slope -1)
-        return r + c
-    raise ValueError(name)
-
-
 # === DSL helper operations ===
 
 def collectColoredCells(grid: Grid) -> Tuple[Color, List[Cell]]:
@@ -62,20 +49,14 @@ def collectColoredCells(grid: Grid) -> Tuple[Color, List[Cell]]:
 
 def scoreOrientations(coloured_cells: List[Cell]) -> Tuple[Orientation, LineGroups]:
     orientations: Sequence[Orientation] = ("row", "col", "diag1", "diag2")
-    scored: Dict[Orientation, Tuple[int, int]] = {}
-    grouped: Dict[Orientation, LineGroups] = {}
-
-    for name in orientations:
-        lines: LineGroups = defaultdict(list)
-        for r, c, val in coloured_cells:
-            lines[_orientation_key(name, r, c)].append((r, c, val))
-        score = sum(len(group) - 1 for group in lines.values() if len(group) > 1)
-        max_len = max((len(group) for group in lines.values()), default=0)
-        scored[name] = (score, max_len)
-        grouped[name] = lines
+    rows = [r for r, _, _ in coloured_cells]
+    cols = [c for _, c, _ in coloured_cells]
+    # Score all orientations from line-key counts; only the winner is grouped.
+    histograms = line_histograms(rows, cols)
+    scored: Dict[Orientation, Tuple[int, int]] = {name: histograms[name].score() for name in orientations}
 
     best: Orientation = max(orientations, key=lambda nm: scored[nm])
-    return best, grouped[best]
+    return best, group_by_line(best, rows, cols, coloured_cells)
 
 
 def extractMedianPattern(orientation: Orientation, line_groups: LineGroups) -> Pattern:
@@ -1,7 +1,9 @@
 """Solver for ARC-AGI-2 task e87109e9 (evaluation split)."""
 
 from collections import Counter
-from typing import Any, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from compdsl.helpers import fold_repaint_copy as fold_repaint
 
 # Typed aliases used by the DSL-style main
 Grid = List[List[int]]
@@ -125,13 +127,6 @@ def applyDiffMask(canvas: Grid, block: int, target_colour: Color, diff_mask: Mas
     return out
 
 
-def fold_repaint(canvas: Grid, items: Sequence[int], update):
-    g = [row[:] for row in canvas]
-    for x in items:
-        g = update(g, x)
-    return g
-
-
 def _find_body_start(grid):
     for idx, row in enumerate(grid):
         if _HEADER_COLOR not in row:
@@ -3,20 +3,14 @@
 from collections import defaultdict
 from typing import List, Tuple
 
+from compdsl.helpers import transpose as _transpose
+
 
 # Shared type aliases
 Grid = List[List[int]]
 RowPlan = Tuple[List[int], List[List[int]]]
 
 
-def _clone(grid):
-    return [row[:] for row in grid]
-
-
-def _transpose(grid):
-    return [list(col) for col in zip(*grid)]
-
-
 def _nonzero_positions_col_major(mask):
     h = len(mask)
     w = len(mask[0]) if h else 0
@@ -3,15 +3,13 @@
 from collections import Counter
 from typing import Dict, List, Tuple, Optional
 
+from compdsl.helpers import copy_grid as _copy
+
 Grid = List[List[int]]
 Color = int
 ColourStats = Dict[int, Tuple[int, int]]
 
 
-def _copy(grid):
-    return [row[:] for row in grid]
-
-
 def _analyze_color_stats(grid):
     h = len(grid)
     w = len(grid[0])
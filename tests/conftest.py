@@ -0,0 +1,21 @@
+import random
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def random_grid(rng: random.Random, max_side: int = 12, colors: int = 4) -> List[List[int]]:
+    h, w = rng.randint(1, max_side), rng.randint(1, max_side)
+    palette = rng.sample(range(10), colors)
+    return [[rng.choice(palette) for _ in range(w)] for _ in range(h)]
+
+
+@pytest.fixture
+def rng() -> random.Random:
+    return random.Random(0)
@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from conftest import REPO_ROOT
+
+BUNDLES = sorted(p.parent for p in (REPO_ROOT / "tasks").glob("*/solution.py"))
+
+
+@pytest.mark.parametrize("bundle", BUNDLES, ids=[b.name for b in BUNDLES])
+def test_solution_imports_with_repo_root_on_path(bundle):
+    # CONTRIBUTING.md: cd tasks/<task_id> && PYTHONPATH=../.. python -c "import solution"
+    env = dict(os.environ, PYTHONPATH=os.path.relpath(REPO_ROOT, bundle))
+    proc = subprocess.run(
+        [sys.executable, "-c", "import solution"], cwd=bundle, env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
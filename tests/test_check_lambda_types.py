@@ -0,0 +1,44 @@
+import importlib.util
+from pathlib import Path
+
+from conftest import REPO_ROOT
+
+_spec = importlib.util.spec_from_file_location("check_lambda_types", REPO_ROOT / "dsl" / "check_lambda_types.py")
+check_lambda_types = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_lambda_types)
+
+STUBS = [Path("/tmp/t/c_stub.py"), Path("/tmp/t/a_stub.py"), Path("/tmp/t/b_stub.py")]
+
+
+def test_merge_orders_by_file_and_recounts():
+    shard0 = (
+        "/tmp/t/b_stub.py:3: error: Incompatible return value type  [return-value]\n"
+        "/tmp/t/b_stub.py:3: note: Revealed type is \"builtins.int\"\n"
+        "Found 1 error in 1 file (checked 1 source file)\n"
+    )
+    shard1 = (
+        "/tmp/t/c_stub.py:1: note: By default the bodies of untyped functions are not checked\n"
+        "/tmp/t/a_stub.py:10: error: Name \"x\" is not defined  [name-defined]\n"
+        "mypy: can't read file 'missing.py': No such file or directory\n"
+        "\n"
+        "/tmp/t/a_stub.py:12: error: Missing return statement  [return]\n"
+        "Found 2 errors in 1 file (checked 2 source files)\n"
+    )
+    merged = check_lambda_types._merge_mypy_outputs(STUBS, [shard0, shard1]).splitlines()
+    assert merged == [
+        "/tmp/t/a_stub.py:10: error: Name \"x\" is not defined  [name-defined]",
+        "/tmp/t/a_stub.py:12: error: Missing return statement  [return]",
+        "/tmp/t/b_stub.py:3: error: Incompatible return value type  [return-value]",
+        "/tmp/t/b_stub.py:3: note: Revealed type is \"builtins.int\"",
+        "/tmp/t/c_stub.py:1: note: By default the bodies of untyped functions are not checked",
+        "mypy: can't read file 'missing.py': No such file or directory",
+        "Found 3 errors in 2 files (checked 3 source files)",
+    ]
+
+
+def test_merge_summaries_for_one_or_no_errors():
+    one = "/tmp/t/a_stub.py:1: error: Oops  [misc]\nFound 1 error in 1 file (checked 2 source files)\n"
+    clean = "Success: no issues found in 1 source file\n"
+    merge = check_lambda_types._merge_mypy_outputs
+    assert merge(STUBS, [one, clean]).splitlines()[-1] == "Found 1 error in 1 file (checked 3 source files)"
+    assert merge(STUBS, [clean, clean]) == "Success: no issues found in 3 source files\n"
@@ -0,0 +1,28 @@
+import pytest
+from conftest import random_grid
+
+from compdsl.components import Component, extract_components
+
+
+def test_components_partition_the_grid(rng):
+    for _ in range(30):
+        grid = random_grid(rng, colors=3)
+        components = extract_components(grid, ignore=(grid[0][0],))
+        seen = [cell for comp in components for cell in comp]
+        assert len(seen) == len(set(seen))
+        expected = {(r, c) for r, row in enumerate(grid) for c, v in enumerate(row) if v != grid[0][0]}
+        assert set(seen) == expected
+        for comp in components:
+            assert all(grid[r][c] == comp.color for r, c in comp)
+            rows = [r for r, _ in comp]
+            cols = [c for _, c in comp]
+            assert comp.bbox == (min(rows), max(rows), min(cols), max(cols))
+
+
+def test_replace_shares_cells_and_rejects_unknown_fields():
+    comp = Component.from_cells(3, [(0, 0), (0, 1), (1, 1)], stride=4)
+    moved = comp.replace(slot=(1, 2))
+    assert moved.slot == (1, 2) and moved.flat is comp.flat and moved.color == 3
+    assert moved.replace(color=5).color == 5
+    with pytest.raises(TypeError):
+        comp.replace(colour=5)
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from harness import crossover
+
+pytest.importorskip("numpy")
+
+
+def _fake_run(sizes, primitives, min_time):
+    return {name: {"crossover_side": sizes[-1], "min_cells": sizes[-1] ** 2, "timings": {}} for name in primitives}
+
+
+def test_partial_run_keeps_other_thresholds(tmp_path, monkeypatch):
+    monkeypatch.setattr(crossover, "run", _fake_run)
+    table = tmp_path / "dispatch.json"
+    assert crossover.main(["--sizes", "3", "8", "--output", str(table)]) == 0
+    assert crossover.main(["--primitives", "crop", "--output", str(table)]) == 0
+    entries = json.loads(table.read_text())["primitives"]
+    assert list(entries) == list(crossover.CASES)
+    assert all(entry["min_cells"] == 64 for entry in entries.values())
+
+    with pytest.raises(SystemExit):
+        crossover.main(["--primitives", "crop", "--sizes", "3", "16", "--output", str(table)])
+    assert crossover.main(["--sizes", "3", "16", "--output", str(table)]) == 0
+    assert json.loads(table.read_text())["sizes"] == [3, 16]
+
+
+def test_every_primitive_has_a_case():
+    from compdsl.primitives import PythonBackend
+
+    names = {name for name in vars(PythonBackend) if not name.startswith("_")} - {"name", "from_lists", "to_lists"}
+    assert names == set(crossover.CASES)
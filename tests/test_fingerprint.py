@@ -0,0 +1,50 @@
+from check_consistency import IDENTITY_FINGERPRINTS, function_fingerprint, module_definitions, solver_fingerprint
+
+
+def _fingerprint(source, name="f"):
+    functions, constants = module_definitions(source)
+    return function_fingerprint(name, functions, constants)
+
+
+def test_spelling_does_not_matter():
+    a = '''
+def f(grid: list) -> list:
+    """Copy."""
+    out = [row[:] for row in grid]
+    return out
+'''
+    b = '''
+def f(g):
+    result = [r[:] for r in g]
+    return result
+'''
+    assert _fingerprint(a) == _fingerprint(b)
+
+
+def test_constants_are_part_of_the_fingerprint():
+    template = '''
+LIMIT = {value}
+
+def f(grid):
+    return [[min(v, LIMIT) for v in row] for row in grid]
+'''
+    assert _fingerprint(template.format(value=3)) == _fingerprint(template.format(value=3))
+    assert _fingerprint(template.format(value=3)) != _fingerprint(template.format(value=4))
+
+
+def test_locals_shadow_constants():
+    a = "LIMIT = 3\n\ndef f(LIMIT):\n    return LIMIT\n"
+    b = "LIMIT = 4\n\ndef f(LIMIT):\n    return LIMIT\n"
+    assert _fingerprint(a) == _fingerprint(b)
+
+
+def test_wrapped_identity_solvers_are_recognised():
+    source = '''
+def cloneGrid(grid):
+    return [list(row) for row in grid]
+
+def solve_x(grid):
+    return cloneGrid(grid)
+'''
+    assert solver_fingerprint(source, "x") in IDENTITY_FINGERPRINTS
+    assert solver_fingerprint("def solve_x(grid):\n    return grid[::-1]\n", "x") not in IDENTITY_FINGERPRINTS
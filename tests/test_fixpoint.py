@@ -0,0 +1,66 @@
+import pytest
+
+from compdsl.fixpoint import FixpointBoundExceeded, Phase, fixpoint, line_fixpoint
+
+
+def _spread(grid):
+    """Row pass spreads 1s rightwards over 0s, column pass spreads them upwards."""
+
+    def row_step(r):
+        changed = []
+        for c in range(1, len(grid[r])):
+            if grid[r][c] == 0 and grid[r][c - 1] == 1:
+                grid[r][c] = 1
+                changed.append((r, c))
+        return changed
+
+    def col_step(c):
+        changed = []
+        for r in range(len(grid) - 2, -1, -1):
+            if grid[r][c] == 0 and grid[r + 1][c] == 1:
+                grid[r][c] = 1
+                changed.append((r, c))
+        return changed
+
+    return row_step, col_step
+
+
+def _rescan(grid):
+    row_step, col_step = _spread(grid)
+    rounds = 0
+    while True:
+        rounds += 1
+        changed = [cell for r in range(len(grid)) for cell in row_step(r)]
+        changed += [cell for c in range(len(grid[0])) for cell in col_step(c)]
+        if not changed:
+            return rounds
+
+
+def test_line_fixpoint_matches_full_rescan(rng):
+    for _ in range(50):
+        h, w = rng.randint(1, 12), rng.randint(1, 12)
+        grid = [[rng.choice((0, 0, 0, 1, 2)) for _ in range(w)] for _ in range(h)]
+        expected = [row[:] for row in grid]
+        rescans = _rescan(expected)
+        rounds = line_fixpoint(len(grid), len(grid[0]), *_spread(grid))
+        assert grid == expected
+        assert rounds <= rescans
+
+
+def test_bound_is_enforced():
+    grid = [[0, 0]]
+
+    def toggle(r):
+        grid[r][0] ^= 1
+        return [(r, 0)]
+
+    with pytest.raises(FixpointBoundExceeded):
+        line_fixpoint(1, 2, row_step=toggle, max_rounds=5)
+    assert line_fixpoint(1, 2, row_step=lambda r: [], max_rounds=1) == 1
+
+
+def test_initial_units_and_dependents():
+    seen = []
+    phase = Phase(range(4), lambda unit: seen.append(unit) or ([unit + 1] if unit < 3 else []))
+    rounds = fixpoint([phase], lambda key: [(0, key)], max_rounds=10, initial=[[1]])
+    assert seen == [1, 2, 3] and rounds == 1
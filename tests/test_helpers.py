@@ -0,0 +1,28 @@
+from conftest import random_grid
+
+from compdsl.helpers import fold_repaint, fold_repaint_copy
+from harness.duplicates import _outcome
+
+
+def _paint(grid, item):
+    r, c, color = item
+    grid[r][c] = color
+    return grid
+
+
+def test_fold_repaint_copy_leaves_the_canvas_alone(rng):
+    for _ in range(20):
+        grid = random_grid(rng)
+        items = [(rng.randrange(len(grid)), rng.randrange(len(grid[0])), 9) for _ in range(5)]
+        before = [row[:] for row in grid]
+        copied = fold_repaint_copy(grid, items, _paint)
+        assert grid == before
+        assert fold_repaint(grid, items, _paint) is grid
+        assert grid == copied
+
+
+def test_outcome_tells_in_place_and_copying_folds_apart():
+    args = ([[0, 0]], [(0, 1, 5)], _paint)
+    assert _outcome(fold_repaint, args)[1] == _outcome(fold_repaint_copy, args)[1]
+    assert _outcome(fold_repaint, args) != _outcome(fold_repaint_copy, args)
+    assert args[0] == [[0, 0]]
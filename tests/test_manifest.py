@@ -0,0 +1,51 @@
+import json
+import shutil
+
+from check_consistency import MANIFEST_VERSION, Manifest, gather_task_info
+from conftest import REPO_ROOT
+
+BUNDLES = ("1ae2feb7", "21897d95", "7b5033c1")  # 21897d95 is an identity baseline
+
+
+def _tasks(tmp_path):
+    root = tmp_path / "tasks"
+    for task_id in BUNDLES:
+        shutil.copytree(REPO_ROOT / "tasks" / task_id, root / task_id)
+    return root
+
+
+def _run(root, path):
+    manifest = Manifest(path)
+    infos = gather_task_info(root, manifest)
+    manifest.save()
+    return manifest.rechecked, infos
+
+
+def test_only_changed_bundles_are_rechecked(tmp_path):
+    root, path = _tasks(tmp_path), tmp_path / "manifest.json"
+    rechecked, full = _run(root, path)
+    assert rechecked == list(BUNDLES)
+    assert full["21897d95"].is_identity and not full["1ae2feb7"].is_identity
+
+    rechecked, cached = _run(root, path)
+    assert rechecked == [] and cached == full
+
+    solver = root / "7b5033c1" / "solution.py"
+    solver.write_text(solver.read_text())  # new mtime, same content
+    assert _run(root, path)[0] == []
+    solver.write_text(solver.read_text() + "\n# edited\n")
+    rechecked, infos = _run(root, path)
+    assert rechecked == ["7b5033c1"] and infos == full
+
+
+def test_version_mismatch_or_corrupt_manifest_rebuilds(tmp_path):
+    root, path = _tasks(tmp_path), tmp_path / "manifest.json"
+    _run(root, path)
+    data = json.loads(path.read_text())
+    path.write_text(json.dumps(dict(data, version=MANIFEST_VERSION - 1)))
+    assert _run(root, path)[0] == list(BUNDLES)
+    assert json.loads(path.read_text())["version"] == MANIFEST_VERSION
+
+    path.write_text("{not json")
+    assert _run(root, path)[0] == list(BUNDLES)
+    assert _run(root, path)[0] == []
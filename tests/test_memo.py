@@ -0,0 +1,92 @@
+from conftest import random_grid
+
+from compdsl.memo import clear_all, memo_stats, memoize_grid_op
+
+
+def test_cached_results_match_uncached(rng):
+    def flip(grid, axis):
+        return [row[::-1] for row in grid] if axis else grid[::-1]
+
+    cached = memoize_grid_op(flip)
+    grids = [random_grid(rng) for _ in range(8)]
+    for _ in range(200):
+        grid = [row[:] for row in rng.choice(grids)]
+        axis = rng.randint(0, 1)
+        assert cached(grid, axis) == flip(grid, axis)
+    info = cached.cache_info()
+    assert info.hits > 0 and info.misses <= 16
+
+
+def test_results_are_copied_on_the_way_out():
+    @memoize_grid_op
+    def rows(grid):
+        return [list(row) for row in grid]
+
+    first = rows([[1, 2], [3, 4]])
+    first[0][0] = 9
+    assert rows([[1, 2], [3, 4]]) == [[1, 2], [3, 4]]
+
+
+def test_equal_scalars_of_different_types_are_distinct_keys():
+    @memoize_grid_op
+    def describe(value):
+        return repr(value)
+
+    assert [describe(True), describe(1), describe(1.0), describe((1,)), describe((True,))] == [
+        "True", "1", "1.0", "(1,)", "(True,)",
+    ]
+    assert describe.cache_info().misses == 5
+
+
+def test_unhashable_arguments_bypass_the_cache():
+    @memoize_grid_op
+    def size(value):
+        return len(value)
+
+    assert size([[[1, 2]], [[3]]]) == 2  # a list of grids looks like a grid with list cells
+    assert size([[1], 2]) == 2  # ragged
+    assert size({0: 1}) == 1
+    info = size.cache_info()
+    assert (info.uncacheable, info.entries) == (3, 0)
+
+
+def test_identity_fingerprint_and_bounds():
+    calls = []
+
+    @memoize_grid_op(fingerprint="identity", max_entries=2)
+    def height(grid):
+        calls.append(1)
+        return len(grid)
+
+    grid = [[0], [0]]
+    assert height(grid) == height(grid) == 2
+    assert height([[0], [0]]) == 2  # equal content, different object
+    assert len(calls) == 2
+    height([[1]])
+    assert height.cache_info().entries == 2
+
+
+def test_clear_all_resets_every_memo():
+    @memoize_grid_op
+    def width(grid):
+        return len(grid[0])
+
+    width([[1, 2]])
+    width([[1, 2]])
+    clear_all()
+    stats = memo_stats()[f"{__name__}.{width.__qualname__}"]
+    assert (stats.hits, stats.misses, stats.entries) == (0, 0, 0)
+
+
+def test_800d221b_counts_colours_once_per_solve(rng):
+    from harness.registry import load_module
+
+    module = load_module("800d221b")
+    counts = module._colour_counts
+    counts.cache_clear()
+    for _ in range(5):
+        grid = random_grid(rng, max_side=20, colors=3)
+        _, _, components = module.extractTargetComponents(grid)
+        module.identifyFringeColours(grid, components)
+    info = counts.cache_info()
+    assert (info.misses, info.hits) == (5, 15)
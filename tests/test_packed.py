@@ -0,0 +1,47 @@
+import pytest
+from conftest import random_grid
+
+from harness.packed import PackedDataset, pack
+from harness.registry import iter_examples
+
+
+def _task(rng, with_test_output=False):
+    def example(output=True):
+        ex = {"input": random_grid(rng, max_side=30, colors=10)}
+        if output:
+            ex["output"] = random_grid(rng, max_side=30, colors=10)
+        return ex
+
+    return {
+        "train": [example() for _ in range(rng.randint(1, 4))],
+        "test": [example(with_test_output)],
+        "arc-gen": [example() for _ in range(rng.randint(0, 3))],
+    }
+
+
+def test_round_trip(rng, tmp_path):
+    tasks = {f"task{idx}": _task(rng, with_test_output=idx % 2 == 0) for idx in range(5)}
+    path = tmp_path / "tasks.pack"
+    count = pack(tasks.items(), path)
+    assert count == sum(len(examples) for task in tasks.values() for examples in task.values())
+    with PackedDataset(path) as dataset:
+        assert dataset.task_ids() == list(tasks)
+        for task_id, task in tasks.items():
+            packed = dataset.load_task(task_id)
+            for (split, idx, example), (p_split, p_idx, p_example) in zip(
+                iter_examples(task), iter_examples(packed)
+            ):
+                assert (split, idx) == (p_split, p_idx)
+                assert dict(p_example) == example
+        assert "missing" not in dataset
+        with pytest.raises(FileNotFoundError):
+            dataset.load_task("missing")
+
+
+def test_rejects_ragged_grids_and_foreign_files(tmp_path):
+    with pytest.raises(ValueError):
+        pack([("t", {"train": [{"input": [[1, 2], [3]]}]})], tmp_path / "ragged.pack")
+    foreign = tmp_path / "foreign.pack"
+    foreign.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        PackedDataset(foreign)
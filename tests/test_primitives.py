@@ -0,0 +1,74 @@
+import pytest
+from conftest import random_grid
+
+from compdsl import primitives
+from compdsl.primitives import AutoBackend, PythonBackend, using_backend
+
+np = pytest.importorskip("numpy")
+
+PRIMITIVES = (
+    "color_histogram", "most_common_color", "first_positions", "mask_of", "mask_other", "bbox", "crop",
+    "flip_h", "flip_v", "transpose", "rotate", "paint_mask", "tile", "upscale", "label_components",
+    "match_template",
+)
+
+
+def _plain(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    return value
+
+
+def _calls(grid, rng):
+    h, w = len(grid), len(grid[0])
+    color = rng.choice(grid[rng.randrange(h)])
+    mask = [[v == color for v in row] for row in grid]
+    top, left = rng.randrange(h), rng.randrange(w)
+    bottom, right = rng.randrange(top, h), rng.randrange(left, w)
+    template = [row[left : right + 1] for row in grid[top : bottom + 1]]
+    return {
+        "color_histogram": (grid,),
+        "most_common_color": (grid,),
+        "first_positions": (grid,),
+        "mask_of": (grid, color),
+        "mask_other": (grid, color),
+        "bbox": ([[False] * w for _ in range(h)] if rng.random() < 0.2 else mask,),
+        "crop": (grid, (top, bottom, left, right)),
+        "flip_h": (grid,),
+        "flip_v": (grid,),
+        "transpose": (grid,),
+        "rotate": (grid, rng.randint(-1, 4)),
+        "paint_mask": (grid, mask, 9),
+        "tile": (grid, rng.randint(1, 3), rng.randint(1, 3)),
+        "upscale": (grid, rng.randint(1, 3)),
+        "label_components": (grid, color),
+        "match_template": (grid, template),
+    }
+
+
+def test_backends_agree(rng):
+    python = PythonBackend()
+    numpy = primitives.NumpyBackend()
+    forced = AutoBackend({name: 1 for name in PRIMITIVES})  # NumPy on every call
+    for _ in range(40):
+        grid = random_grid(rng, max_side=10, colors=3)
+        for name, args in _calls(grid, rng).items():
+            expected = getattr(python, name)(*args)
+            arrays = [np.asarray(a) if isinstance(a, list) else a for a in args]
+            assert _plain(getattr(numpy, name)(*arrays)) == expected, name
+            assert getattr(forced, name)(*args) == expected, name
+            assert getattr(AutoBackend(), name)(*args) == expected, name
+
+
+def test_module_functions_follow_the_active_backend(rng):
+    for _ in range(20):
+        grid = random_grid(rng, colors=2)
+        background = primitives.most_common_color(grid)
+        expected = primitives.crop_to_content(grid, background)
+        for name in ("numpy", "auto"):
+            with using_backend(name) as impl:
+                converted = impl.from_lists(grid)
+                assert primitives.most_common_color(converted) == background
+                assert impl.to_lists(primitives.crop_to_content(converted, background)) == expected
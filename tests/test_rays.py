@@ -0,0 +1,45 @@
+from conftest import random_grid
+
+from compdsl.rays import DIRECTIONS_8, RayTables
+
+
+def _walk(grid, r, c, dr, dc):
+    h, w = len(grid), len(grid[0])
+    cells = []
+    nr, nc = r + dr, c + dc
+    while 0 <= nr < h and 0 <= nc < w and grid[nr][nc] == grid[r + dr][c + dc]:
+        cells.append((nr, nc))
+        nr, nc = nr + dr, nc + dc
+    return cells, ((nr, nc) if 0 <= nr < h and 0 <= nc < w else None)
+
+
+def test_tables_match_cell_walks(rng):
+    for _ in range(30):
+        grid = random_grid(rng, colors=2)
+        tables = RayTables(grid)
+        h, w = len(grid), len(grid[0])
+        for r in range(h):
+            for c in range(w):
+                for dr, dc in DIRECTIONS_8:
+                    length = 0
+                    while tables.in_bounds(r + length * dr, c + length * dc) and grid[r + length * dr][c + length * dc] == grid[r][c]:
+                        length += 1
+                    assert tables.run_length(r, c, (dr, dc)) == length
+                    if not tables.in_bounds(r + dr, c + dc):
+                        assert tables.ray((r, c), (dr, dc)) == [] and tables.ray_end((r, c), (dr, dc)) is None
+                        continue
+                    cells, end = _walk(grid, r, c, dr, dc)
+                    assert tables.ray((r, c), (dr, dc)) == cells
+                    assert tables.ray_end((r, c), (dr, dc)) == end
+                    background = grid[r + dr][c + dc]
+                    assert tables.next_obstacle((r, c), (dr, dc), background) == end
+
+
+def test_ray_through():
+    grid = [
+        [0, 0, 5, 0],
+        [0, 3, 0, 0],
+    ]
+    tables = RayTables(grid)
+    assert tables.ray((0, 0), (0, 1), through=0) == [(0, 1)]
+    assert tables.ray((0, 0), (0, 1), through=5) == []
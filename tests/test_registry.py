@@ -0,0 +1,16 @@
+from harness import registry
+
+
+def test_reload_discards_prepared_state(monkeypatch):
+    task_id = "abc82100"  # defines prepare_/apply_ hooks
+    registry.batch_solver(task_id)
+    assert task_id in registry._PREPARED
+
+    module = registry.load_module(task_id, reload=True)
+    assert task_id not in registry._PREPARED
+    calls = []
+    prepare = getattr(module, f"prepare_{task_id}")
+    monkeypatch.setattr(module, f"prepare_{task_id}", lambda: calls.append(1) or prepare())
+    registry.batch_solver(task_id)
+    registry.batch_solver(task_id)
+    assert calls == [1]
@@ -0,0 +1,14 @@
+from harness import report
+
+
+def test_unisolated_errors_are_recorded_not_raised(monkeypatch):
+    def measure(task_id, *args):
+        if task_id == "gone":
+            raise FileNotFoundError(task_id)
+        raise RuntimeError("solver crashed")
+
+    monkeypatch.setattr(report, "_measure", measure)
+    result = report.build_report(["broken", "gone"], isolate=False)
+    assert result["missing"] == ["gone"]
+    assert result["failed"] == {"broken": "error: RuntimeError('solver crashed')"}
+    assert result["tasks"] == {}
@@ -0,0 +1,101 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from harness import registry, result_cache
+from harness.result_cache import ResultCache
+
+TASK = "7b5033c1"  # declares BACKENDS = ("python", "numpy")
+GRID = [[1, 2], [2, 2]]
+
+
+def test_backends_do_not_share_entries(tmp_path, monkeypatch):
+    db = tmp_path / "results.sqlite"
+    table = tmp_path / "dispatch.json"
+    table.write_text('{"primitives": {}}')
+    monkeypatch.setenv("COMPDSL_DISPATCH", str(table))
+    with ResultCache(db) as cache:
+        cache.put(TASK, GRID, [[0]])
+    with ResultCache(db, backend="numpy") as cache:
+        assert cache.get(TASK, GRID) is None
+        cache.put(TASK, GRID, [[1]])
+    with ResultCache(db, backend="auto") as cache:
+        assert cache.get(TASK, GRID) is None
+        cache.put(TASK, GRID, [[2]])
+        assert cache.get(TASK, GRID) == [[2]]
+
+    table.write_text('{"primitives": {"color_histogram": {"min_cells": 64}}}')
+    with ResultCache(db, backend="auto") as cache:
+        assert cache.get(TASK, GRID) is None
+        assert cache.size()[0] == 2  # the entry from the old table is gone
+    with ResultCache(db) as cache:
+        assert cache.get(TASK, GRID) == [[0]]
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A throwaway repo with one solver importing one compdsl module, and a steady clock."""
+    (tmp_path / "tasks" / "demo").mkdir(parents=True)
+    (tmp_path / "compdsl").mkdir()
+    (tmp_path / "compdsl" / "__init__.py").write_text("")
+    (tmp_path / "compdsl" / "fake.py").write_text("OFFSET = 1\n")
+    (tmp_path / "tasks" / "demo" / "solution.py").write_text(
+        "from compdsl.fake import OFFSET\n\n\ndef solve_demo(grid):\n    return grid\n"
+    )
+    monkeypatch.setattr(registry, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(registry, "TASKS_DIR", tmp_path / "tasks")
+    clock = itertools.count()
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=lambda: float(next(clock))))
+    return tmp_path
+
+
+def _grid(i):
+    return [[i]]
+
+
+def test_lru_eviction_by_entries(repo):
+    with ResultCache(repo / "db.sqlite", max_entries=3) as cache:
+        for i in range(3):
+            cache.put("demo", _grid(i), _grid(i))
+        assert cache.get("demo", _grid(0)) == _grid(0)  # now most recently used
+        cache.put("demo", _grid(3), _grid(3))
+        assert cache.get("demo", _grid(1)) is None
+        assert [cache.get("demo", _grid(i)) is not None for i in (0, 2, 3)] == [True, True, True]
+        assert cache.stats.evictions == 1 and cache.size()[0] == 3
+
+
+def test_lru_eviction_by_bytes(repo):
+    row = list(range(10))
+    payload = len("[[0,1,2,3,4,5,6,7,8,9]]")
+    with ResultCache(repo / "db.sqlite", max_bytes=2 * payload) as cache:
+        for i in range(4):
+            cache.put("demo", _grid(i), [row])
+        assert cache.size() == (2, 2 * payload)
+        assert cache.stats.evictions == 2
+        assert cache.get("demo", _grid(0)) is None and cache.get("demo", _grid(3)) == [row]
+
+
+@pytest.mark.parametrize("edited", ["tasks/demo/solution.py", "compdsl/fake.py"])
+def test_editing_a_source_purges_its_entries(repo, edited):
+    with ResultCache(repo / "db.sqlite") as cache:
+        cache.put("demo", _grid(0), _grid(0))
+        cache.put("demo", _grid(1), _grid(1))
+        assert cache.get("demo", _grid(0)) == _grid(0)
+        path = repo / edited
+        path.write_text(path.read_text() + "# edited\n")
+        assert cache.get("demo", _grid(0)) is None
+        assert cache.stats.invalidations == 2 and cache.size()[0] == 0
+
+
+def test_stats_and_lifetime_totals(repo):
+    db = repo / "db.sqlite"
+    with ResultCache(db) as cache:
+        assert cache.solve("demo", _grid(5), lambda g: [[7]]) == [[7]]
+        assert cache.solve("demo", _grid(5), lambda g: [[8]]) == [[7]]
+        cache.get("demo", _grid(6))
+        assert cache.stats.as_dict() == {"hits": 1, "misses": 2, "evictions": 0, "invalidations": 0}
+        assert cache.stats.hit_rate == pytest.approx(1 / 3)
+    with ResultCache(db) as cache:
+        cache.get("demo", _grid(5))
+        assert cache.totals() == {"hits": 2, "misses": 2, "evictions": 0, "invalidations": 0}
@@ -0,0 +1,64 @@
+import pytest
+from conftest import random_grid
+
+from compdsl.rle import RLEGrid, Run, decode_line, encode_line, merge_runs, paint_run, run_at, spans, split_runs
+
+
+def _line(rng):
+    return [rng.choice((0, 0, 1, 2)) for _ in range(rng.randint(0, 20))]
+
+
+def test_encode_decode_round_trip(rng):
+    for _ in range(200):
+        line = _line(rng)
+        runs = encode_line(line)
+        assert decode_line(runs) == line
+        assert all(a.color != b.color and a.stop == b.start for a, b in zip(runs, runs[1:]))
+
+
+def test_grid_rows_and_columns(rng):
+    for _ in range(50):
+        grid = random_grid(rng)
+        encoded = RLEGrid(grid)
+        assert encoded.decode() == grid
+        assert [decode_line(runs) for runs in encoded.cols] == [list(col) for col in zip(*grid)]
+        assert encoded.runs("row", 0) == encoded.row(0)
+        assert encoded.runs("col", 0) == encoded.col(0)
+
+
+def test_run_operations_match_cell_edits(rng):
+    for _ in range(200):
+        line = _line(rng)
+        runs = encode_line(line)
+        start, stop = sorted(rng.randint(-2, len(line) + 2) for _ in range(2))
+        painted = list(line)
+        for idx in range(max(start, 0), min(stop, len(line))):
+            painted[idx] = 3
+        assert paint_run(runs, start, stop, 3) == encode_line(painted)
+
+        pos = rng.randint(0, len(line))
+        left, right = split_runs(runs, pos)
+        assert decode_line(left) == line[:pos] and decode_line(right) == line[pos:]
+        assert merge_runs(left + right) == runs
+
+        for idx in range(-1, len(line) + 1):
+            hit = run_at(runs, idx)
+            if 0 <= idx < len(line):
+                assert hit is not None and hit.start <= idx < hit.stop and hit.color == line[idx]
+            else:
+                assert hit is None
+
+        expected = []
+        for idx, value in enumerate(line):
+            if value != 0:
+                if expected and expected[-1][1] == idx:
+                    expected[-1] = (expected[-1][0], idx + 1)
+                else:
+                    expected.append((idx, idx + 1))
+        assert spans(runs, 0) == expected
+
+
+@pytest.mark.parametrize("runs", [[Run(1, 0, 2), Run(1, 2, 3)], [Run(1, 0, 0), Run(2, 0, 1)]])
+def test_merge_runs_coalesces_and_drops_empty(runs):
+    assert decode_line(merge_runs(runs)) == decode_line(runs)
+    assert len(merge_runs(runs)) == 1
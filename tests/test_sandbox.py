@@ -0,0 +1,55 @@
+import os
+import random
+import signal
+import threading
+import time
+
+import pytest
+
+from harness.sandbox import SandboxPool
+
+SLOW_TASK = "35ab12c3"  # takes well over 5s on the grid below
+
+
+def _slow_grid():
+    rng = random.Random(0)
+    return [[rng.choice([0, 0, 0, 1, 2, 3]) for _ in range(60)] for _ in range(60)]
+
+
+def test_wall_clock_timeout_recycles_the_worker():
+    with SandboxPool(cpu_seconds=None, wall_seconds=1.0) as pool:
+        result = pool.run(SLOW_TASK, _slow_grid())
+        assert result.status == "timeout" and "wall clock" in result.error
+        assert pool.recycled == 1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGXCPU"), reason="needs POSIX CPU limits")
+def test_cpu_limit_reports_timeout():
+    with SandboxPool(cpu_seconds=1.0, wall_seconds=30.0) as pool:
+        result = pool.run(SLOW_TASK, _slow_grid())
+        assert (result.status, result.error) == ("timeout", "exceeded CPU time limit")
+
+
+def test_exceptions_keep_the_worker_until_it_is_recycled():
+    with SandboxPool(max_tasks_per_worker=2) as pool:
+        results = [pool.run("no-such-task", [[0]]) for _ in range(5)]
+        assert {r.status for r in results} == {"error"}
+        assert "FileNotFoundError" in results[0].error
+        assert pool.recycled == 2  # after the 2nd and the 4th solve
+
+
+def test_unexplained_sigkill_is_reported_as_killed():
+    with SandboxPool(cpu_seconds=None, wall_seconds=30.0) as pool:
+        worker = pool._all[0]
+        killer = threading.Timer(1.0, os.kill, (worker.process.pid, signal.SIGKILL))
+        killer.start()
+        start = time.monotonic()
+        result = pool.run(SLOW_TASK, _slow_grid())
+        killer.join()
+        assert result.status == "killed" and time.monotonic() - start < 10
+        assert pool.recycled == 1
+
+
+def test_solver_output_round_trips():
+    with SandboxPool() as pool:
+        assert pool.solve("7b5033c1", [[1, 2], [2, 2]]) == [[1]]
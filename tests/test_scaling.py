@@ -0,0 +1,22 @@
+from conftest import random_grid
+
+from harness.scaling import pad, tile, upscale
+
+
+def test_variants_reach_or_bound_the_target_size(rng):
+    for _ in range(50):
+        grid = random_grid(rng)
+        h, w = len(grid), len(grid[0])
+        for size in (7, 30, 61):
+            tiled = tile(grid, size)
+            assert (len(tiled), len(tiled[0])) == (max(size, h), max(size, w))
+            assert all(tiled[r][c] == grid[r % h][c % w] for r in range(len(tiled)) for c in range(len(tiled[0])))
+
+            padded = pad(grid, size)
+            assert (len(padded), len(padded[0])) == (max(size, h), max(size, w))
+
+            scaled = upscale(grid, size)
+            k = len(scaled) // h
+            assert len(scaled[0]) == k * w and k >= 1
+            assert k == 1 or max(len(scaled), len(scaled[0])) <= size
+            assert all(scaled[r][c] == grid[r // k][c // k] for r in range(len(scaled)) for c in range(len(scaled[0])))
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+from conftest import random_grid
+
+from harness.stream import iter_arcgen, iter_json_array
+
+
+@pytest.fixture
+def examples(rng):
+    return [
+        {"input": random_grid(rng, max_side=8), "output": random_grid(rng, max_side=8)}
+        for _ in range(40)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_reads_every_element(tmp_path, examples, chunk_size):
+    path = tmp_path / "sidecar.json"
+    path.write_text(json.dumps({"name": "x", "train": examples}, indent=1))
+    assert list(iter_json_array(path, "train", chunk_size=chunk_size)) == examples
+    assert list(iter_arcgen(path)) == examples
+    assert list(iter_json_array(path, "missing")) == []
+
+
+def test_shards_partition_the_array(tmp_path, examples):
+    path = tmp_path / "bare.json"
+    path.write_text(json.dumps(examples))
+    parts = [list(iter_arcgen(path, shard=(idx, 3))) for idx in range(3)]
+    assert sorted(map(json.dumps, sum(parts, []))) == sorted(map(json.dumps, examples))
+    assert parts[1] == examples[1::3]
+    with pytest.raises(ValueError):
+        list(iter_arcgen(path, shard=(3, 3)))
+
+
+def test_byte_ranges_tile_the_file(tmp_path, examples):
+    path = tmp_path / "sidecar.json"
+    path.write_text(json.dumps({"train": examples}))
+    size = path.stat().st_size
+    bounds = [0, 1, size // 3, size // 2, size - 5, size]
+    seen = []
+    for start, end in zip(bounds, bounds[1:]):
+        seen.extend(iter_arcgen(path, byte_range=(start, end)))
+    assert seen == examples